@@ -0,0 +1,87 @@
+"""
+Memory per result and construction speed of the result representations.
+
+Run with the package installed: ``python benchmarks/bench_compact.py``
+"""
+
+import gc
+import tracemalloc
+
+import pydantic_core
+
+from google_cse.compact import CompactWebResult, ResultBatch
+from google_cse.results import GoogleSearchResponse, LazySearchResponse, WebSearchResult
+
+from harness import measure, report
+from payloads import web_response, encode
+
+NUM_PAGES = 2000
+
+
+def bodies() -> list:
+    return [encode(web_response(query=f"q{p}", start_index=1, pagemap="small")) for p in range(NUM_PAGES)]
+
+
+def build_models(pages: list) -> list:
+    results = []
+    for body in pages:
+        response = GoogleSearchResponse.from_json(body)
+        results.extend(WebSearchResult.from_result(item) for item in response.items)
+    return results
+
+
+def build_lazy_models(pages: list) -> list:
+    results = []
+    for body in pages:
+        results.extend(LazySearchResponse.from_json(body).web_results())
+    return results
+
+
+def build_tuples(pages: list) -> list:
+    results = []
+    for body in pages:
+        results.extend(CompactWebResult.from_item(item) for item in pydantic_core.from_json(body)["items"])
+    return results
+
+
+def build_batch(pages: list) -> ResultBatch:
+    batch = ResultBatch()
+    for body in pages:
+        batch.add_response(pydantic_core.from_json(body))
+    return batch
+
+
+def retained_bytes(build, pages: list) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build(pages)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main() -> None:
+    pages = bodies()
+    count = NUM_PAGES * 10
+    builders = {
+        "WebSearchResult (from_json)": build_models,
+        "WebSearchResult (lazy)": build_lazy_models,
+        "CompactWebResult": build_tuples,
+        "ResultBatch": build_batch,
+    }
+
+    print(f"\nRetained memory for {count} results")
+    for name, build in builders.items():
+        print(f"  {name:<28}  {retained_bytes(build, pages) / count:8.1f} bytes/result")
+
+    sample = pages[:50]
+    report(f"Construction time for {len(sample) * 10} results",
+           {name: measure(lambda build=build: build(sample), repeat=3) for name, build in builders.items()},
+           baseline="WebSearchResult (from_json)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Cold start: time to import the package and make a first search in a
+fresh interpreter, as a short-lived (e.g. serverless) process pays it.
+
+Each case runs in its own subprocess and times itself, so interpreter
+startup is excluded. Pass ``--max-ms`` to fail when the client import
+gets slower than a budget, e.g. in CI.
+
+Run with the package installed: ``python benchmarks/bench_import.py``
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, Optional
+
+from payloads import web_response, encode
+
+_TIMER = """
+import time
+_started = time.perf_counter()
+{code}
+print(time.perf_counter() - _started)
+"""
+
+_FIRST_SEARCH = """
+from google_cse import GoogleCSE
+from google_cse.transport import Transport, TransportResponse
+
+class _Body(Transport):
+    def get(self, url, params):
+        return TransportResponse(200, {{}}, {body!r}, url)
+
+GoogleCSE(api_key="k", search_engine_id="cx", transport=_Body()).web_search("python")
+"""
+
+
+def cases() -> Dict[str, str]:
+    """Named snippets, each timed from a fresh interpreter."""
+    body = encode(web_response(pagemap="large"))
+    return {
+        "import google_cse": "import google_cse",
+        "from google_cse import GoogleCSE": "from google_cse import GoogleCSE",
+        "from google_cse import AsyncGoogleCSE": "from google_cse import AsyncGoogleCSE",
+        "import + first web_search": _FIRST_SEARCH.format(body=body),
+    }
+
+
+def time_snippet(code: str, repeat: int) -> Dict[str, float]:
+    rounds = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(code=code)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        rounds.append(float(output.strip().splitlines()[-1]) * 1e3)
+    return {"best_ms": min(rounds), "median_ms": statistics.median(rounds)}
+
+
+def run(repeat: int = 10) -> Dict[str, Dict[str, float]]:
+    # One warm-up run so every case sees compiled bytecode, as deployments do.
+    time_snippet(cases()["import + first web_search"], 1)
+    return {name: time_snippet(code, repeat) for name, code in cases().items()}
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cold-start import benchmark")
+    parser.add_argument("--repeat", type=int, default=10, help="fresh interpreters per case")
+    parser.add_argument("--max-ms", type=float,
+                        help="fail if the median 'from google_cse import GoogleCSE' exceeds this")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print("\nCold start (fresh interpreter, startup excluded)")
+        for name, stats in results.items():
+            print(f"  {name:<40}  {stats['best_ms']:8.1f} ms best  {stats['median_ms']:8.1f} ms median")
+
+    if args.max_ms is not None:
+        median = results["from google_cse import GoogleCSE"]["median_ms"]
+        if median > args.max_ms:
+            print(f"\nImport took {median:.1f} ms, over the {args.max_ms:.1f} ms budget", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
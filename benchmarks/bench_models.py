@@ -0,0 +1,46 @@
+"""
+Model construction: ``GoogleSearchResponse.from_dict`` on decoded payloads
+and the ``from_result`` conversions ``web_search``/``image_search`` apply
+to every item.
+
+Run with the package installed: ``python benchmarks/bench_models.py``
+"""
+
+import json
+from typing import Callable, Dict
+
+from google_cse.results import GoogleSearchResponse, WebSearchResult, ImageSearchResult
+
+from harness import measure, report
+from payloads import web_response, image_response, encode
+
+
+def payloads() -> Dict[str, dict]:
+    """Decoded response dicts, as ``json.loads`` returns them."""
+    return {
+        "web, large pagemap": json.loads(encode(web_response(pagemap="large"))),
+        "web, small pagemap": json.loads(encode(web_response(pagemap="small"))),
+        "web, no pagemap": json.loads(encode(web_response(pagemap=None))),
+        "image": json.loads(encode(image_response())),
+    }
+
+
+def cases() -> Dict[str, Callable[[], object]]:
+    """Named micro-benchmarks; each call handles one 10-item page."""
+    benchmarks = {}
+    for label, data in payloads().items():
+        benchmarks[f"from_dict ({label})"] = lambda data=data: GoogleSearchResponse.from_dict(data)
+
+    web_items = GoogleSearchResponse.from_dict(json.loads(encode(web_response(pagemap="large")))).items
+    image_items = GoogleSearchResponse.from_dict(json.loads(encode(image_response()))).items
+    benchmarks["WebSearchResult.from_result x10"] = lambda: [WebSearchResult.from_result(item) for item in web_items]
+    benchmarks["ImageSearchResult.from_result x10"] = lambda: [ImageSearchResult.from_result(item) for item in image_items]
+    return benchmarks
+
+
+def main() -> None:
+    report("Model construction (per 10-item page)", {name: measure(fn) for name, fn in cases().items()})
+
+
+if __name__ == "__main__":
+    main()
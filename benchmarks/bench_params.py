@@ -0,0 +1,94 @@
+"""
+Request parameter building: the previous per-call field mapping against
+``_build_params`` with precompiled parameters.
+
+Run with the package installed: ``python benchmarks/bench_params.py``
+"""
+
+from google_cse import GoogleCSE, WebSearchParameters, ImageSearchParameters
+from google_cse.cache import make_cache_key
+
+from harness import measure, report
+
+
+def legacy_build_params(client: GoogleCSE, query: str, num_results: int, search_type, parameters, start_index=1):
+    """``_build_params`` as it was before parameters were compiled."""
+    params = {
+        "key": client.api_key,
+        "cx": client.search_engine_id,
+        "q": query,
+        "num": num_results,
+    }
+
+    start = start_index
+    if start == 1 and parameters is not None and parameters.start is not None:
+        start = parameters.start
+    if start != 1:
+        params["start"] = start
+
+    if search_type:
+        params["searchType"] = search_type
+
+    if parameters:
+        field_mapping = {
+            "c2coff": "c2coff",
+            "country": "cr",
+            "date_restrict": "dateRestrict",
+            "exact_terms": "exactTerms",
+            "exclude_terms": "excludeTerms",
+            "file_type": "fileType",
+            "filter": "filter",
+            "geolocation": "gl",
+            "high_range": "highRange",
+            "language": "hl",
+            "hq": "hq",
+            "link_site": "linkSite",
+            "low_range": "lowRange",
+            "language_restrict": "lr",
+            "or_terms": "orTerms",
+            "rights": "rights",
+            "safe": "safe",
+            "site_search": "siteSearch",
+            "site_search_filter": "siteSearchFilter",
+            "sort": "sort",
+            "img_color_type": "imgColorType",
+            "img_dominant_color": "imgDominantColor",
+            "img_size": "imgSize",
+            "img_type": "imgType",
+        }
+
+        for field_name, api_name in field_mapping.items():
+            value = getattr(parameters, field_name, None)
+            if value is not None:
+                params[api_name] = value
+
+    return params
+
+
+def main() -> None:
+    client = GoogleCSE(api_key="key", search_engine_id="cx")
+    cases = {
+        "web, defaults": (None, WebSearchParameters()),
+        "web, 4 fields": (None, WebSearchParameters(country="countryUS", language="en",
+                                                    date_restrict="m3", site_search="example.com")),
+        "image, 3 fields": ("image", ImageSearchParameters(img_size="large", img_type="photo", safe="active")),
+    }
+
+    for label, (search_type, parameters) in cases.items():
+        report(f"Build request parameters ({label})", {
+            "legacy": measure(lambda: legacy_build_params(client, "query", 10, search_type, parameters, 11)),
+            "compiled": measure(lambda: client._build_params("query", 10, search_type, parameters, 11)),
+        }, baseline="legacy")
+
+        report(f"Build parameters + cache key ({label})", {
+            "legacy": measure(lambda: make_cache_key(
+                legacy_build_params(client, "query", 10, search_type, parameters, 11))),
+            "compiled": measure(lambda: make_cache_key(
+                client._build_params("query", 10, search_type, parameters, 11))),
+        }, baseline="legacy")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
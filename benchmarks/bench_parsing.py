@@ -0,0 +1,73 @@
+"""
+Response parsing: the pre-existing json + model_validate path against
+single-pass ``from_json`` and the lazy view.
+
+Run with the package installed: ``python benchmarks/bench_parsing.py``
+"""
+
+import json
+
+from google_cse.results import GoogleSearchResponse, LazySearchResponse, WebSearchResult, ImageSearchResult
+
+from harness import measure, report
+from payloads import web_response, image_response, encode
+
+
+def parse_cases(body: bytes) -> dict:
+    return {
+        "json.loads + from_dict": lambda: GoogleSearchResponse.from_dict(json.loads(body)),
+        "from_json": lambda: GoogleSearchResponse.from_json(body),
+        "LazySearchResponse.from_json": lambda: LazySearchResponse.from_json(body),
+    }
+
+
+def web_search_cases(body: bytes) -> dict:
+    """Body to List[WebSearchResult], as web_search does it."""
+    def legacy():
+        response = GoogleSearchResponse.from_dict(json.loads(body))
+        return [WebSearchResult.from_result(item) for item in response.items]
+
+    def validated():
+        response = GoogleSearchResponse.from_json(body)
+        return [WebSearchResult.from_result(item) for item in response.items]
+
+    def lazy():
+        return LazySearchResponse.from_json(body).web_results()
+
+    return {"legacy": legacy, "from_json": validated, "lazy": lazy}
+
+
+def image_search_cases(body: bytes) -> dict:
+    def legacy():
+        response = GoogleSearchResponse.from_dict(json.loads(body))
+        return [ImageSearchResult.from_result(item) for item in response.items]
+
+    def lazy():
+        return LazySearchResponse.from_json(body).image_results()
+
+    return {"legacy": legacy, "lazy": lazy}
+
+
+def main() -> None:
+    bodies = {
+        "web, large pagemap": encode(web_response(pagemap="large")),
+        "web, small pagemap": encode(web_response(pagemap="small")),
+        "web, no pagemap": encode(web_response(pagemap=None)),
+    }
+    for label, body in bodies.items():
+        cases = parse_cases(body)
+        report(f"Parse full response ({label}, {len(body)} bytes)",
+               {name: measure(fn) for name, fn in cases.items()}, baseline="json.loads + from_dict")
+
+        cases = web_search_cases(body)
+        report(f"Body to web results ({label})",
+               {name: measure(fn) for name, fn in cases.items()}, baseline="legacy")
+
+    body = encode(image_response())
+    cases = image_search_cases(body)
+    report(f"Body to image results ({len(body)} bytes)",
+           {name: measure(fn) for name, fn in cases.items()}, baseline="legacy")
+
+
+if __name__ == "__main__":
+    main()
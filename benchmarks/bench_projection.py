@@ -0,0 +1,64 @@
+"""
+Projected parsing: a full response against one projected to a few fields
+and pagemap paths, both for the full body and for the smaller body the
+API sends when the projection is passed as ``fields``.
+
+Run with the package installed: ``python benchmarks/bench_projection.py``
+"""
+
+import sys
+from typing import Callable, Dict
+
+import pydantic_core
+
+from google_cse.projection import Projection
+from google_cse.results import GoogleSearchResponse
+from google_cse.testing import select_fields
+
+from harness import measure, report
+from payloads import web_response, encode
+
+PROJECTION = Projection(["title", "link"], pagemap=["metatags/og:image", "metatags/og:description", "cse_thumbnail/src"])
+
+
+def deep_size(value) -> int:
+    """Approximate resident size of decoded JSON, in bytes."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_size(k) + deep_size(v) for k, v in value.items())
+    elif isinstance(value, list):
+        size += sum(deep_size(v) for v in value)
+    return size
+
+
+def bodies() -> Dict[str, bytes]:
+    response = web_response(pagemap="large")
+    return {
+        "full body": encode(response),
+        "partial body": encode(select_fields(response, PROJECTION.api_fields)),
+    }
+
+
+def cases() -> Dict[str, Callable[[], object]]:
+    """Named micro-benchmarks; each call parses one 10-item page."""
+    benchmarks = {}
+    for label, body in bodies().items():
+        benchmarks[f"from_json ({label})"] = lambda body=body: GoogleSearchResponse.from_json(body)
+        benchmarks[f"Projection.parse ({label})"] = lambda body=body: PROJECTION.parse(body)
+        benchmarks[f"Projection.parse lazy ({label})"] = lambda body=body: PROJECTION.parse(body, lazy=True)
+    return benchmarks
+
+
+def main() -> None:
+    for label, body in bodies().items():
+        full = pydantic_core.from_json(body)
+        projected = PROJECTION.apply(pydantic_core.from_json(body))
+        print(f"{label}: {len(body)} bytes on the wire, "
+              f"{deep_size(full)} bytes decoded, {deep_size(projected)} bytes projected")
+
+    report("Projected parsing (per 10-item page)", {name: measure(fn) for name, fn in cases().items()},
+           baseline="from_json (full body)")
+
+
+if __name__ == "__main__":
+    main()
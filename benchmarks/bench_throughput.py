@@ -0,0 +1,64 @@
+"""
+End-to-end search throughput against a local ``FakeSearchServer``:
+sequential calls against ``search_many`` and concurrent pagination.
+
+Run with the package installed: ``python benchmarks/bench_throughput.py``
+"""
+
+import time
+from typing import Callable, Dict
+
+from google_cse import GoogleCSE, TransportConfig
+from google_cse.testing import FakeSearchServer, constant_latency
+
+LATENCY = 0.02
+NUM_QUERIES = 100
+
+
+def timed(fn: Callable[[], int]) -> Dict[str, float]:
+    """Run ``fn`` (which returns the number of requests it made) once."""
+    started = time.perf_counter()
+    requests = fn()
+    wall = time.perf_counter() - started
+    return {"wall_s": wall, "requests": requests, "requests_per_s": requests / wall}
+
+
+def run(latency: float = LATENCY, num_queries: int = NUM_QUERIES) -> Dict[str, Dict[str, float]]:
+    """Time each scenario against a fake endpoint with fixed per-request latency."""
+    queries = [f"query {i}" for i in range(num_queries)]
+    results = {}
+
+    with FakeSearchServer(latency=constant_latency(latency)) as server:
+        config = TransportConfig(pool_maxsize=32)
+        with GoogleCSE("bench-key", "bench-cx", base_url=server.url, transport_config=config) as client:
+            def sequential() -> int:
+                for query in queries:
+                    client.raw_search(query)
+                return len(queries)
+
+            def batch(workers: int) -> int:
+                return sum(1 for _ in client.search_many(queries, max_workers=workers))
+
+            def pages(workers: int) -> int:
+                return sum(1 for _ in client.iter_pages("paged query", max_results=100, max_workers=workers))
+
+            client.raw_search("warm up")
+            results["sequential raw_search"] = timed(sequential)
+            for workers in (8, 32):
+                results[f"search_many, {workers} workers"] = timed(lambda: batch(workers))
+            results["iter_pages, 1 worker"] = timed(lambda: pages(1))
+            results["iter_pages, 9 workers"] = timed(lambda: pages(9))
+
+    return results
+
+
+def main() -> None:
+    print(f"\nThroughput against a fake endpoint ({LATENCY * 1000:.0f} ms per request)")
+    results = run()
+    width = max(len(name) for name in results)
+    for name, stats in results.items():
+        print(f"  {name:<{width}}  {stats['requests_per_s']:8.1f} req/s  ({stats['requests']} in {stats['wall_s']:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Minimal timing helpers shared by the benchmark scripts."""
+
+import statistics
+import time
+from typing import Callable, List, Dict, Optional
+
+
+def measure(fn: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> Dict[str, float]:
+    """
+    Time ``fn`` and return per-call statistics in microseconds.
+
+    The number of calls per round is calibrated so each round takes at
+    least ``min_time`` seconds; the best and median of ``repeat`` rounds are
+    reported.
+    """
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    rounds: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        rounds.append((time.perf_counter() - started) / number * 1e6)
+
+    return {
+        "best_us": min(rounds),
+        "median_us": statistics.median(rounds),
+        "calls_per_round": number,
+    }
+
+
+def report(title: str, results: Dict[str, Dict[str, float]], baseline: Optional[str] = None) -> None:
+    """Print a result table, with speed-ups relative to ``baseline`` if given."""
+    print(f"\n{title}")
+    width = max(len(name) for name in results)
+    base = results[baseline]["best_us"] if baseline else None
+    for name, stats in results.items():
+        line = f"  {name:<{width}}  {stats['best_us']:10.2f} us"
+        if base:
+            line += f"  ({base / stats['best_us']:.2f}x)"
+        print(line)
@@ -0,0 +1,129 @@
+"""Realistic Custom Search API response bodies for benchmarks."""
+
+import json
+from typing import Optional
+
+
+def _query_item(query: str, start_index: int, count: int, search_type: Optional[str] = None) -> dict:
+    item = {
+        "title": f"Google Custom Search - {query}",
+        "totalResults": "1230000",
+        "searchTerms": query,
+        "count": count,
+        "startIndex": start_index,
+        "inputEncoding": "utf8",
+        "outputEncoding": "utf8",
+        "safe": "off",
+        "cx": "0123456789abcdef0",
+    }
+    if search_type:
+        item["searchType"] = search_type
+    return item
+
+
+def _pagemap(index: int, size: str) -> dict:
+    """A pagemap like the ones rich pages carry; ``size`` is 'small' or 'large'."""
+    pagemap = {
+        "cse_thumbnail": [{"src": f"https://encrypted-tbn0.gstatic.com/images?q=tbn:{index}", "width": "225", "height": "225"}],
+        "cse_image": [{"src": f"https://example.com/images/{index}.jpg"}],
+    }
+    if size == "large":
+        pagemap["metatags"] = [{
+            "og:image": f"https://example.com/images/{index}.jpg",
+            "og:title": f"Example page {index}",
+            "og:description": "An example description of the page content. " * 4,
+            "og:type": "article",
+            "og:url": f"https://example.com/articles/{index}",
+            "twitter:card": "summary_large_image",
+            "viewport": "width=device-width, initial-scale=1",
+            **{f"article:tag:{t}": f"tag-{t}" for t in range(20)},
+        }]
+        pagemap["hcard"] = [{"fn": "Example Org", "url": "https://example.com"}]
+        pagemap["breadcrumb"] = [{"title": f"Section {s}", "url": f"https://example.com/{s}"} for s in range(5)]
+    return pagemap
+
+
+def web_response(query: str = "python", num_items: int = 10, start_index: int = 1, pagemap: Optional[str] = "large") -> dict:
+    """
+    A web search response.
+
+    Args:
+        query: Search terms echoed in the response
+        num_items: Number of result items
+        start_index: Rank of the first item
+        pagemap: 'large', 'small' or None to omit pagemaps
+    """
+    items = []
+    for i in range(start_index, start_index + num_items):
+        item = {
+            "kind": "customsearch#result",
+            "title": f"{query} result {i} - Example",
+            "htmlTitle": f"<b>{query}</b> result {i} - Example",
+            "link": f"https://example.com/articles/{i}",
+            "displayLink": "example.com",
+            "snippet": f"Snippet text for result {i} about {query}. " * 3,
+            "htmlSnippet": f"Snippet text for result {i} about <b>{query}</b>. " * 3,
+            "cacheId": f"cache{i:06d}",
+            "formattedUrl": f"https://example.com/articles/{i}",
+            "htmlFormattedUrl": f"https://example.com/articles/{i}",
+        }
+        if pagemap:
+            item["pagemap"] = _pagemap(i, pagemap)
+        items.append(item)
+
+    return {
+        "kind": "customsearch#search",
+        "url": {"type": "application/json", "template": "https://www.googleapis.com/customsearch/v1?q={searchTerms}"},
+        "queries": {
+            "request": [_query_item(query, start_index, num_items)],
+            "nextPage": [_query_item(query, start_index + num_items, num_items)],
+        },
+        "context": {"title": "Example engine"},
+        "searchInformation": {
+            "searchTime": 0.312,
+            "formattedSearchTime": "0.31",
+            "totalResults": "1230000",
+            "formattedTotalResults": "1,230,000",
+        },
+        "items": items,
+    }
+
+
+def image_response(query: str = "puppies", num_items: int = 10, start_index: int = 1) -> dict:
+    """An image search response."""
+    items = []
+    for i in range(start_index, start_index + num_items):
+        items.append({
+            "kind": "customsearch#result",
+            "title": f"{query} picture {i}",
+            "htmlTitle": f"<b>{query}</b> picture {i}",
+            "link": f"https://images.example.com/{i}.jpg",
+            "displayLink": "images.example.com",
+            "snippet": f"{query} picture {i}",
+            "htmlSnippet": f"<b>{query}</b> picture {i}",
+            "mime": "image/jpeg",
+            "fileFormat": "image/jpeg",
+            "image": {
+                "contextLink": f"https://example.com/gallery/{i}",
+                "height": 1080,
+                "width": 1920,
+                "byteSize": 245000 + i,
+                "thumbnailLink": f"https://encrypted-tbn0.gstatic.com/images?q=tbn:{i}",
+                "thumbnailHeight": 84,
+                "thumbnailWidth": 150,
+            },
+        })
+
+    return {
+        "kind": "customsearch#search",
+        "queries": {
+            "request": [_query_item(query, start_index, num_items, "image")],
+            "nextPage": [_query_item(query, start_index + num_items, num_items, "image")],
+        },
+        "searchInformation": {"searchTime": 0.2, "totalResults": "54000"},
+        "items": items,
+    }
+
+
+def encode(payload: dict) -> bytes:
+    return json.dumps(payload).encode("utf-8")
@@ -0,0 +1,128 @@
+"""
+Run the benchmark suite and save the results as JSON.
+
+Micro-benchmarks time request building, response parsing and model
+construction; macro-benchmarks measure search throughput against a local
+fake endpoint; the import benchmark measures cold start in fresh
+interpreters. Save a run per version and compare them to spot regressions:
+
+    python benchmarks/run.py --output before.json
+    python benchmarks/run.py --output after.json --compare before.json
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+from importlib import metadata
+from typing import Callable, Dict, Optional
+
+from google_cse import GoogleCSE, WebSearchParameters, ImageSearchParameters
+
+import bench_import
+import bench_models
+import bench_parsing
+import bench_projection
+import bench_throughput
+from harness import measure
+from payloads import web_response, image_response, encode
+
+
+def micro_cases() -> Dict[str, Callable[[], object]]:
+    client = GoogleCSE(api_key="bench-key", search_engine_id="bench-cx")
+    web_parameters = WebSearchParameters(country="countryUS", language="en", date_restrict="m3")
+    image_parameters = ImageSearchParameters(img_size="large", img_type="photo")
+
+    cases = {
+        "_build_params (no parameters)": lambda: client._build_params("query", 10, None, None, 11),
+        "_build_params (web parameters)": lambda: client._build_params("query", 10, None, web_parameters, 11),
+        "_build_params (image parameters)": lambda: client._build_params("query", 10, "image", image_parameters, 11),
+    }
+
+    bodies = {
+        "web, large pagemap": encode(web_response(pagemap="large")),
+        "web, no pagemap": encode(web_response(pagemap=None)),
+        "image": encode(image_response()),
+    }
+    for label, body in bodies.items():
+        for name, fn in bench_parsing.parse_cases(body).items():
+            cases[f"{name} ({label})"] = fn
+
+    cases.update(bench_models.cases())
+    cases.update(bench_projection.cases())
+    return cases
+
+
+def environment() -> Dict[str, str]:
+    try:
+        version = metadata.version("google-cse")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+
+    return {
+        "google_cse": version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def compare(results: dict, baseline: dict) -> None:
+    """Print each benchmark's change against a saved run; >1.00x is faster."""
+    print(f"\nCompared with {baseline['environment']['google_cse']} ({baseline['environment']['timestamp']})")
+
+    for name, stats in results.get("micro", {}).items():
+        before = baseline.get("micro", {}).get(name)
+        if before:
+            print(f"  {name:<50}  {before['best_us'] / stats['best_us']:6.2f}x")
+
+    for name, stats in results.get("macro", {}).items():
+        before = baseline.get("macro", {}).get(name)
+        if before:
+            print(f"  {name:<50}  {stats['requests_per_s'] / before['requests_per_s']:6.2f}x")
+
+    for name, stats in results.get("import", {}).items():
+        before = baseline.get("import", {}).get(name)
+        if before:
+            print(f"  {name:<50}  {before['median_ms'] / stats['median_ms']:6.2f}x")
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default="benchmark-results.json", help="where to write the JSON results")
+    parser.add_argument("--compare", metavar="PATH", help="saved results to compare against")
+    parser.add_argument("--only", choices=["micro", "macro", "import"], help="run one part of the suite")
+    parser.add_argument("--repeat", type=int, default=5, help="timing rounds per micro-benchmark")
+    args = parser.parse_args(argv)
+
+    results = {"environment": environment()}
+
+    if args.only in (None, "micro"):
+        results["micro"] = {}
+        for name, fn in micro_cases().items():
+            stats = results["micro"][name] = measure(fn, repeat=args.repeat)
+            print(f"  {name:<50}  {stats['best_us']:10.2f} us")
+
+    if args.only in (None, "macro"):
+        results["macro"] = bench_throughput.run()
+        for name, stats in results["macro"].items():
+            print(f"  {name:<50}  {stats['requests_per_s']:10.1f} req/s")
+
+    if args.only in (None, "import"):
+        results["import"] = bench_import.run()
+        for name, stats in results["import"].items():
+            print(f"  {name:<50}  {stats['median_ms']:10.1f} ms")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
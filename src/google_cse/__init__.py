@@ -1,15 +1,213 @@
-from .client import GoogleCSE
+"""
+Google Custom Search client.
 
-from .parameters import WebSearchParameters, ImageSearchParameters, SearchParameters
+Public names are imported from their submodules on first access, so
+``import google_cse`` stays cheap and only the parts a program uses (and
+their dependencies, such as requests and pydantic) are ever loaded.
+"""
 
-from .results import WebSearchResult, ImageSearchResult, GoogleSearchResponse
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import GoogleCSE
+    from .async_client import AsyncGoogleCSE
+    from .parameters import (
+        WebSearchParameters,
+        ImageSearchParameters,
+        SearchParameters,
+        CompiledParameters,
+    )
+    from .projection import Projection
+    from .results import (
+        WebSearchResult,
+        ImageSearchResult,
+        GoogleSearchResponse,
+        LazySearchResponse,
+    )
+    from .batch import BatchResult
+    from .compact import CompactWebResult, CompactImageResult, ResultBatch, ImageResultBatch
+    from .cache import CacheBackend, MemoryCache, SQLiteCache, CacheStats
+    from .store import ResultStore
+    from .export import ResultWriter, NDJSONWriter, ParquetWriter
+    from .dedup import DedupIndex, BloomFilter, canonical_url
+    from .prefetch import (
+        ImagePrefetcher,
+        PrefetchConfig,
+        PrefetchedImage,
+        PrefetchStats,
+        AssetStore,
+    )
+    from .watch import Watchlist, WatchPolicy, WatchedQuery, ResultDiff
+    from .fusion import RankFusion, FusionConfig, FusionSource, FusedResult, FusionOutcome, FusionRanking
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
+    from .credentials import Credential, CredentialPool
+    from .instrumentation import (
+        Instrument,
+        SearchEvent,
+        AttemptEvent,
+        PrometheusInstrument,
+        OpenTelemetryInstrument,
+    )
+    from .exceptions import GoogleCSEError, RateLimitExceeded, QuotaExhausted
+    from .transport import (
+        Transport,
+        AsyncTransport,
+        TransportConfig,
+        RequestsTransport,
+        HttpxTransport,
+        HttpxAsyncTransport,
+        RecordingTransport,
+        ReplayTransport,
+        AsyncRecordingTransport,
+        AsyncReplayTransport,
+    )
+
+# Public name -> submodule defining it.
+_EXPORTS = {
+    "GoogleCSE": "client",
+    "AsyncGoogleCSE": "async_client",
+    "WebSearchParameters": "parameters",
+    "ImageSearchParameters": "parameters",
+    "SearchParameters": "parameters",
+    "CompiledParameters": "parameters",
+    "Projection": "projection",
+    "WebSearchResult": "results",
+    "ImageSearchResult": "results",
+    "GoogleSearchResponse": "results",
+    "LazySearchResponse": "results",
+    "BatchResult": "batch",
+    "CompactWebResult": "compact",
+    "CompactImageResult": "compact",
+    "ResultBatch": "compact",
+    "ImageResultBatch": "compact",
+    "CacheBackend": "cache",
+    "MemoryCache": "cache",
+    "SQLiteCache": "cache",
+    "CacheStats": "cache",
+    "ResultStore": "store",
+    "ResultWriter": "export",
+    "NDJSONWriter": "export",
+    "ParquetWriter": "export",
+    "DedupIndex": "dedup",
+    "BloomFilter": "dedup",
+    "canonical_url": "dedup",
+    "ImagePrefetcher": "prefetch",
+    "PrefetchConfig": "prefetch",
+    "PrefetchedImage": "prefetch",
+    "PrefetchStats": "prefetch",
+    "AssetStore": "prefetch",
+    "Watchlist": "watch",
+    "WatchPolicy": "watch",
+    "WatchedQuery": "watch",
+    "ResultDiff": "watch",
+    "RankFusion": "fusion",
+    "FusionConfig": "fusion",
+    "FusionSource": "fusion",
+    "FusedResult": "fusion",
+    "FusionOutcome": "fusion",
+    "FusionRanking": "fusion",
+    "RateLimiter": "ratelimit",
+    "RetryPolicy": "retry",
+    "Credential": "credentials",
+    "CredentialPool": "credentials",
+    "Instrument": "instrumentation",
+    "SearchEvent": "instrumentation",
+    "AttemptEvent": "instrumentation",
+    "PrometheusInstrument": "instrumentation",
+    "OpenTelemetryInstrument": "instrumentation",
+    "GoogleCSEError": "exceptions",
+    "RateLimitExceeded": "exceptions",
+    "QuotaExhausted": "exceptions",
+    "Transport": "transport",
+    "AsyncTransport": "transport",
+    "TransportConfig": "transport",
+    "RequestsTransport": "transport",
+    "HttpxTransport": "transport",
+    "HttpxAsyncTransport": "transport",
+    "RecordingTransport": "transport",
+    "ReplayTransport": "transport",
+    "AsyncRecordingTransport": "transport",
+    "AsyncReplayTransport": "transport",
+}
 
 __all__ = [
     "GoogleCSE",
+    "AsyncGoogleCSE",
     "WebSearchParameters",
     "ImageSearchParameters",
     "SearchParameters",
+    "CompiledParameters",
+    "Projection",
     "WebSearchResult",
     "ImageSearchResult",
     "GoogleSearchResponse",
-]
\ No newline at end of file
+    "LazySearchResponse",
+    "BatchResult",
+    "CompactWebResult",
+    "CompactImageResult",
+    "ResultBatch",
+    "ImageResultBatch",
+    "CacheBackend",
+    "MemoryCache",
+    "SQLiteCache",
+    "CacheStats",
+    "ResultStore",
+    "ResultWriter",
+    "NDJSONWriter",
+    "ParquetWriter",
+    "DedupIndex",
+    "BloomFilter",
+    "canonical_url",
+    "ImagePrefetcher",
+    "PrefetchConfig",
+    "PrefetchedImage",
+    "PrefetchStats",
+    "AssetStore",
+    "Watchlist",
+    "WatchPolicy",
+    "WatchedQuery",
+    "ResultDiff",
+    "RankFusion",
+    "FusionConfig",
+    "FusionSource",
+    "FusedResult",
+    "FusionOutcome",
+    "FusionRanking",
+    "RateLimiter",
+    "RetryPolicy",
+    "Credential",
+    "CredentialPool",
+    "Instrument",
+    "SearchEvent",
+    "AttemptEvent",
+    "PrometheusInstrument",
+    "OpenTelemetryInstrument",
+    "GoogleCSEError",
+    "RateLimitExceeded",
+    "QuotaExhausted",
+    "Transport",
+    "AsyncTransport",
+    "TransportConfig",
+    "RequestsTransport",
+    "HttpxTransport",
+    "HttpxAsyncTransport",
+    "RecordingTransport",
+    "ReplayTransport",
+    "AsyncRecordingTransport",
+    "AsyncReplayTransport",
+]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
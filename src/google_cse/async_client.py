@@ -0,0 +1,419 @@
+import asyncio
+import requests
+from typing import Optional, Dict, Any, List, Literal, Iterable, Union, AsyncIterator, Sequence
+
+from .cache import CacheBackend
+from .client import BaseGoogleCSE
+from .credentials import Credential, CredentialPool
+from .dedup import DedupIndex
+from .exceptions import RateLimitExceeded
+from .instrumentation import Instrument, SearchEvent
+from .pagination import MAX_RESULTS, plan_pages, has_next_page, total_results
+from .parameters import SearchParameters, WebSearchParameters, ImageSearchParameters
+from .projection import Projection
+from .ratelimit import RateLimiter
+from .results import GoogleSearchResponse, LazySearchResponse, Result, WebSearchResult, ImageSearchResult
+from .retry import RetryPolicy
+from .singleflight import AsyncSingleFlight
+from .transport import AsyncTransport, TransportConfig, TransportResponse, create_async_transport
+
+
+class AsyncGoogleCSE(BaseGoogleCSE):
+    """
+    Asyncio client for Google Custom Search Engine API.
+
+    Mirrors ``GoogleCSE`` with coroutine methods, so many searches can run
+    concurrently from a single event loop over one pooled connection set.
+    Requires the optional ``httpx`` dependency unless a transport is given.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        search_engine_id: Optional[str] = None,
+        transport: Optional[AsyncTransport] = None,
+        transport_config: Optional[TransportConfig] = None,
+        cache: Optional[CacheBackend] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        credentials: Optional[Union[CredentialPool, Sequence[Credential]]] = None,
+        lazy_parsing: bool = False,
+        coalesce: bool = False,
+        base_url: Optional[str] = None,
+        instruments: Optional[Sequence[Instrument]] = None
+    ):
+        """
+        Initialize the async Google CSE client.
+
+        Args:
+            api_key: Your Google API key
+            search_engine_id: Your Programmable Search Engine ID
+            transport: Async HTTP transport to use; it is not closed by the client
+            transport_config: Settings for the pooled transport the client
+                creates when no transport is given
+            cache: Response cache consulted before every request; hits are
+                counted in ``cache_stats``
+            rate_limiter: Client-side quota limiter, awaited without blocking
+                the event loop; requests it refuses raise RateLimitExceeded
+            retry_policy: Retries transient failures with backoff and can
+                hedge slow requests; without it every failure is raised
+            credentials: Pool of (api_key, cx) credentials to spread requests
+                over instead of a single api_key/search_engine_id pair
+            lazy_parsing: Return LazySearchResponse views that validate
+                fields on first access instead of fully validated models
+            coalesce: While a request is in flight, identical searches from
+                other tasks await it and share its response instead of
+                sending their own
+            base_url: Endpoint to query instead of the Custom Search API,
+                e.g. the ``url`` of a ``testing.FakeSearchServer``
+            instruments: Hooks (e.g. PrometheusInstrument) told about every
+                search and HTTP attempt with per-phase timings; nothing is
+                timed when there are none
+        """
+        super().__init__(
+            api_key, search_engine_id, cache, rate_limiter, retry_policy, credentials, lazy_parsing,
+            coalesce, base_url, instruments
+        )
+
+        self._flights = AsyncSingleFlight() if coalesce else None
+        self._owns_transport = transport is None
+        self.transport = transport or create_async_transport(transport_config)
+
+    async def aclose(self) -> None:
+        """Release the connection pool owned by this client."""
+        if self._retrier is not None:
+            self._retrier.close()
+        if self._owns_transport:
+            await self.transport.aclose()
+
+    async def __aenter__(self) -> "AsyncGoogleCSE":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def raw_search(
+        self,
+        query: str,
+        start_index: int = 1,
+        num_results: int = 10,
+        search_type: Optional[Literal['image']] = None,
+        parameters: Optional[SearchParameters] = None,
+        projection: Optional[Projection] = None
+    ) -> Union[GoogleSearchResponse, LazySearchResponse]:
+        """
+        Perform a raw search query returning full API response.
+
+        Args:
+            query: The search query string
+            start_index: Number for starting index of result
+            num_results: Number of results to return (1-10)
+            search_type: Type of search ("image" for image search, None for web)
+            parameters: Search parameters object
+            projection: Keep only these result fields and pagemap paths,
+                and ask the API to send only them
+
+        Returns:
+            GoogleSearchResponse with the full API response
+        """
+        start_index = self._start_index(start_index, parameters)
+        self._validate_range(start_index, num_results)
+
+        event = self._new_event(query, search_type, start_index, num_results)
+
+        params = self._build_params(query, num_results, search_type, parameters, start_index, projection)
+        if event is not None:
+            event.build_params = event.lap()
+
+        if self.cache is not None and self.cache.blocking_io:
+            cache_key, cached = await asyncio.to_thread(self._cache_lookup, params, projection)
+        else:
+            cache_key, cached = self._cache_lookup(params, projection)
+        if event is not None:
+            event.cache_lookup = event.lap()
+            event.cache_hit = cached is not None if self.cache is not None else None
+        if cached is not None:
+            self._emit(event)
+            return cached
+
+        try:
+            if self._flights is not None:
+                if event is not None:
+                    event.coalesced = True
+                key = self._flight_key(params, cache_key, projection)
+                search_response = await self._flights.do(key, lambda: self._fetch(params, cache_key, event, projection))
+            else:
+                search_response = await self._fetch(params, cache_key, event, projection)
+        except BaseException as e:
+            self._emit(event, e)
+            raise
+
+        self._emit(event)
+        return search_response
+
+    async def _fetch(
+        self,
+        params: Dict[str, Any],
+        cache_key: Optional[str],
+        event: Optional[SearchEvent] = None,
+        projection: Optional[Projection] = None
+    ) -> GoogleSearchResponse:
+        """Send a request (with retries), parse the response and cache it."""
+        if event is not None:
+            event.coalesced = False
+        try:
+            if self._retrier is not None:
+                response = await self._retrier.call_async(lambda: self._send(params, event))
+            else:
+                response = await self._send(params, event)
+
+            if event is not None:
+                event.lap()
+            search_response = self._parse_response(response.content, projection)
+            if event is not None:
+                event.parse = event.lap()
+                event.response_bytes = len(response.content)
+
+            if cache_key is not None:
+                if self.cache.blocking_io:
+                    await asyncio.to_thread(self.cache.set, cache_key, search_response)
+                else:
+                    self.cache.set(cache_key, search_response)
+            return search_response
+
+        except requests.exceptions.RequestException as e:
+            self._log.error(f"Search request failed: {e}")
+            raise
+
+    async def _send(self, params: Dict[str, Any], event: Optional[SearchEvent] = None) -> TransportResponse:
+        """Make a single rate-limited request attempt, failing over between credentials."""
+        attempts = len(self.credentials) if self.credentials is not None else 1
+        for _ in range(attempts):
+            # Credentials count a request as used, so only pick one once the
+            # limiter has let the request through.
+            if self.rate_limiter is not None:
+                wait = await self.rate_limiter.take_async()
+                if wait > 0:
+                    raise RateLimitExceeded("client-side rate limit reached", retry_after=wait)
+
+            request_params, credential = self._apply_credential(params)
+
+            attempt = self._begin_attempt(event, credential)
+            try:
+                response = await self.transport.get(self.base_url, params=request_params)
+            except requests.exceptions.RequestException as e:
+                self._end_attempt(event, attempt, error=e)
+                if credential is not None:
+                    self.credentials.record_error(credential)
+                raise
+            self._end_attempt(event, attempt, response)
+
+            if not self._record_credential(credential, response):
+                break
+        else:
+            if self.credentials is not None:
+                # Every attempt failed over; the last key is out of quota too.
+                raise self.credentials.quota_error()
+
+        response.raise_for_status()
+        return response
+
+    async def web_search(
+        self,
+        query: str,
+        start_index: int = 1,
+        num_results: int = 10,
+        parameters: Optional[WebSearchParameters] = None,
+        projection: Optional[Projection] = None
+    ) -> List[WebSearchResult]:
+        """
+        Perform a web search and return simplified results.
+
+        Args:
+            query: Search query
+            start_index: Number for starting index of result
+            num_results: Number of results (1-10)
+            parameters: Web search parameters
+            projection: Fields and pagemap paths to keep; results carry
+                the (projected) pagemap when it selects one
+
+        Returns:
+            List of WebSearchResult objects
+        """
+        results = await self.raw_search(
+            query=query,
+            start_index=start_index,
+            num_results=num_results,
+            search_type=None,
+            parameters=parameters,
+            projection=projection
+        )
+
+        return self._to_web_results(results, projection is not None and projection.includes_pagemap)
+
+    async def image_search(
+        self,
+        query: str,
+        start_index: int = 1,
+        num_results: int = 10,
+        parameters: Optional[ImageSearchParameters] = None
+    ) -> List[ImageSearchResult]:
+        """
+        Perform an image search and return simplified results.
+
+        Args:
+            query: Search query
+            start_index: Number for starting index of result
+            num_results: Number of results (1-10)
+            parameters: Image search parameters
+
+        Returns:
+            List of ImageSearchResult objects
+        """
+        results = await self.raw_search(
+            query=query,
+            start_index=start_index,
+            num_results=num_results,
+            search_type="image",
+            parameters=parameters
+        )
+
+        return self._to_image_results(results)
+
+    async def gather(
+        self,
+        queries: Iterable[str],
+        start_index: int = 1,
+        num_results: int = 10,
+        search_type: Optional[Literal['image']] = None,
+        parameters: Optional[SearchParameters] = None,
+        concurrency: int = 10,
+        return_exceptions: bool = False
+    ) -> List[Union[GoogleSearchResponse, BaseException]]:
+        """
+        Run many raw searches concurrently, at most ``concurrency`` at a time.
+
+        Args:
+            queries: Search query strings
+            start_index: Number for starting index of result
+            num_results: Number of results per query (1-10)
+            search_type: Type of search ("image" for image search, None for web)
+            parameters: Search parameters shared by every query
+            concurrency: Maximum number of requests in flight
+            return_exceptions: Return failures in place of their response
+                instead of raising the first one
+
+        Returns:
+            List of GoogleSearchResponse objects in the same order as ``queries``
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(query: str) -> GoogleSearchResponse:
+            async with semaphore:
+                return await self.raw_search(
+                    query=query,
+                    start_index=start_index,
+                    num_results=num_results,
+                    search_type=search_type,
+                    parameters=parameters
+                )
+
+        return await asyncio.gather(
+            *(run(query) for query in queries),
+            return_exceptions=return_exceptions
+        )
+
+    async def iter_pages(
+        self,
+        query: str,
+        max_results: int = MAX_RESULTS,
+        search_type: Optional[Literal['image']] = None,
+        parameters: Optional[SearchParameters] = None,
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[GoogleSearchResponse]:
+        """
+        Fetch up to ``max_results`` results, yielding one response per page.
+
+        The window starts at ``parameters.start`` if set, otherwise at 1.
+
+        The first page is fetched on its own to learn the total result count;
+        the remaining pages are then requested concurrently and yielded in
+        order. Iteration stops early when a page has no ``queries.nextPage``
+        or the reported total is reached, and pending requests are cancelled.
+
+        Args:
+            query: Search query
+            max_results: Number of results to fetch (1-100)
+            search_type: Type of search ("image" for image search, None for web)
+            parameters: Search parameters shared by every page
+            concurrency: Maximum number of pages fetched at once
+                (defaults to all remaining pages)
+
+        Returns:
+            Async iterator of GoogleSearchResponse objects, one per page
+        """
+        if not (1 <= max_results <= MAX_RESULTS):
+            raise ValueError(f"max_results must be between 1 and {MAX_RESULTS}")
+
+        first_index = self._start_index(1, parameters)
+        pages = plan_pages(max_results, first_index)
+        if not pages:
+            raise ValueError(f"parameters.start must be at most {MAX_RESULTS}")
+
+        start_index, num_results = pages[0]
+        first = await self.raw_search(query, start_index, num_results, search_type, parameters)
+        yield first
+
+        if not has_next_page(first):
+            return
+
+        remaining = plan_pages(max_results, first_index, total_results(first))[1:]
+        if not remaining:
+            return
+
+        semaphore = asyncio.Semaphore(concurrency or len(remaining))
+
+        async def fetch(start: int, num: int) -> GoogleSearchResponse:
+            async with semaphore:
+                return await self.raw_search(query, start, num, search_type, parameters)
+
+        tasks = [asyncio.ensure_future(fetch(start, num)) for start, num in remaining]
+        try:
+            for task in tasks:
+                page = await task
+                yield page
+                if not page.items or not has_next_page(page):
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def search_all(
+        self,
+        query: str,
+        max_results: int = MAX_RESULTS,
+        search_type: Optional[Literal['image']] = None,
+        parameters: Optional[SearchParameters] = None,
+        concurrency: Optional[int] = None,
+        dedup: Optional[DedupIndex] = None
+    ) -> AsyncIterator[Result]:
+        """
+        Stream every result item for a query across pages.
+
+        See ``iter_pages`` for how pages are fetched. With ``dedup``, results
+        already seen by the index (on earlier pages or in earlier searches)
+        are skipped; with lazy parsing they are dropped before validation.
+
+        Returns:
+            Async iterator of Result objects in rank order
+        """
+        async for page in self.iter_pages(query, max_results, search_type, parameters, concurrency):
+            if dedup is not None:
+                page = dedup.filter_response(page)
+            if page.items:
+                for item in page.items:
+                    yield item
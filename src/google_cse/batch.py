@@ -0,0 +1,98 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Optional, List, Iterable, Iterator, Callable, Tuple, TypeVar, Union, Any
+
+from .compact import ResultBatch, ImageResultBatch
+from .parameters import SearchParameters
+from .results import GoogleSearchResponse
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+BatchQuery = Union[str, Tuple[str, Optional[SearchParameters]]]
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one query in a batch: its response or the error it raised."""
+
+    index: int
+    query: str
+    parameters: Optional[SearchParameters] = None
+    response: Optional[GoogleSearchResponse] = None
+    results: Union[List[Any], ResultBatch, ImageResultBatch] = field(default_factory=list)
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _capture(fn: Callable[[T], R], item: T) -> Tuple[Optional[R], Optional[BaseException]]:
+    try:
+        return fn(item), None
+    except Exception as e:
+        return None, e
+
+
+def run_batch(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 8,
+    ordered: bool = False,
+    max_pending: Optional[int] = None
+) -> Iterator[Tuple[int, T, Optional[R], Optional[BaseException]]]:
+    """
+    Apply ``fn`` to ``items`` on a bounded thread pool and stream the outcomes.
+
+    Items are pulled from ``items`` lazily and at most ``max_pending`` calls
+    are queued or running at once, so memory stays flat however long the
+    input is. Exceptions raised by ``fn`` are returned, not raised.
+
+    Args:
+        fn: Function applied to each item
+        items: Input items, consumed lazily
+        max_workers: Number of worker threads
+        ordered: Yield outcomes in input order instead of completion order
+        max_pending: Maximum calls in flight (defaults to twice max_workers)
+
+    Returns:
+        Iterator of (index, item, result, error) tuples
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    max_pending = max_pending or 2 * max_workers
+    if max_pending < max_workers:
+        raise ValueError("max_pending must be at least max_workers")
+
+    source = enumerate(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="google-cse-batch")
+    pending: "deque[Tuple[int, T, Future]]" = deque()
+
+    def fill() -> None:
+        while len(pending) < max_pending:
+            try:
+                index, item = next(source)
+            except StopIteration:
+                return
+            pending.append((index, item, executor.submit(_capture, fn, item)))
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                index, item, future = pending.popleft()
+                result, error = future.result()
+                yield index, item, result, error
+            else:
+                wait([future for _, _, future in pending], return_when=FIRST_COMPLETED)
+                for entry in [entry for entry in pending if entry[2].done()]:
+                    pending.remove(entry)
+                    index, item, future = entry
+                    result, error = future.result()
+                    yield index, item, result, error
+            fill()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,217 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+
+from .results import GoogleSearchResponse
+
+
+def make_cache_key(params: Dict[str, Any]) -> str:
+    """
+    Build a stable cache key from request parameters.
+
+    The API key is left out so that every credential shares entries, keys
+    are sorted and whitespace in string values is collapsed, so
+    ``"  cats  dogs"`` and ``"cats dogs"`` hit the same entry.
+
+    Args:
+        params: Request parameters as built by ``_build_params``
+
+    Returns:
+        Hex digest identifying the request
+    """
+    canonical = {}
+    for name, value in params.items():
+        if name == "key":
+            continue
+        if isinstance(value, str):
+            value = " ".join(value.split())
+        canonical[name] = value
+
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheStats:
+    """Thread-safe hit/miss counters for a cache."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate}
+
+
+class CacheBackend:
+    """
+    Base class for response cache backends.
+
+    Backends map a key from ``make_cache_key`` to a parsed
+    ``GoogleSearchResponse``. Returned responses may be shared between
+    callers and should be treated as read-only.
+    """
+
+    # Whether get and set block on I/O; AsyncGoogleCSE then runs them in a
+    # worker thread instead of on the event loop.
+    blocking_io = False
+
+    def get(self, key: str) -> Optional[GoogleSearchResponse]:
+        raise NotImplementedError
+
+    def set(self, key: str, response: GoogleSearchResponse) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process LRU cache with per-entry TTL.
+
+    Entries are kept as parsed models, so a hit skips both the HTTP call and
+    response validation.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = 3600.0):
+        """
+        Args:
+            max_size: Maximum number of entries before the least recently
+                used one is evicted
+            ttl: Seconds an entry stays valid, or None to never expire
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Optional[float], GoogleSearchResponse]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[GoogleSearchResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, response = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: GoogleSearchResponse) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Cache stored in a local SQLite file, shareable between processes.
+
+    Responses are stored as JSON and re-validated when read.
+    """
+
+    blocking_io = True
+
+    def __init__(self, path: str, ttl: Optional[float] = 86400.0):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+            ttl: Seconds an entry stays valid, or None to never expire
+        """
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, expires_at REAL, payload BLOB NOT NULL)"
+        )
+
+    def get(self, key: str) -> Optional[GoogleSearchResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at, payload FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            expires_at, payload = row
+            if expires_at is not None and expires_at <= time.time():
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+        return GoogleSearchResponse.from_json(payload)
+
+    def set(self, key: str, response: GoogleSearchResponse) -> None:
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        payload = response.to_json()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, expires_at, payload) VALUES (?, ?, ?)",
+                (key, expires_at, payload),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
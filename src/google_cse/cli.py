@@ -0,0 +1,380 @@
+"""
+``google-cse`` command: run a file of queries through the API in bulk.
+
+Each input line is a query, or a JSON object ``{"query": ..., "parameters":
+{...}}`` whose parameters override the shared ``--parameters``. Queries are
+spread over worker processes, each with its own pooled client, and every
+result is appended to the output as an NDJSON row (see ``export``).
+
+Completed queries are recorded in a checkpoint file once their rows are on
+disk, so rerunning the same command after a crash or Ctrl-C skips them and
+only spends quota on the rest. Failed queries are not checkpointed and are
+retried by the next run.
+
+    google-cse queries.txt -o results.ndjson --processes 4 --threads 8
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Optional, Dict, List, Tuple, Iterator, IO, Any
+
+from dotenv import load_dotenv
+
+from .batch import BatchResult
+from .client import GoogleCSE
+from .export import NDJSONWriter, response_rows
+from .parameters import SearchParameters, WebSearchParameters, ImageSearchParameters
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .transport import TransportConfig
+
+# A task is (key, query, parameters as a dict or None).
+Task = Tuple[str, str, Optional[Dict[str, Any]]]
+
+
+def parse_line(line: str) -> Optional[Tuple[str, Optional[Dict[str, Any]]]]:
+    """Query and parameter overrides of one input line; None for blank lines."""
+    line = line.strip()
+    if not line:
+        return None
+    if line.startswith("{"):
+        entry = json.loads(line)
+        return entry["query"], entry.get("parameters")
+    return line, None
+
+
+def task_key(query: str, parameters: Optional[Dict[str, Any]], search_type: Optional[str], num_results: int) -> str:
+    """
+    Checkpoint key of a query: stable across runs and input order.
+
+    ``parameters`` are the ones the query is sent with, i.e. the shared
+    ``--parameters`` merged with the line's overrides, so rerunning with
+    different shared parameters does not skip queries done with the old ones.
+    """
+    payload = json.dumps([query, parameters, search_type, num_results], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def load_checkpoint(path: str) -> set:
+    if not os.path.exists(path):
+        return set()
+    with open(path, "r", encoding="utf-8") as f:
+        return {line.strip() for line in f if line.strip()}
+
+
+def _parameters_class(search_type: Optional[str]) -> type:
+    return ImageSearchParameters if search_type == "image" else WebSearchParameters
+
+
+def _worker(config: Dict[str, Any], tasks: multiprocessing.Queue, results: multiprocessing.Queue) -> None:
+    """Worker process: search tasks from ``tasks`` until a None sentinel."""
+    search_type = config["search_type"]
+    parameters_class = _parameters_class(search_type)
+    shared = parameters_class(**config["parameters"]) if config["parameters"] else None
+    keys: Dict[int, str] = {}
+
+    def queries() -> Iterator[Tuple[str, Optional[SearchParameters]]]:
+        index = 0
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            key, query, overrides = task
+            keys[index] = key
+            index += 1
+            parameters = shared
+            if overrides:
+                base = shared.model_dump(exclude_unset=True) if shared is not None else {}
+                parameters = parameters_class(**{**base, **overrides})
+            yield query, parameters
+
+    # Failures are reported by the parent; the client's own error log would repeat them.
+    logging.getLogger(GoogleCSE.__name__).setLevel(logging.CRITICAL)
+
+    rate_limiter = RateLimiter(qps=config["qps"]) if config["qps"] else None
+    client = None
+    try:
+        client = GoogleCSE(
+            api_key=config["api_key"],
+            search_engine_id=config["search_engine_id"],
+            transport_config=TransportConfig(pool_maxsize=config["threads"]),
+            rate_limiter=rate_limiter,
+            retry_policy=RetryPolicy(max_attempts=config["max_attempts"]),
+            lazy_parsing=True,
+            base_url=config["base_url"],
+        )
+        outcomes = client.search_many(
+            queries(),
+            search_type=search_type,
+            num_results=config["num_results"],
+            max_workers=config["threads"],
+        )
+        for outcome in outcomes:
+            results.put(_report(keys.pop(outcome.index), outcome, config["include_pagemap"]))
+    finally:
+        if client is not None:
+            client.close()
+        results.put(None)
+
+
+def _report(key: str, outcome: BatchResult, include_pagemap: bool) -> tuple:
+    if outcome.error is not None:
+        return "error", key, outcome.query, f"{type(outcome.error).__name__}: {outcome.error}"
+    rows = list(response_rows(outcome.response, outcome.query))
+    if not include_pagemap:
+        # Not worth pickling; the writer drops the column anyway.
+        for row in rows:
+            row["pagemap"] = None
+    return "ok", key, outcome.query, rows
+
+
+class Progress:
+    """Done/failed counts and throughput, redrawn on stderr."""
+
+    def __init__(self, stream: IO[str], interval: float, skipped: int):
+        self.stream = stream
+        self.interval = interval
+        self.skipped = skipped
+        self.done = 0
+        self.failed = 0
+        self.rows = 0
+        self._started = time.monotonic()
+        self._last = 0.0
+        self._tty = stream.isatty()
+
+    def line(self) -> str:
+        elapsed = time.monotonic() - self._started
+        rate = self.done / elapsed if elapsed else 0.0
+        return (
+            f"{self.done} done, {self.failed} failed, {self.skipped} skipped, "
+            f"{self.rows} rows, {rate:.1f} queries/s, {elapsed:.0f}s"
+        )
+
+    def update(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last < self.interval:
+            return
+        self._last = now
+        self.stream.write(("\r" + self.line() + "\033[K") if self._tty else self.line() + "\n")
+        self.stream.flush()
+
+    def finish(self) -> None:
+        self.update(force=True)
+        if self._tty:
+            self.stream.write("\n")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="google-cse",
+        description="Run many Google Custom Search queries, resumably, across worker processes.",
+    )
+    parser.add_argument("input", nargs="?", default="-",
+                        help="File with one query or JSON object per line ('-' for stdin)")
+    parser.add_argument("-o", "--output", required=True,
+                        help="NDJSON file results are appended to")
+    parser.add_argument("--checkpoint",
+                        help="File of completed queries (default: <output>.checkpoint)")
+    parser.add_argument("--api-key", default=os.environ.get("GOOGLE_API_KEY"),
+                        help="API key (default: $GOOGLE_API_KEY)")
+    parser.add_argument("--cx", default=os.environ.get("GOOGLE_CSE_ID"),
+                        help="Search engine ID (default: $GOOGLE_CSE_ID)")
+    parser.add_argument("--base-url",
+                        help="Endpoint to query instead of the Custom Search API, e.g. a fake server")
+    parser.add_argument("--fake-server", action="store_true",
+                        help="Start a local FakeSearchServer and query it (no API key needed)")
+    parser.add_argument("--search-type", choices=["web", "image"], default="web")
+    parser.add_argument("--parameters",
+                        help="JSON file of WebSearchParameters/ImageSearchParameters fields shared by all queries")
+    parser.add_argument("--num-results", type=int, default=10, help="Results per query (1-10)")
+    parser.add_argument("--processes", type=int, default=2, help="Worker processes")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent requests per process")
+    parser.add_argument("--qps", type=float, help="Overall request rate limit, split between processes")
+    parser.add_argument("--max-attempts", type=int, default=3, help="Attempts per query, including retries")
+    parser.add_argument("--include-pagemap", action="store_true", help="Keep each result's pagemap")
+    parser.add_argument("--progress-interval", type=float, default=1.0, help="Seconds between progress updates")
+    parser.add_argument("-q", "--quiet", action="store_true", help="No progress output")
+    return parser
+
+
+def _read_tasks(
+    stream: IO[str],
+    completed: set,
+    shared: Dict[str, Any],
+    search_type: Optional[str],
+    num_results: int,
+    progress: Progress
+) -> Iterator[Task]:
+    seen = set()
+    for number, line in enumerate(stream, 1):
+        try:
+            parsed = parse_line(line)
+        except (ValueError, KeyError) as e:
+            raise SystemExit(f"google-cse: line {number}: invalid query entry: {e}")
+        if parsed is None:
+            continue
+        query, overrides = parsed
+        effective = {**shared, **(overrides or {})} or None
+        key = task_key(query, effective, search_type, num_results)
+        if key in completed or key in seen:
+            progress.skipped += 1
+            continue
+        seen.add(key)
+        yield key, query, overrides
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    load_dotenv()
+    args = build_parser().parse_args(argv)
+
+    fake_server = None
+    if args.fake_server:
+        from .testing import FakeSearchServer
+        fake_server = FakeSearchServer().start()
+        args.base_url = fake_server.url
+
+    if not args.api_key or not args.cx:
+        if args.base_url is None:
+            print("google-cse: --api-key and --cx (or $GOOGLE_API_KEY and $GOOGLE_CSE_ID) are required",
+                  file=sys.stderr)
+            return 2
+        args.api_key, args.cx = args.api_key or "test-key", args.cx or "test-cx"
+    if not (1 <= args.num_results <= 10):
+        print("google-cse: --num-results must be between 1 and 10", file=sys.stderr)
+        return 2
+    if args.processes < 1 or args.threads < 1:
+        print("google-cse: --processes and --threads must be at least 1", file=sys.stderr)
+        return 2
+
+    search_type = "image" if args.search_type == "image" else None
+    shared: Dict[str, Any] = {}
+    if args.parameters:
+        with open(args.parameters, "r", encoding="utf-8") as f:
+            shared = json.load(f)
+        _parameters_class(search_type)(**shared)  # fail fast on invalid fields
+
+    checkpoint_path = args.checkpoint or args.output + ".checkpoint"
+    completed = load_checkpoint(checkpoint_path)
+
+    config = {
+        "api_key": args.api_key,
+        "search_engine_id": args.cx,
+        "base_url": args.base_url,
+        "search_type": search_type,
+        "parameters": shared,
+        "num_results": args.num_results,
+        "threads": args.threads,
+        "qps": args.qps / args.processes if args.qps else None,
+        "max_attempts": args.max_attempts,
+        "include_pagemap": args.include_pagemap,
+    }
+
+    # Spawned workers start clean instead of inheriting this process's threads.
+    context = multiprocessing.get_context("spawn")
+    tasks = context.Queue(maxsize=args.processes * args.threads * 4)
+    results = context.Queue()
+    workers = [context.Process(target=_worker, args=(config, tasks, results), daemon=True)
+               for _ in range(args.processes)]
+    for worker in workers:
+        worker.start()
+
+    progress = Progress(sys.stderr, args.progress_interval, skipped=0)
+    input_stream = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    feed_error: List[BaseException] = []
+
+    def feed() -> None:
+        try:
+            for task in _read_tasks(input_stream, completed, shared, search_type, args.num_results, progress):
+                tasks.put(task)
+        except BaseException as e:
+            feed_error.append(e)
+        finally:
+            for _ in workers:
+                tasks.put(None)
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+
+    writer = NDJSONWriter(args.output, include_pagemap=args.include_pagemap)
+    checkpoint = open(checkpoint_path, "a", encoding="utf-8")
+    pending: List[str] = []
+
+    def commit() -> None:
+        # Rows first, then the keys that produced them: a crash in between
+        # repeats those queries instead of losing their results.
+        writer.flush()
+        if pending:
+            checkpoint.write("".join(key + "\n" for key in pending))
+            checkpoint.flush()
+            pending.clear()
+
+    running = len(workers)
+    last_commit = time.monotonic()
+    interrupted = False
+    try:
+        while running:
+            try:
+                message = results.get(timeout=progress.interval)
+            except queue.Empty:
+                # A worker that was killed never sends its sentinel.
+                if not any(worker.is_alive() for worker in workers):
+                    break
+                if not args.quiet:
+                    progress.update()
+                continue
+            if message is None:
+                running -= 1
+                continue
+
+            status, key, query, payload = message
+            if status == "ok":
+                writer.write_rows(payload)
+                pending.append(key)
+                progress.done += 1
+                progress.rows += len(payload)
+            else:
+                progress.failed += 1
+                print(f"\ngoogle-cse: {query!r} failed: {payload}", file=sys.stderr)
+
+            if time.monotonic() - last_commit >= 1.0:
+                commit()
+                last_commit = time.monotonic()
+            if not args.quiet:
+                progress.update()
+    except KeyboardInterrupt:
+        interrupted = True
+        for worker in workers:
+            worker.terminate()
+    finally:
+        commit()
+        writer.close()
+        checkpoint.close()
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if not args.quiet:
+            progress.finish()
+
+    for worker in workers:
+        worker.join()
+    if fake_server is not None:
+        fake_server.stop()
+
+    if feed_error and not isinstance(feed_error[0], KeyboardInterrupt):
+        error = feed_error[0]
+        print(f"google-cse: {error}", file=sys.stderr)
+        return 2
+    if interrupted:
+        return 130
+    return 1 if progress.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,285 @@
 import logging
+import time
 import requests
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Literal, Iterable, Iterator, Tuple, Sequence, Union
+
+from .batch import BatchQuery, BatchResult, run_batch
+from .cache import CacheBackend, CacheStats, make_cache_key
+from .compact import ResultBatch, ImageResultBatch
+from .credentials import Credential, CredentialPool, quota_reset_time
+from .dedup import DedupIndex
+from .exceptions import RateLimitExceeded
+from .instrumentation import Instrument, SearchEvent, AttemptEvent
+from .pagination import MAX_RESULTS, plan_pages, has_next_page, total_results
+from .parameters import SearchParameters, WebSearchParameters, ImageSearchParameters
+from .projection import Projection
+from .ratelimit import RateLimiter
+from .results import GoogleSearchResponse, LazySearchResponse, Result, WebSearchResult, ImageSearchResult
+from .retry import RetryPolicy, Retrier
+from .singleflight import SingleFlight
+from .transport import Transport, TransportConfig, TransportResponse, create_transport
+
+
+class BaseGoogleCSE:
+    """
+    Request building and response handling shared by the sync and async clients.
+
+    Subclasses provide the I/O; everything that does not touch the network
+    lives here so both clients build identical requests.
+    """
+
+    BASE_URL = "https://customsearch.googleapis.com/customsearch/v1"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        search_engine_id: Optional[str] = None,
+        cache: Optional[CacheBackend] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        credentials: Optional[Union[CredentialPool, Sequence[Credential]]] = None,
+        lazy_parsing: bool = False,
+        coalesce: bool = False,
+        base_url: Optional[str] = None,
+        instruments: Optional[Sequence[Instrument]] = None
+    ):
+        """
+        Args:
+            api_key: Your Google API key
+            search_engine_id: Your Programmable Search Engine ID
+            cache: Response cache consulted before every request
+            rate_limiter: Limiter every outgoing request must acquire from
+            retry_policy: How failed requests are retried and hedged
+            credentials: Pool of credentials used instead of a single
+                api_key/search_engine_id pair
+            lazy_parsing: Parse responses into LazySearchResponse views
+            coalesce: Share one in-flight request between identical searches
+            base_url: Endpoint to query instead of ``BASE_URL``
+            instruments: Hooks notified of every search and HTTP attempt
+        """
+        self._log = logging.getLogger(self.__class__.__name__)
+
+        if credentials is not None and not isinstance(credentials, CredentialPool):
+            credentials = CredentialPool(credentials)
+        if credentials is None and (api_key is None or search_engine_id is None):
+            raise ValueError("either api_key and search_engine_id or credentials must be given")
+
+        self.api_key = api_key
+        self.search_engine_id = search_engine_id
+        self.credentials = credentials
+        self.lazy_parsing = lazy_parsing
+        self.coalesce = coalesce
+        self.base_url = base_url or self.BASE_URL
+        self.instruments = list(instruments or ())
+
+        self.cache = cache
+        self.cache_stats = CacheStats()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self._retrier = Retrier(retry_policy) if retry_policy is not None else None
+
+    @staticmethod
+    def _request_key(params: Dict[str, Any], projection: Optional[Projection] = None) -> str:
+        """Key identifying a request and the shape of its parsed response."""
+        if projection is not None:
+            params = {**params, "projection": projection.digest}
+        return make_cache_key(params)
+
+    def _cache_lookup(
+        self,
+        params: Dict[str, Any],
+        projection: Optional[Projection] = None
+    ) -> Tuple[Optional[str], Optional[GoogleSearchResponse]]:
+        """Return the cache key for a request and the cached response, if any."""
+        if self.cache is None:
+            return None, None
+
+        key = self._request_key(params, projection)
+        cached = self.cache.get(key)
+        if cached is None:
+            self.cache_stats.record_miss()
+        else:
+            self.cache_stats.record_hit()
+        return key, cached
+
+    def _new_event(
+        self,
+        query: str,
+        search_type: Optional[str],
+        start_index: int,
+        num_results: int
+    ) -> Optional[SearchEvent]:
+        """Start timing a search, or return None when nothing is listening."""
+        if not self.instruments:
+            return None
+        return SearchEvent(query, search_type, start_index, num_results)
+
+    def _begin_attempt(self, event: Optional[SearchEvent], credential: Optional[Credential]) -> Optional[AttemptEvent]:
+        if event is None:
+            return None
+        return AttemptEvent(
+            attempt=len(event.attempts) + 1,
+            started_at=time.time(),
+            credential=credential.label if credential is not None else None,
+        )
+
+    def _end_attempt(
+        self,
+        event: Optional[SearchEvent],
+        attempt: Optional[AttemptEvent],
+        response: Optional[TransportResponse] = None,
+        error: Optional[BaseException] = None
+    ) -> None:
+        if event is None:
+            return
+        attempt.finish(response, error)
+        event.attempts.append(attempt)
+        for instrument in self.instruments:
+            try:
+                instrument.on_attempt(event, attempt)
+            except Exception:
+                self._log.exception(f"Instrument {instrument!r} failed")
+
+    def _emit(self, event: Optional[SearchEvent], error: Optional[BaseException] = None) -> None:
+        """Finish a search event and hand it to every instrument."""
+        if event is None:
+            return
+        event.finish(error)
+        for instrument in self.instruments:
+            try:
+                instrument.on_search(event)
+            except Exception:
+                self._log.exception(f"Instrument {instrument!r} failed")
+
+    @classmethod
+    def _flight_key(
+        cls,
+        params: Dict[str, Any],
+        cache_key: Optional[str],
+        projection: Optional[Projection] = None
+    ) -> str:
+        """Key identifying identical requests for coalescing."""
+        return cache_key if cache_key is not None else cls._request_key(params, projection)
+
+    def _apply_credential(
+        self,
+        params: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Optional[Credential]]:
+        """Fill in the key and cx of the pool credential chosen for one attempt."""
+        if self.credentials is None:
+            return params, None
+
+        credential = self.credentials.acquire()
+        return {**params, "key": credential.api_key, "cx": credential.search_engine_id}, credential
+
+    def _record_credential(self, credential: Optional[Credential], response: TransportResponse) -> bool:
+        """Record a response against its credential; True if it ran out of quota."""
+        if credential is None:
+            return False
+
+        reset_at = quota_reset_time(response)
+        if reset_at is not None:
+            self._log.warning(f"Credential {credential.label} is out of quota; failing over")
+            self.credentials.mark_exhausted(credential, reset_at)
+            return True
+
+        if response.status_code >= 400:
+            self.credentials.record_error(credential)
+        return False
+
+    @staticmethod
+    def _validate_range(start_index: int, num_results: int) -> None:
+        """Check the paging arguments against the API limits."""
+        if start_index < 1:
+            raise ValueError("start_index must start from 1")
+
+        if not (1 <= num_results <= 10):
+            raise ValueError("num_results must be between 1 and 10")
+
+        if (start_index + num_results - 1) > 100:
+            raise ValueError("because of google JSON API policy, the sum of start_index and num_results must not exceed 100")
 
-from .parameters import *
-from .results import *
+    @staticmethod
+    def _start_index(start_index: int, parameters: Optional[SearchParameters]) -> int:
+        """
+        Index of the first result a request asks for.
+
+        An explicit start_index wins; parameters.start is only used when the
+        caller left start_index at its default.
+        """
+        if start_index == 1 and parameters is not None and parameters.start is not None:
+            return parameters.start
+        return start_index
+
+    def _parse_response(self, content: bytes, projection: Optional[Projection] = None) -> GoogleSearchResponse:
+        if projection is not None:
+            return projection.parse(content, self.lazy_parsing)
+        if self.lazy_parsing:
+            return LazySearchResponse.from_json(content)
+        return GoogleSearchResponse.from_json(content)
+
+    @staticmethod
+    def _to_web_results(response: GoogleSearchResponse, include_pagemap: bool = False) -> List[WebSearchResult]:
+        if isinstance(response, LazySearchResponse):
+            return response.web_results(include_pagemap)
+
+        if response.items is None or len(response.items) == 0:
+            return []
 
+        return [WebSearchResult.from_result(item, include_pagemap) for item in response.items]
 
-class GoogleCSE:
+    @staticmethod
+    def _to_image_results(response: GoogleSearchResponse) -> List[ImageSearchResult]:
+        if isinstance(response, LazySearchResponse):
+            return response.image_results()
+
+        if response.items is None or len(response.items) == 0:
+            return []
+
+        return [ImageSearchResult.from_result(item) for item in response.items]
+
+    def _build_params(
+        self,
+        query: str,
+        num_results: int,
+        search_type: Optional[Literal['image']],
+        parameters: Optional[SearchParameters],
+        start_index: int = 1,
+        projection: Optional[Projection] = None
+    ) -> Dict[str, Any]:
+        """Build the parameters dictionary for the API request."""
+        params = {
+            "key": self.api_key,
+            "cx": self.search_engine_id,
+            "q": query,
+            "num": num_results,
+        }
+
+        # With a credential pool, key and cx are filled in per attempt.
+        if self.credentials is not None:
+            del params["key"], params["cx"]
+
+        start = self._start_index(start_index, parameters)
+        if start != 1:  # 1 is the API default
+            params["start"] = start
+
+        if search_type:
+            if search_type not in ['image']:
+                raise ValueError("search_type must be 'image' or None")
+
+            params["searchType"] = search_type
+
+        if parameters:
+            params.update(parameters.compile().items)
+
+        if projection is not None and projection.partial_response:
+            params["fields"] = projection.api_fields
+
+        return params
+
+
+class GoogleCSE(BaseGoogleCSE):
     """
     A clean, type-safe client for Google Custom Search Engine API.
 
@@ -14,20 +287,70 @@ class GoogleCSE:
     using Google's Custom Search JSON API with full type safety via Pydantic models.
     """
 
-    BASE_URL = "https://customsearch.googleapis.com/customsearch/v1"
-
-    def __init__(self, api_key: str, search_engine_id: str):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        search_engine_id: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        transport_config: Optional[TransportConfig] = None,
+        cache: Optional[CacheBackend] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        credentials: Optional[Union[CredentialPool, Sequence[Credential]]] = None,
+        lazy_parsing: bool = False,
+        coalesce: bool = False,
+        base_url: Optional[str] = None,
+        instruments: Optional[Sequence[Instrument]] = None
+    ):
         """
         Initialize the Google CSE client.
 
         Args:
             api_key: Your Google API key
             search_engine_id: Your Programmable Search Engine ID
+            transport: HTTP transport to use; it is not closed by the client
+            transport_config: Settings for the pooled transport the client
+                creates when no transport is given
+            cache: Response cache (e.g. MemoryCache or SQLiteCache) consulted
+                before every request; hits are counted in ``cache_stats``
+            rate_limiter: Client-side quota limiter; requests it refuses raise
+                RateLimitExceeded
+            retry_policy: Retries transient failures with backoff and can
+                hedge slow requests; without it every failure is raised
+            credentials: Pool of (api_key, cx) credentials to spread requests
+                over instead of a single api_key/search_engine_id pair
+            lazy_parsing: Return LazySearchResponse views that validate
+                fields on first access instead of fully validated models
+            coalesce: While a request is in flight, identical searches from
+                other threads wait for it and share its response instead of
+                sending their own
+            base_url: Endpoint to query instead of the Custom Search API,
+                e.g. the ``url`` of a ``testing.FakeSearchServer``
+            instruments: Hooks (e.g. PrometheusInstrument) told about every
+                search and HTTP attempt with per-phase timings; nothing is
+                timed when there are none
         """
-        self._log = logging.getLogger(self.__class__.__name__)
+        super().__init__(
+            api_key, search_engine_id, cache, rate_limiter, retry_policy, credentials, lazy_parsing,
+            coalesce, base_url, instruments
+        )
 
-        self.api_key = api_key
-        self.search_engine_id = search_engine_id
+        self._flights = SingleFlight() if coalesce else None
+        self._owns_transport = transport is None
+        self.transport = transport or create_transport(transport_config)
+
+    def close(self) -> None:
+        """Release the connection pool owned by this client."""
+        if self._retrier is not None:
+            self._retrier.close()
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self) -> "GoogleCSE":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def raw_search(
         self,
@@ -35,8 +358,9 @@ class GoogleCSE:
         start_index: int = 1,
         num_results: int = 10,
         search_type: Optional[Literal['image']] = None,
-        parameters: Optional[SearchParameters] = None
-    ) -> GoogleSearchResponse:
+        parameters: Optional[SearchParameters] = None,
+        projection: Optional[Projection] = None
+    ) -> Union[GoogleSearchResponse, LazySearchResponse]:
         """
         Perform a raw search query returning full API response.
 
@@ -45,37 +369,115 @@ class GoogleCSE:
             num_results: Number of results to return (1-10)
             search_type: Type of search ("image" for image search, None for web)
             parameters: Search parameters object
+            projection: Keep only these result fields and pagemap paths,
+                and ask the API to send only them
 
         Returns:
             Dictionary containing full API response or None if error occurred
         """
-        if start_index < 1:
-            raise ValueError("start_index must start from 1")
+        start_index = self._start_index(start_index, parameters)
+        self._validate_range(start_index, num_results)
 
-        if not (1 <= num_results <= 10):
-            raise ValueError("num_results must be between 1 and 10")
+        event = self._new_event(query, search_type, start_index, num_results)
 
-        if (start_index + num_results - 1) > 100:
-            raise ValueError("because of google JSON API policy, the sum of start_index and num_results must not exceed 100")
+        params = self._build_params(query, num_results, search_type, parameters, start_index, projection)
+        if event is not None:
+            event.build_params = event.lap()
+
+        cache_key, cached = self._cache_lookup(params, projection)
+        if event is not None:
+            event.cache_lookup = event.lap()
+            event.cache_hit = cached is not None if self.cache is not None else None
+        if cached is not None:
+            self._emit(event)
+            return cached
+
+        try:
+            if self._flights is not None:
+                if event is not None:
+                    event.coalesced = True
+                key = self._flight_key(params, cache_key, projection)
+                search_response = self._flights.do(key, lambda: self._fetch(params, cache_key, event, projection))
+            else:
+                search_response = self._fetch(params, cache_key, event, projection)
+        except BaseException as e:
+            self._emit(event, e)
+            raise
 
-        params = self._build_params(query, num_results, search_type, parameters)
+        self._emit(event)
+        return search_response
 
+    def _fetch(
+        self,
+        params: Dict[str, Any],
+        cache_key: Optional[str],
+        event: Optional[SearchEvent] = None,
+        projection: Optional[Projection] = None
+    ) -> GoogleSearchResponse:
+        """Send a request (with retries), parse the response and cache it."""
+        if event is not None:
+            event.coalesced = False
         try:
-            response = requests.get(self.BASE_URL, params=params)
-            response.raise_for_status()
-            search_response = GoogleSearchResponse.from_dict(response.json())
+            if self._retrier is not None:
+                response = self._retrier.call(lambda: self._send(params, event))
+            else:
+                response = self._send(params, event)
+
+            if event is not None:
+                event.lap()
+            search_response = self._parse_response(response.content, projection)
+            if event is not None:
+                event.parse = event.lap()
+                event.response_bytes = len(response.content)
+
+            if cache_key is not None:
+                self.cache.set(cache_key, search_response)
             return search_response
 
         except requests.exceptions.RequestException as e:
             self._log.error(f"Search request failed: {e}")
             raise
 
+    def _send(self, params: Dict[str, Any], event: Optional[SearchEvent] = None) -> TransportResponse:
+        """Make a single rate-limited request attempt, failing over between credentials."""
+        attempts = len(self.credentials) if self.credentials is not None else 1
+        for _ in range(attempts):
+            # Credentials count a request as used, so only pick one once the
+            # limiter has let the request through.
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.take()
+                if wait > 0:
+                    raise RateLimitExceeded("client-side rate limit reached", retry_after=wait)
+
+            request_params, credential = self._apply_credential(params)
+
+            attempt = self._begin_attempt(event, credential)
+            try:
+                response = self.transport.get(self.base_url, params=request_params)
+            except requests.exceptions.RequestException as e:
+                self._end_attempt(event, attempt, error=e)
+                if credential is not None:
+                    self.credentials.record_error(credential)
+                raise
+            self._end_attempt(event, attempt, response)
+
+            if not self._record_credential(credential, response):
+                break
+        else:
+            if self.credentials is not None:
+                # Every attempt failed over; the last key is out of quota too.
+                raise self.credentials.quota_error()
+
+        response.raise_for_status()
+        return response
+
     def web_search(
         self,
         query: str,
         start_index: int = 1,
         num_results: int = 10,
-        parameters: Optional[WebSearchParameters] = None
+        parameters: Optional[WebSearchParameters] = None,
+        projection: Optional[Projection] = None
     ) -> List[WebSearchResult]:
         """
         Perform a web search and return simplified results.
@@ -85,6 +487,8 @@ class GoogleCSE:
             start_index: Number for starting index of result
             num_results: Number of results (1-10)
             parameters: Web search parameters
+            projection: Fields and pagemap paths to keep; results carry
+                the (projected) pagemap when it selects one
 
         Returns:
             List of WebSearchResult objects
@@ -94,14 +498,11 @@ class GoogleCSE:
             start_index=start_index,
             num_results=num_results,
             search_type=None,
-            parameters=parameters
+            parameters=parameters,
+            projection=projection
         )
 
-        if results.items is None or len(results.items) == 0:
-            return []
-
-        web_results = [WebSearchResult.from_result(item) for item in results.items]
-        return web_results
+        return self._to_web_results(results, projection is not None and projection.includes_pagemap)
 
     def image_search(
         self,
@@ -130,67 +531,159 @@ class GoogleCSE:
             parameters=parameters
         )
 
-        if results.items is None or len(results.items) == 0:
-            return []
+        return self._to_image_results(results)
+
+    def iter_pages(
+        self,
+        query: str,
+        max_results: int = MAX_RESULTS,
+        search_type: Optional[Literal['image']] = None,
+        parameters: Optional[SearchParameters] = None,
+        max_workers: Optional[int] = None
+    ) -> Iterator[GoogleSearchResponse]:
+        """
+        Fetch up to ``max_results`` results, yielding one response per page.
 
-        image_results = [ImageSearchResult.from_result(item) for item in results.items]
-        return image_results
+        The window starts at ``parameters.start`` if set, otherwise at 1.
 
-    def _build_params(
+        The first page is fetched on its own to learn the total result count;
+        the remaining pages are then requested concurrently and yielded in
+        order. Iteration stops early when a page has no ``queries.nextPage``
+        or the reported total is reached, and unstarted requests are cancelled.
+
+        Args:
+            query: Search query
+            max_results: Number of results to fetch (1-100)
+            search_type: Type of search ("image" for image search, None for web)
+            parameters: Search parameters shared by every page
+            max_workers: Maximum number of pages fetched at once
+                (defaults to all remaining pages)
+
+        Returns:
+            Iterator of GoogleSearchResponse objects, one per page
+        """
+        if not (1 <= max_results <= MAX_RESULTS):
+            raise ValueError(f"max_results must be between 1 and {MAX_RESULTS}")
+
+        first_index = self._start_index(1, parameters)
+        pages = plan_pages(max_results, first_index)
+        if not pages:
+            raise ValueError(f"parameters.start must be at most {MAX_RESULTS}")
+
+        start_index, num_results = pages[0]
+        first = self.raw_search(query, start_index, num_results, search_type, parameters)
+        yield first
+
+        if not has_next_page(first):
+            return
+
+        remaining = plan_pages(max_results, first_index, total_results(first))[1:]
+        if not remaining:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=max_workers or len(remaining))
+        futures = [
+            executor.submit(self.raw_search, query, start, num, search_type, parameters)
+            for start, num in remaining
+        ]
+        try:
+            for future in futures:
+                page = future.result()
+                yield page
+                if not page.items or not has_next_page(page):
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def search_all(
         self,
         query: str,
-        num_results: int,
-        search_type: Optional[Literal['image']],
-        parameters: Optional[SearchParameters]
-    ) -> Dict[str, Any]:
-        """Build the parameters dictionary for the API request."""
-        params = {
-            "key": self.api_key,
-            "cx": self.search_engine_id,
-            "q": query,
-            "num": num_results,
-        }
+        max_results: int = MAX_RESULTS,
+        search_type: Optional[Literal['image']] = None,
+        parameters: Optional[SearchParameters] = None,
+        max_workers: Optional[int] = None,
+        dedup: Optional[DedupIndex] = None
+    ) -> Iterator[Result]:
+        """
+        Stream every result item for a query across pages.
 
-        if search_type:
-            if search_type not in ['image']:
-                raise ValueError("search_type must be 'image' or None")
+        See ``iter_pages`` for how pages are fetched. With ``dedup``, results
+        already seen by the index (on earlier pages or in earlier searches)
+        are skipped; with lazy parsing they are dropped before validation.
 
-            params["searchType"] = search_type
+        Returns:
+            Iterator of Result objects in rank order
+        """
+        for page in self.iter_pages(query, max_results, search_type, parameters, max_workers):
+            if dedup is not None:
+                page = dedup.filter_response(page)
+            if page.items:
+                yield from page.items
 
-        if parameters:
-            # Map Pydantic model fields to API parameters
-            field_mapping = {
-                "c2coff": "c2coff",
-                "country": "cr",
-                "date_restrict": "dateRestrict",
-                "exact_terms": "exactTerms",
-                "exclude_terms": "excludeTerms",
-                "file_type": "fileType",
-                "filter": "filter",
-                "geolocation": "gl",
-                "high_range": "highRange",
-                "language": "hl",
-                "hq": "hq",
-                "link_site": "linkSite",
-                "low_range": "lowRange",
-                "language_restrict": "lr",
-                "or_terms": "orTerms",
-                "rights": "rights",
-                "safe": "safe",
-                "site_search": "siteSearch",
-                "site_search_filter": "siteSearchFilter",
-                "sort": "sort",
-                "start": "start",
-                # Image-specific parameters
-                "img_color_type": "imgColorType",
-                "img_dominant_color": "imgDominantColor",
-                "img_size": "imgSize",
-                "img_type": "imgType",
-            }
-
-            for field_name, api_name in field_mapping.items():
-                value = getattr(parameters, field_name, None)
-                if value is not None:
-                    params[api_name] = value
-
-        return params
\ No newline at end of file
+    def search_many(
+        self,
+        queries: Iterable[BatchQuery],
+        parameters: Optional[SearchParameters] = None,
+        search_type: Optional[Literal['image']] = None,
+        start_index: int = 1,
+        num_results: int = 10,
+        max_workers: int = 8,
+        ordered: bool = False,
+        max_pending: Optional[int] = None,
+        dedup: Optional[DedupIndex] = None,
+        compact: bool = False
+    ) -> Iterator[BatchResult]:
+        """
+        Run many searches on a bounded thread pool and stream the outcomes.
+
+        Queries are consumed lazily with at most ``max_pending`` in flight, so
+        memory stays flat on huge inputs. A failing query is reported in its
+        BatchResult instead of aborting the batch.
+
+        Args:
+            queries: Query strings, or (query, parameters) pairs to override
+                the shared parameters per query
+            parameters: Search parameters shared by every query
+            search_type: Type of search ("image" for image search, None for web)
+            start_index: Number for starting index of result
+            num_results: Number of results per query (1-10)
+            max_workers: Number of worker threads
+            ordered: Yield outcomes in input order instead of completion order
+            max_pending: Maximum searches queued or running at once
+                (defaults to twice max_workers)
+            dedup: Index used to drop results already returned for an
+                earlier query in the batch (or anywhere else it was used)
+            compact: Hold the simplified results in a columnar ResultBatch
+                (ImageResultBatch for image search) instead of a list of
+                models; cheapest together with lazy parsing
+
+        Returns:
+            Iterator of BatchResult objects holding the raw response and the
+            simplified web or image results
+        """
+        def normalize(entry: BatchQuery) -> Tuple[str, Optional[SearchParameters]]:
+            if isinstance(entry, str):
+                return entry, parameters
+            query, query_parameters = entry
+            return query, query_parameters if query_parameters is not None else parameters
+
+        def search(entry: Tuple[str, Optional[SearchParameters]]) -> GoogleSearchResponse:
+            query, query_parameters = entry
+            return self.raw_search(query, start_index, num_results, search_type, query_parameters)
+
+        if compact:
+            convert = ImageResultBatch.from_response if search_type == "image" else ResultBatch.from_response
+        else:
+            convert = self._to_image_results if search_type == "image" else self._to_web_results
+        outcomes = run_batch(search, map(normalize, queries), max_workers, ordered, max_pending)
+        for index, (query, query_parameters), response, error in outcomes:
+            if response is not None and dedup is not None:
+                response = dedup.filter_response(response)
+            yield BatchResult(
+                index=index,
+                query=query,
+                parameters=query_parameters,
+                response=response,
+                results=convert(response) if response is not None else [],
+                error=error,
+            )
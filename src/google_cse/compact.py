@@ -0,0 +1,170 @@
+from typing import NamedTuple, Optional, List, Iterator, Iterable, Union, Tuple
+
+import pydantic_core
+
+from .results import GoogleSearchResponse, LazySearchResponse, WebSearchResult, ImageSearchResult
+
+
+class CompactWebResult(NamedTuple):
+    """Tuple-sized counterpart of ``WebSearchResult``."""
+
+    title: Optional[str] = None
+    html_title: Optional[str] = None
+    link: Optional[str] = None
+    display_link: Optional[str] = None
+    snippet: Optional[str] = None
+    html_snippet: Optional[str] = None
+    formatted_url: Optional[str] = None
+
+    @staticmethod
+    def from_item(item: dict) -> "CompactWebResult":
+        """Build from a raw API result item (camelCase keys)."""
+        return CompactWebResult(
+            item.get("title"),
+            item.get("htmlTitle"),
+            item.get("link"),
+            item.get("displayLink"),
+            item.get("snippet"),
+            item.get("htmlSnippet"),
+            item.get("formattedUrl"),
+        )
+
+    def to_model(self) -> WebSearchResult:
+        return WebSearchResult(**self._asdict())
+
+
+class CompactImageResult(NamedTuple):
+    """Tuple-sized counterpart of ``ImageSearchResult``."""
+
+    title: Optional[str] = None
+    html_title: Optional[str] = None
+    link: Optional[str] = None
+    display_link: Optional[str] = None
+    snippet: Optional[str] = None
+    context_link: Optional[str] = None
+    image_height: Optional[int] = None
+    image_width: Optional[int] = None
+    image_byte_size: Optional[int] = None
+    thumbnail_link: Optional[str] = None
+    thumbnail_height: Optional[int] = None
+    thumbnail_width: Optional[int] = None
+
+    @staticmethod
+    def from_item(item: dict) -> "CompactImageResult":
+        """Build from a raw API result item (camelCase keys)."""
+        image = item.get("image") or {}
+        return CompactImageResult(
+            item.get("title"),
+            item.get("htmlTitle"),
+            item.get("link"),
+            item.get("displayLink"),
+            item.get("snippet"),
+            image.get("contextLink"),
+            image.get("height"),
+            image.get("width"),
+            image.get("byteSize"),
+            image.get("thumbnailLink"),
+            image.get("thumbnailHeight"),
+            image.get("thumbnailWidth"),
+        )
+
+    def to_model(self) -> ImageSearchResult:
+        return ImageSearchResult(**self._asdict())
+
+
+class _ColumnarBatch:
+    """Stores one list per field instead of one object per result."""
+
+    ROW = CompactWebResult
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, rows: Iterable[tuple] = ()):
+        self._columns: Tuple[list, ...] = tuple([] for _ in self.ROW._fields)
+        self.extend_rows(rows)
+
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]):
+        """Build a batch straight from a raw response body."""
+        batch = cls()
+        batch.add_response(pydantic_core.from_json(data))
+        return batch
+
+    @classmethod
+    def from_response(cls, response: Union[GoogleSearchResponse, LazySearchResponse, dict]):
+        """Build a batch from a response, e.g. one returned by ``raw_search``."""
+        batch = cls()
+        batch.add_response(response)
+        return batch
+
+    def add_response(self, response: Union[GoogleSearchResponse, LazySearchResponse, dict]) -> None:
+        """
+        Append the items of a response.
+
+        Lazy responses and raw (camelCase) response dicts are read without
+        validating their items; validated responses are dumped back to
+        camelCase item by item.
+        """
+        if isinstance(response, LazySearchResponse):
+            items = response.raw.get("items") or []
+        elif isinstance(response, GoogleSearchResponse):
+            items = [item.to_dict() for item in response.items or []]
+        else:
+            items = response.get("items") or []
+        self.extend_rows(self.ROW.from_item(item) for item in items)
+
+    def extend_rows(self, rows: Iterable[tuple]) -> None:
+        columns = self._columns
+        for row in rows:
+            for column, value in zip(columns, row):
+                column.append(value)
+
+    def extend(self, other: "_ColumnarBatch") -> None:
+        for column, values in zip(self._columns, other._columns):
+            column.extend(values)
+
+    def column(self, name: str) -> list:
+        """Return the list holding one field for every result."""
+        return self._columns[self.ROW._fields.index(name)]
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def __getitem__(self, index: int):
+        return self.ROW._make(column[index] for column in self._columns)
+
+    def __iter__(self) -> Iterator[tuple]:
+        return map(self.ROW._make, zip(*self._columns))
+
+
+class ResultBatch(_ColumnarBatch):
+    """
+    Columnar store of web results.
+
+    Titles, links, snippets and so on are kept in parallel lists, which
+    costs a fraction of the memory of one ``WebSearchResult`` per row.
+    Rows come back as ``CompactWebResult`` tuples.
+
+    Example:
+        batch = ResultBatch.from_response(client.raw_search("python"))
+        links = batch.column("link")
+        first = batch[0].to_model()
+    """
+
+    ROW = CompactWebResult
+
+    __slots__ = ()
+
+    def to_models(self) -> List[WebSearchResult]:
+        return [row.to_model() for row in self]
+
+
+class ImageResultBatch(_ColumnarBatch):
+    """Columnar store of image results; rows are ``CompactImageResult`` tuples."""
+
+    ROW = CompactImageResult
+
+    __slots__ = ()
+
+    def to_models(self) -> List[ImageSearchResult]:
+        return [row.to_model() for row in self]
@@ -0,0 +1,206 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Optional, List, Sequence, Dict
+
+from pydantic import BaseModel, Field
+
+from .exceptions import QuotaExhausted
+from .ratelimit import next_quota_reset
+from .transport import TransportResponse
+
+
+# Reasons Google reports when a key has run out of quota.
+QUOTA_REASONS = {"rateLimitExceeded", "userRateLimitExceeded", "dailyLimitExceeded", "quotaExceeded"}
+
+# How long a key sits out after hitting a per-minute limit.
+SHORT_COOLDOWN = 60.0
+
+
+class Credential(BaseModel):
+    """An API key and the search engine it queries."""
+
+    api_key: str = Field(description="Google API key")
+    search_engine_id: str = Field(description="Programmable Search Engine ID (cx)")
+    daily_budget: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Requests this key may make per quota day"
+    )
+    name: Optional[str] = Field(
+        default=None,
+        description="Label used in usage reports and metrics instead of the key"
+    )
+
+    @property
+    def label(self) -> str:
+        """The name, or an id derived from a hash of the key that reveals none of it."""
+        return self.name or "key-" + hashlib.sha256(self.api_key.encode("utf-8")).hexdigest()[:8]
+
+
+class CredentialUsage:
+    """Usage counters for one credential."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.quota_errors = 0
+        self.used_today = 0
+        self.day_resets_at = next_quota_reset()
+        self.exhausted_until: Optional[float] = None
+
+
+def quota_reset_time(response: TransportResponse, now: Optional[float] = None) -> Optional[float]:
+    """
+    Detect a quota-exceeded response and return when the key is usable again.
+
+    Returns:
+        Timestamp at which to put the key back in rotation, or None if the
+        response is not a quota error
+    """
+    if response.status_code not in (403, 429):
+        return None
+
+    now = time.time() if now is None else now
+    try:
+        error = json.loads(response.content).get("error", {})
+    except (ValueError, AttributeError):
+        error = {}
+
+    reasons = {e.get("reason") for e in error.get("errors") or [] if isinstance(e, dict)}
+    message = str(error.get("message", "")).lower()
+
+    if response.status_code == 403 and not reasons & QUOTA_REASONS:
+        return None
+    if "dailyLimitExceeded" in reasons or "per day" in message:
+        return next_quota_reset(now)
+    return now + SHORT_COOLDOWN
+
+
+class CredentialPool:
+    """
+    A set of (api_key, cx) credentials shared by one client.
+
+    Each request uses the available credential with the most remaining daily
+    budget (or the least used one when no budget is set). Credentials that
+    hit quota errors sit out of rotation until their quota resets, and the
+    request fails over to the next credential.
+
+    Credentials in one pool are assumed to search equivalent engines, so
+    cached responses are shared between them.
+
+    Example:
+        pool = CredentialPool([
+            Credential(api_key="KEY_1", search_engine_id="CX", daily_budget=10000),
+            Credential(api_key="KEY_2", search_engine_id="CX", daily_budget=10000),
+        ])
+        client = GoogleCSE(credentials=pool)
+    """
+
+    def __init__(self, credentials: Sequence[Credential]):
+        if not credentials:
+            raise ValueError("a credential pool needs at least one credential")
+
+        self._lock = threading.Lock()
+        self.credentials: List[Credential] = list(credentials)
+        self._usage: Dict[int, CredentialUsage] = {id(c): CredentialUsage() for c in self.credentials}
+
+    def __len__(self) -> int:
+        return len(self.credentials)
+
+    def acquire(self) -> Credential:
+        """
+        Pick the credential for the next request and count it as used.
+
+        Raises:
+            QuotaExhausted: If every credential is out of rotation
+        """
+        now = time.time()
+        with self._lock:
+            best, best_score = None, None
+            for credential in self.credentials:
+                usage = self._refresh(credential, now)
+                if usage.exhausted_until is not None:
+                    continue
+
+                if credential.daily_budget is None:
+                    score = (1, -usage.used_today)
+                else:
+                    score = (0, credential.daily_budget - usage.used_today)
+                if best_score is None or score > best_score:
+                    best, best_score = credential, score
+
+            if best is None:
+                raise self._quota_error(now)
+
+            usage = self._usage[id(best)]
+            usage.requests += 1
+            usage.used_today += 1
+            return best
+
+    def quota_error(self) -> QuotaExhausted:
+        """The error raised once every credential has run out of quota."""
+        with self._lock:
+            return self._quota_error(time.time())
+
+    def _quota_error(self, now: float) -> QuotaExhausted:
+        retry_at = min(
+            (self._usage[id(c)].exhausted_until for c in self.credentials
+             if self._usage[id(c)].exhausted_until is not None),
+            default=now,
+        )
+        return QuotaExhausted(
+            "every credential in the pool is out of quota",
+            retry_after=max(0.0, retry_at - now),
+        )
+
+    def record_error(self, credential: Credential) -> None:
+        with self._lock:
+            self._usage[id(credential)].errors += 1
+
+    def mark_exhausted(self, credential: Credential, until: Optional[float] = None) -> None:
+        """Take a credential out of rotation until ``until`` (default: next quota reset)."""
+        with self._lock:
+            usage = self._usage[id(credential)]
+            usage.quota_errors += 1
+            usage.exhausted_until = until if until is not None else next_quota_reset()
+
+    def usage(self) -> List[dict]:
+        """Return a usage report with one entry per credential."""
+        now = time.time()
+        with self._lock:
+            report = []
+            for credential in self.credentials:
+                usage = self._refresh(credential, now)
+                report.append({
+                    "credential": credential.label,
+                    "search_engine_id": credential.search_engine_id,
+                    "requests": usage.requests,
+                    "errors": usage.errors,
+                    "quota_errors": usage.quota_errors,
+                    "used_today": usage.used_today,
+                    "remaining_today": (
+                        max(0, credential.daily_budget - usage.used_today)
+                        if credential.daily_budget is not None else None
+                    ),
+                    "exhausted_until": usage.exhausted_until,
+                })
+            return report
+
+    def _refresh(self, credential: Credential, now: float) -> CredentialUsage:
+        """Apply daily resets and expired cooldowns; call with the lock held."""
+        usage = self._usage[id(credential)]
+        if now >= usage.day_resets_at:
+            usage.used_today = 0
+            usage.day_resets_at = next_quota_reset(now)
+
+        if usage.exhausted_until is not None and now >= usage.exhausted_until:
+            usage.exhausted_until = None
+        if (
+            usage.exhausted_until is None
+            and credential.daily_budget is not None
+            and usage.used_today >= credential.daily_budget
+        ):
+            usage.exhausted_until = usage.day_resets_at
+        return usage
@@ -0,0 +1,279 @@
+import hashlib
+import math
+import re
+import threading
+from typing import Optional, Dict, List, Iterable, Iterator, Any, TypeVar, Union
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+from .results import GoogleSearchResponse, LazySearchResponse
+
+T = TypeVar("T")
+
+# Query parameters that only track where a click came from.
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid", "yclid", "igshid", "twclid",
+    "mc_cid", "mc_eid", "_ga", "_gl", "_hsenc", "_hsmi", "ref_src", "spm", "srsltid",
+})
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_WORD = re.compile(r"\w+", re.UNICODE)
+_MASK64 = (1 << 64) - 1
+
+
+def canonical_url(url: str) -> str:
+    """
+    Reduce a URL to a key that is equal for trivially different copies.
+
+    The scheme, ``www.`` prefix, default port, fragment, trailing slash,
+    tracking parameters (``utm_*``, ``gclid``, ...) and query parameter
+    order are ignored; the host is lowercased. The result identifies the
+    page and is not meant to be fetched.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url.strip()
+
+    host = (parts.hostname or "").rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    if ":" in host:
+        host = f"[{host}]"
+    if port is not None and port != _DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = [
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith("utm_") and name.lower() not in TRACKING_PARAMS
+    ]
+    key = host + path
+    if query:
+        key += "?" + urlencode(sorted(query))
+    return key
+
+
+def _digest(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest(), "little")
+
+
+class BloomFilter:
+    """
+    Fixed-size probabilistic set.
+
+    Never reports an added key as new; reports a new key as already seen
+    with probability ``error_rate`` once ``capacity`` keys have been added.
+    Memory is about ``-capacity * ln(error_rate) / ln(2)^2`` bits.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not (0 < error_rate < 1):
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, digest: int) -> Iterator[int]:
+        # Double hashing: position_i = h1 + i * h2.
+        h1, h2 = digest & 0xFFFFFFFFFFFFFFFF, (digest >> 64) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add_digest(self, digest: int) -> bool:
+        """Add a key's digest; True if it was not (probably) present."""
+        added = False
+        bits = self._bits
+        for position in self._positions(digest):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+        return added
+
+    def add(self, key: str) -> bool:
+        return self.add_digest(_digest(key))
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(_digest(key)))
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """
+    64-bit SimHash of the character shingles of ``text``.
+
+    Texts that share most of their shingles get hashes a few bits apart,
+    so near-duplicate snippets can be found by Hamming distance. Case,
+    punctuation and runs of whitespace are ignored. Shingles are hashed
+    with Python's string hash, so values are only comparable within one
+    process.
+    """
+    normalized = " ".join(_WORD.findall(text.lower()))
+    shingles = {normalized[i:i + shingle_size] for i in range(max(1, len(normalized) - shingle_size + 1))}
+
+    # Count, for each of the 64 bits, how many shingle hashes have it set.
+    # The counters are bit-sliced (planes[k] holds bit k of all 64 counts),
+    # so adding a hash is a short ripple-carry instead of 64 increments.
+    planes: List[int] = []
+    for shingle in shingles:
+        carry = hash(shingle) & _MASK64
+        for k, plane in enumerate(planes):
+            planes[k] = plane ^ carry
+            carry &= plane
+            if not carry:
+                break
+        if carry:
+            planes.append(carry)
+
+    # Set the bits whose count exceeds half the shingles, comparing all 64
+    # counters with the threshold at once from the most significant plane.
+    threshold = len(shingles) // 2
+    greater, equal = 0, _MASK64
+    for k in range(max(len(planes), threshold.bit_length()) - 1, -1, -1):
+        plane = planes[k] if k < len(planes) else 0
+        limit = _MASK64 if threshold >> k & 1 else 0
+        greater |= equal & plane & ~limit
+        equal &= ~(plane ^ limit) & _MASK64
+    return greater
+
+
+class _SimHashIndex:
+    """
+    Finds stored SimHashes within ``max_distance`` bits of a query hash.
+
+    The 64 bits are split into ``max_distance + 1`` bands; by pigeonhole,
+    two hashes that close agree exactly on at least one band, so only
+    hashes sharing a band are compared.
+    """
+
+    def __init__(self, max_distance: int):
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        width = 64 // bands
+        self._bands = [(i * width, width if i < bands - 1 else 64 - i * width) for i in range(bands)]
+        self._tables: List[Dict[int, List[int]]] = [{} for _ in self._bands]
+
+    def add_if_new(self, value: int) -> bool:
+        """Store ``value`` unless a near-duplicate is already stored."""
+        keys = [(value >> shift) & ((1 << width) - 1) for shift, width in self._bands]
+        for table, key in zip(self._tables, keys):
+            for other in table.get(key, ()):
+                if (value ^ other).bit_count() <= self.max_distance:
+                    return False
+        for table, key in zip(self._tables, keys):
+            table.setdefault(key, []).append(value)
+        return True
+
+
+def _get(item: Any, name: str, alias: str) -> Optional[str]:
+    if isinstance(item, dict):
+        return item.get(alias)
+    return getattr(item, name, None)
+
+
+class DedupIndex:
+    """
+    Incremental index of results already seen across pages and queries.
+
+    A result is a duplicate when its canonical link (see ``canonical_url``)
+    was seen before, or, with ``near_duplicates``, when its snippet's
+    SimHash is within ``max_distance`` bits of an earlier one. Links are
+    kept as 128-bit digests in a set, or in a ``BloomFilter`` of fixed size
+    when ``capacity`` is given.
+
+    Results can be raw API item dicts or any result object with ``link``
+    and ``snippet`` attributes. Filtering a ``LazySearchResponse`` drops
+    duplicates before their items are ever validated.
+
+    Example:
+        index = DedupIndex()
+        for result in client.search_all("python", dedup=index):
+            ...
+    """
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        error_rate: float = 0.001,
+        near_duplicates: bool = False,
+        max_distance: int = 5
+    ):
+        """
+        Args:
+            capacity: Expected number of unique links; bounds memory by using
+                a Bloom filter instead of an exact set
+            error_rate: Bloom filter false-positive rate at ``capacity``
+            near_duplicates: Also drop results whose snippet nearly matches
+                an earlier one
+            max_distance: SimHash bit distance at or below which snippets
+                count as near-duplicates; lookups compare against every
+                snippet sharing one of ``max_distance + 1`` hash bands
+        """
+        if not (0 <= max_distance < 32):
+            raise ValueError("max_distance must be between 0 and 31")
+
+        self._lock = threading.Lock()
+        self._links: Union[set, BloomFilter] = BloomFilter(capacity, error_rate) if capacity else set()
+        self._snippets = _SimHashIndex(max_distance) if near_duplicates else None
+
+        self.unique = 0
+        self.duplicates = 0
+        self.near_duplicates = 0
+
+    def add(self, item: Any) -> bool:
+        """Record a result; True if it is new, False if it is a duplicate."""
+        link = _get(item, "link", "link")
+        snippet = _get(item, "snippet", "snippet") if self._snippets is not None else None
+        digest = _digest(canonical_url(link)) if link else None
+        fingerprint = simhash(snippet) if snippet else None
+
+        with self._lock:
+            if digest is not None:
+                if isinstance(self._links, set):
+                    new = digest not in self._links
+                    self._links.add(digest)
+                else:
+                    new = self._links.add_digest(digest)
+                if not new:
+                    self.duplicates += 1
+                    return False
+
+            if fingerprint is not None and not self._snippets.add_if_new(fingerprint):
+                self.near_duplicates += 1
+                return False
+
+            self.unique += 1
+            return True
+
+    def filter(self, items: Iterable[T]) -> Iterator[T]:
+        """Yield only the items not seen before."""
+        for item in items:
+            if self.add(item):
+                yield item
+
+    def filter_response(
+        self,
+        response: Union[GoogleSearchResponse, LazySearchResponse]
+    ) -> Union[GoogleSearchResponse, LazySearchResponse]:
+        """Return a copy of ``response`` without the duplicate items."""
+        if isinstance(response, LazySearchResponse):
+            items = response.raw.get("items")
+            if not items:
+                return response
+            return LazySearchResponse({**response.raw, "items": list(self.filter(items))})
+
+        if not response.items:
+            return response
+        return response.model_copy(update={"items": list(self.filter(response.items))})
+
+    def stats(self) -> Dict[str, int]:
+        return {"unique": self.unique, "duplicates": self.duplicates, "near_duplicates": self.near_duplicates}
@@ -0,0 +1,21 @@
+from typing import Optional
+
+
+class GoogleCSEError(Exception):
+    """Base class for errors raised by google-cse itself."""
+
+
+class RateLimitExceeded(GoogleCSEError):
+    """The client-side rate limiter refused to issue a request."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class QuotaExhausted(GoogleCSEError):
+    """Every credential in the pool is out of quota."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,374 @@
+import json
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Union, IO
+
+from .batch import BatchResult
+from .pagination import total_results
+from .results import GoogleSearchResponse, LazySearchResponse, Result, WebSearchResult, ImageSearchResult
+
+# Columns of every exported row, in order.
+ROW_FIELDS = (
+    "query",
+    "search_type",
+    "rank",
+    "total_results",
+    "title",
+    "link",
+    "display_link",
+    "snippet",
+    "formatted_url",
+    "mime",
+    "file_format",
+    "context_link",
+    "image_height",
+    "image_width",
+    "image_byte_size",
+    "thumbnail_link",
+)
+
+ResultItem = Union[Result, WebSearchResult, ImageSearchResult]
+Exportable = Union[GoogleSearchResponse, LazySearchResponse, BatchResult, ResultItem]
+
+
+def _item_row(item: dict) -> Dict[str, Any]:
+    """Result columns from a raw (camelCase) API item."""
+    image = item.get("image") or {}
+    return {
+        "title": item.get("title"),
+        "link": item.get("link"),
+        "display_link": item.get("displayLink"),
+        "snippet": item.get("snippet"),
+        "formatted_url": item.get("formattedUrl"),
+        "mime": item.get("mime"),
+        "file_format": item.get("fileFormat"),
+        "context_link": image.get("contextLink"),
+        "image_height": image.get("height"),
+        "image_width": image.get("width"),
+        "image_byte_size": image.get("byteSize"),
+        "thumbnail_link": image.get("thumbnailLink"),
+        "pagemap": item.get("pagemap"),
+    }
+
+
+def _result_row(result: Result) -> Dict[str, Any]:
+    """Result columns from a validated ``Result``."""
+    image = result.image
+    return {
+        "title": result.title,
+        "link": result.link,
+        "display_link": result.display_link,
+        "snippet": result.snippet,
+        "formatted_url": result.formatted_url,
+        "mime": result.mime,
+        "file_format": result.file_format,
+        "context_link": image.context_link if image else None,
+        "image_height": image.height if image else None,
+        "image_width": image.width if image else None,
+        "image_byte_size": image.byte_size if image else None,
+        "thumbnail_link": image.thumbnail_link if image else None,
+        "pagemap": result.pagemap,
+    }
+
+
+def _simple_row(result: Union[WebSearchResult, ImageSearchResult]) -> Dict[str, Any]:
+    """Result columns from a ``WebSearchResult`` or ``ImageSearchResult``."""
+    row = {name: getattr(result, name, None) for name in ROW_FIELDS[4:]}
+    row["pagemap"] = getattr(result, "pagemap", None)
+    return row
+
+
+def result_row(result: ResultItem, query: Optional[str] = None, rank: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Flatten one result into a row like those of ``response_rows``.
+
+    Results do not know their query, rank or total result count, so the
+    caller supplies the first two and the total is left empty. Results
+    with image metadata are recorded as image results.
+
+    Args:
+        result: ``Result`` (e.g. from ``search_all``), ``WebSearchResult``
+            or ``ImageSearchResult``
+        query: Query the result was returned for
+        rank: 1-based rank of the result
+    """
+    if isinstance(result, Result):
+        columns, image = _result_row(result), result.image is not None
+    else:
+        columns, image = _simple_row(result), isinstance(result, ImageSearchResult)
+    row = {"query": query, "search_type": "image" if image else "web", "rank": rank, "total_results": None}
+    row.update(columns)
+    return row
+
+
+def response_rows(
+    response: Union[GoogleSearchResponse, LazySearchResponse],
+    query: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Flatten a response into one row per result.
+
+    Each row carries the query, search type and 1-based rank from the
+    response's ``queries.request`` entry and the total result count from
+    its ``searchInformation``, followed by the
+    result columns in ``ROW_FIELDS`` and the raw ``pagemap``. Lazy
+    responses are read straight from their raw items without validation.
+
+    Args:
+        response: Response to flatten
+        query: Query to record when the response does not echo it
+    """
+    request = response.queries.request[0] if response.queries and response.queries.request else None
+    if request is not None:
+        query = request.search_terms or query
+        search_type = request.search_type or "web"
+        first_rank = request.start_index or 1
+    else:
+        search_type, first_rank = "web", 1
+    total = total_results(response)
+
+    if isinstance(response, LazySearchResponse):
+        items, build = response.raw.get("items") or [], _item_row
+    else:
+        items, build = response.items or [], _result_row
+
+    for position, item in enumerate(items):
+        row = {"query": query, "search_type": search_type, "rank": first_rank + position, "total_results": total}
+        row.update(build(item))
+        yield row
+
+
+class ResultWriter:
+    """
+    Base class for streaming result exporters.
+
+    Writers accept responses and ``BatchResult`` objects as they arrive, so
+    they can sit directly behind ``search_many``, ``iter_pages`` or
+    ``gather``; failed batch entries are counted and skipped. Single
+    results (from ``search_all``, ``web_search`` or ``image_search``) are
+    accepted too, with their rank given by the caller. Subclasses
+    implement ``write_rows``, ``flush`` and ``close``.
+    """
+
+    def __init__(self, include_pagemap: bool = False):
+        self.include_pagemap = include_pagemap
+        self.rows_written = 0
+        self.errors_skipped = 0
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        raise NotImplementedError
+
+    def write(self, item: Exportable, query: Optional[str] = None, rank: Optional[int] = None) -> None:
+        """
+        Export the results of one response or batch outcome, or one result.
+
+        Args:
+            item: Response, BatchResult or single result
+            query: Query to record when the item does not carry it
+            rank: 1-based rank of a single result
+        """
+        if isinstance(item, (Result, WebSearchResult, ImageSearchResult)):
+            self.write_rows([result_row(item, query, rank)])
+            return
+        if isinstance(item, BatchResult):
+            if item.response is None:
+                self.errors_skipped += 1
+                return
+            query, item = item.query, item.response
+        self.write_rows(response_rows(item, query))
+
+    def write_all(self, items: Iterable[Exportable], query: Optional[str] = None, first_rank: int = 1) -> None:
+        """
+        Export every item of an iterable.
+
+        Single results are ranked in the order they arrive, starting at
+        ``first_rank``.
+
+        Example:
+            writer.write_all(client.search_all("python"), query="python")
+        """
+        for _ in self.tee(items, query, first_rank):
+            pass
+
+    def tee(self, items: Iterable[Exportable], query: Optional[str] = None, first_rank: int = 1) -> Iterator[Exportable]:
+        """Export items while passing them on, as one stage of a pipeline."""
+        rank = first_rank
+        for item in items:
+            if isinstance(item, (Result, WebSearchResult, ImageSearchResult)):
+                self.write(item, query, rank)
+                rank += 1
+            else:
+                self.write(item, query)
+            yield item
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class NDJSONWriter(ResultWriter):
+    """
+    Writes one JSON object per result line (NDJSON).
+
+    Encoded lines are buffered up to ``buffer_bytes`` and then written in
+    one call, so memory stays bounded however long the run.
+
+    Example:
+        with NDJSONWriter("results.ndjson") as writer:
+            writer.write_all(client.search_many(queries))
+    """
+
+    def __init__(
+        self,
+        path_or_file: Union[str, IO[str]],
+        buffer_bytes: int = 1 << 20,
+        include_pagemap: bool = False
+    ):
+        """
+        Args:
+            path_or_file: Path to create (appended to if it exists) or an open
+                text file, which is not closed by the writer
+            buffer_bytes: Approximate size of encoded rows to buffer before
+                writing
+            include_pagemap: Add each result's raw pagemap to its row
+        """
+        super().__init__(include_pagemap)
+        if buffer_bytes < 1:
+            raise ValueError("buffer_bytes must be positive")
+
+        self._owns_file = isinstance(path_or_file, str)
+        self._file = open(path_or_file, "a", encoding="utf-8") if self._owns_file else path_or_file
+        self.buffer_bytes = buffer_bytes
+        self._buffer: List[str] = []
+        self._buffered = 0
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        for row in rows:
+            if not self.include_pagemap:
+                del row["pagemap"]
+            line = json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n"
+            self._buffer.append(line)
+            self._buffered += len(line)
+            self.rows_written += 1
+            if self._buffered >= self.buffer_bytes:
+                self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._file.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for ParquetWriter; install it with 'pip install google-cse[parquet]'"
+        ) from e
+    return pyarrow
+
+
+class ParquetWriter(ResultWriter):
+    """
+    Writes results to a Parquet file, one row group at a time.
+
+    Rows are collected column-wise and flushed as a row group every
+    ``row_group_size`` rows, so at most one row group is held in memory.
+    ``pagemap`` is stored as a JSON string column when included.
+
+    Example:
+        with ParquetWriter("results.parquet") as writer:
+            for page in writer.tee(client.iter_pages("python")):
+                ...
+    """
+
+    def __init__(
+        self,
+        path: str,
+        row_group_size: int = 10000,
+        compression: str = "zstd",
+        include_pagemap: bool = False
+    ):
+        """
+        Args:
+            path: Parquet file to create (overwritten if it exists)
+            row_group_size: Rows per row group
+            compression: Parquet compression codec
+            include_pagemap: Add each result's pagemap as a JSON string column
+        """
+        super().__init__(include_pagemap)
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be positive")
+
+        pa = _import_pyarrow()
+        self._pa = pa
+        self.path = path
+        self.row_group_size = row_group_size
+
+        fields = [
+            pa.field("query", pa.string()),
+            pa.field("search_type", pa.string()),
+            pa.field("rank", pa.int32()),
+            pa.field("total_results", pa.int64()),
+        ]
+        fields += [pa.field(name, pa.string()) for name in ROW_FIELDS[4:11]]
+        fields += [
+            pa.field("context_link", pa.string()),
+            pa.field("image_height", pa.int32()),
+            pa.field("image_width", pa.int32()),
+            pa.field("image_byte_size", pa.int64()),
+            pa.field("thumbnail_link", pa.string()),
+        ]
+        if include_pagemap:
+            fields.append(pa.field("pagemap", pa.string()))
+        self.schema = pa.schema(fields)
+
+        self._columns: Dict[str, list] = {name: [] for name in self.schema.names}
+        self._pending = 0
+        self._writer = pa.parquet.ParquetWriter(path, self.schema, compression=compression)
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        columns = self._columns
+        for row in rows:
+            if self.include_pagemap and row["pagemap"] is not None:
+                row["pagemap"] = json.dumps(row["pagemap"], ensure_ascii=False)
+            for name, column in columns.items():
+                column.append(row[name])
+            self._pending += 1
+            self.rows_written += 1
+            if self._pending >= self.row_group_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered rows as one row group."""
+        if not self._pending:
+            return
+        table = self._pa.Table.from_pydict(self._columns, schema=self.schema)
+        self._writer.write_table(table, row_group_size=self._pending)
+        for column in self._columns.values():
+            column.clear()
+        self._pending = 0
+
+    def close(self) -> None:
+        if self._writer is None:
+            return
+        self.flush()
+        self._writer.close()
+        self._writer = None
@@ -0,0 +1,372 @@
+import heapq
+import itertools
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Iterable, Tuple, Union, Literal, Deque
+
+from pydantic import BaseModel, Field
+
+from .client import GoogleCSE
+from .dedup import canonical_url
+from .pagination import MAX_RESULTS, has_next_page, plan_pages, total_results
+from .parameters import WebSearchParameters
+from .results import GoogleSearchResponse, WebSearchResult
+
+
+class FusionConfig(BaseModel):
+    """Settings for ``RankFusion``."""
+
+    top_k: int = Field(
+        default=10,
+        ge=1,
+        description="Number of merged results returned"
+    )
+    method: Literal["rrf", "linear"] = Field(
+        default="rrf",
+        description="Score of a result at a rank: 'rrf' is weight / (rrf_k + rank), 'linear' falls from weight at rank 1 to 0 past max_results"
+    )
+    rrf_k: float = Field(
+        default=60.0,
+        ge=0,
+        description="Rank offset of reciprocal rank fusion; larger values flatten the curve"
+    )
+    max_results: int = Field(
+        default=MAX_RESULTS,
+        ge=1,
+        le=MAX_RESULTS,
+        description="Deepest rank read from any source"
+    )
+    exact_order: bool = Field(
+        default=False,
+        description="Keep fetching until the order within the top-k is final, not only its membership"
+    )
+    lookahead: int = Field(
+        default=1,
+        ge=0,
+        description="Pages of each source requested ahead of the one being merged; more is faster but wastes up to that many requests per source when the merge stops early"
+    )
+    max_workers: int = Field(
+        default=8,
+        ge=1,
+        description="Number of page requests in flight at once"
+    )
+
+
+@dataclass
+class FusionSource:
+    """
+    One ranked stream to merge: a query, optionally against another engine.
+
+    Use a ``client`` configured with another ``search_engine_id`` to merge
+    results from several engines.
+    """
+
+    query: str
+    parameters: Optional[WebSearchParameters] = None
+    weight: float = 1.0
+    client: Optional[GoogleCSE] = None
+
+
+@dataclass
+class FusedResult:
+    """A merged result, its fused score and its rank in each source."""
+
+    result: WebSearchResult
+    score: float
+    ranks: Dict[int, int] = field(default_factory=dict)
+
+
+@dataclass
+class FusionOutcome:
+    """Merged top-k and what it took to get there."""
+
+    results: List[FusedResult]
+    pages_fetched: int = 0
+    settled: bool = False
+    errors: Dict[int, str] = field(default_factory=dict)
+
+
+class FusionRanking:
+    """
+    Incremental top-k of results fused from several ranked streams.
+
+    Results are fed in rank order per source with ``add``, and each source
+    reports how deep it has been read with ``advance`` (or ``exhaust``).
+    Every result's score is the sum of its sources' rank contributions, so
+    a result's score can only grow, by at most the contribution of each
+    source's next unread rank. ``settled`` compares those bounds: once no
+    result outside the top-k (seen or not) can overtake it, reading further
+    cannot change the answer.
+
+    Only the top-k results are kept; other links are reduced to their
+    score and their rank in each source that reported them. Results are matched
+    across sources by ``canonical_url``.
+    """
+
+    def __init__(self, weights: List[float], config: Optional[FusionConfig] = None):
+        """
+        Args:
+            weights: Weight of each source, by source index
+            config: Scoring and top-k settings
+        """
+        self.config = config or FusionConfig()
+        self.weights = list(weights)
+        self._next_rank = [1] * len(self.weights)
+        self._exhausted = [False] * len(self.weights)
+
+        # canonical URL -> [score, bitmask of sources that reported it, {source: rank}]
+        self._scores: Dict[str, List] = {}
+        self._top: Dict[str, FusedResult] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+
+    def contribution(self, source: int, rank: int) -> float:
+        """Score a result at ``rank`` (1-based) in ``source`` gets."""
+        weight = self.weights[source]
+        if self.config.method == "rrf":
+            return weight / (self.config.rrf_k + rank)
+        return weight * max(0, self.config.max_results + 1 - rank) / self.config.max_results
+
+    def _bound(self, source: int) -> float:
+        """Most a result not yet seen in ``source`` can still get from it."""
+        if self._exhausted[source] or self._next_rank[source] > self.config.max_results:
+            return 0.0
+        return self.contribution(source, self._next_rank[source])
+
+    def add(self, source: int, rank: int, result: WebSearchResult) -> None:
+        """Record ``result`` at ``rank`` in ``source``; repeats keep their best rank."""
+        if not result.link or rank > self.config.max_results:
+            return
+        key = canonical_url(result.link)
+        entry = self._scores.get(key)
+        if entry is None:
+            entry = self._scores[key] = [0.0, 0, {}]
+        bit = 1 << source
+        if entry[1] & bit:
+            return
+        entry[0] += self.contribution(source, rank)
+        entry[1] |= bit
+        entry[2][source] = rank
+
+        # Top-k results share the entry's ranks, including those from
+        # sources read before they were promoted.
+        fused = self._top.get(key)
+        if fused is not None:
+            fused.score = entry[0]
+        elif len(self._top) < self.config.top_k:
+            fused = self._top[key] = FusedResult(result, entry[0], entry[2])
+        elif entry[0] > self._min_top()[0]:
+            _, _, evicted = heapq.heappop(self._heap)
+            del self._top[evicted]
+            fused = self._top[key] = FusedResult(result, entry[0], entry[2])
+        else:
+            return
+        heapq.heappush(self._heap, (fused.score, next(self._sequence), key))
+
+    def _min_top(self) -> Tuple[float, str]:
+        # Entries of evicted results and outdated scores are dropped lazily.
+        while True:
+            score, _, key = self._heap[0]
+            fused = self._top.get(key)
+            if fused is not None and fused.score == score:
+                return score, key
+            heapq.heappop(self._heap)
+
+    def next_rank(self, source: int) -> int:
+        """First rank of ``source`` not read yet."""
+        return self._next_rank[source]
+
+    def advance(self, source: int, next_rank: int) -> None:
+        """Mark every rank of ``source`` before ``next_rank`` as read."""
+        self._next_rank[source] = max(self._next_rank[source], next_rank)
+
+    def exhaust(self, source: int) -> None:
+        """Mark ``source`` as having no more results."""
+        self._exhausted[source] = True
+
+    def _upper(self, score: float, mask: int, bounds: List[float]) -> float:
+        return score + sum(bound for source, bound in enumerate(bounds) if not mask & (1 << source))
+
+    def settled(self) -> bool:
+        """Whether no further result from any source can change the top-k."""
+        bounds = [self._bound(source) for source in range(len(self.weights))]
+        unseen = sum(bounds)
+        if unseen == 0:
+            return True
+        if len(self._top) < self.config.top_k:
+            return False
+
+        threshold = self._min_top()[0]
+        if unseen > threshold:
+            return False
+        for key, (score, mask, _) in self._scores.items():
+            if key not in self._top and self._upper(score, mask, bounds) > threshold:
+                return False
+
+        if self.config.exact_order:
+            ranked = sorted(self._top.items(), key=lambda item: -item[1].score)
+            for (_, better), (key, worse) in zip(ranked, ranked[1:]):
+                if self._upper(worse.score, self._scores[key][1], bounds) > better.score:
+                    return False
+        return True
+
+    def top(self) -> List[FusedResult]:
+        """Current top-k, best first; scores count the ranks read so far."""
+        return sorted(self._top.values(), key=lambda fused: -fused.score)
+
+
+def _first_rank(page: GoogleSearchResponse, requested: int) -> int:
+    """1-based rank of a page's first item, from ``queries.request``."""
+    request = page.queries.request if page.queries and page.queries.request else None
+    if request and request[0].start_index:
+        return request[0].start_index
+    return requested
+
+
+class _SourcePages:
+    """Pages of one source, requested a bounded number ahead of the merge."""
+
+    def __init__(self, client: GoogleCSE, source: FusionSource, max_results: int, executor: ThreadPoolExecutor):
+        self.client = client
+        self.source = source
+        self.executor = executor
+        # Ranks from parameters.start up to max_results are read.
+        self.first_index = source.parameters.start if source.parameters and source.parameters.start else 1
+        self.count = max(0, max_results - self.first_index + 1)
+        # Only the first page is planned until it reports the total.
+        self.plan: Deque[Tuple[int, int]] = deque(plan_pages(self.count, self.first_index)[:1] if self.count else [])
+        self.pending: Deque[Tuple[int, Future]] = deque()
+        self.started = False
+
+    def fill(self, lookahead: int) -> None:
+        depth = 1 + lookahead if self.started else 1
+        while self.plan and len(self.pending) < depth:
+            start, num = self.plan.popleft()
+            future = self.executor.submit(
+                self.client.raw_search, self.source.query, start, num, None, self.source.parameters
+            )
+            self.pending.append((start, future))
+
+    def next(self) -> Optional[Tuple[int, GoogleSearchResponse]]:
+        """Next page and the start index it was requested at; None at the end."""
+        if not self.pending:
+            return None
+        start, future = self.pending.popleft()
+        page = future.result()
+
+        if not self.started:
+            self.started = True
+            if has_next_page(page):
+                self.plan.extend(plan_pages(self.count, self.first_index, total_results(page))[1:])
+        if not page.items or not has_next_page(page):
+            self.cancel()
+        return start, page
+
+    def cancel(self) -> None:
+        self.plan.clear()
+        for _, future in self.pending:
+            future.cancel()
+        self.pending.clear()
+
+
+class RankFusion:
+    """
+    Merges the results of several queries (or engines) into one top-k
+    ranking, reading only as many pages as the answer needs.
+
+    All sources are paged through in step, one page each per round, and
+    every result is scored by its rank with reciprocal rank fusion
+    (``weight / (rrf_k + rank)``) or a linear weighted score, summed over
+    the sources that return it. After each round the merge checks whether
+    the remaining, unread ranks could still change the top-k; if not, it
+    stops and cancels the page requests still queued. Each source has at
+    most ``lookahead`` pages requested ahead of the merge, so stopping
+    early wastes at most that many requests per source.
+
+    Reciprocal rank fusion with the usual ``rrf_k=60`` weighs deep ranks
+    almost as much as the first ones, so it rarely settles before the
+    sources run out; a small ``rrf_k`` or the linear score stop sooner.
+
+    Example:
+        fusion = RankFusion(client, FusionConfig(top_k=10, method="linear"))
+        outcome = fusion.merge([
+            "python asyncio tutorial",
+            FusionSource("asyncio guide", weight=0.5),
+            FusionSource("python asyncio tutorial", client=docs_engine_client),
+        ])
+        for fused in outcome.results:
+            print(fused.score, fused.result.link, fused.ranks)
+    """
+
+    def __init__(self, client: GoogleCSE, config: Optional[FusionConfig] = None):
+        """
+        Args:
+            client: Client used for sources that do not bring their own
+            config: Scoring, depth and concurrency settings
+        """
+        self._log = logging.getLogger(self.__class__.__name__)
+        self.client = client
+        self.config = config or FusionConfig()
+
+    def merge(self, sources: Iterable[Union[str, FusionSource]]) -> FusionOutcome:
+        """
+        Fetch and merge the sources until their top-k is settled.
+
+        A source that fails is logged, reported in ``errors`` and merged
+        with the pages it returned before failing.
+
+        Args:
+            sources: Queries or FusionSource objects
+
+        Returns:
+            FusionOutcome with the top-k, best first
+        """
+        sources = [FusionSource(source) if isinstance(source, str) else source for source in sources]
+        ranking = FusionRanking([source.weight for source in sources], self.config)
+        outcome = FusionOutcome(results=[])
+
+        executor = ThreadPoolExecutor(max_workers=self.config.max_workers)
+        pagers = {
+            index: _SourcePages(source.client or self.client, source, self.config.max_results, executor)
+            for index, source in enumerate(sources)
+        }
+        try:
+            while pagers and not ranking.settled():
+                for pager in pagers.values():
+                    pager.fill(self.config.lookahead)
+
+                for index, pager in list(pagers.items()):
+                    try:
+                        fetched = pager.next()
+                    except Exception as e:
+                        self._log.warning(f"Source {index} ({sources[index].query!r}) failed: {e}")
+                        outcome.errors[index] = str(e)
+                        pager.cancel()
+                        fetched = None
+
+                    if fetched is None:
+                        ranking.exhaust(index)
+                        del pagers[index]
+                        continue
+
+                    start, page = fetched
+                    outcome.pages_fetched += 1
+                    rank = _first_rank(page, start)
+                    for item in page.items or []:
+                        ranking.add(index, rank, WebSearchResult.from_result(item))
+                        rank += 1
+                    ranking.advance(index, rank)
+                    if not pager.pending and not pager.plan:
+                        ranking.exhaust(index)
+                        del pagers[index]
+
+            outcome.settled = ranking.settled()
+        finally:
+            for pager in pagers.values():
+                pager.cancel()
+            executor.shutdown(wait=False)
+
+        outcome.results = ranking.top()
+        return outcome
@@ -0,0 +1,258 @@
+import time
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any
+
+
+@dataclass
+class AttemptEvent:
+    """
+    One HTTP request made while serving a search.
+
+    ``elapsed`` is the time the transport reports for the response:
+    ``RequestsTransport`` measures until the headers arrive (time to first
+    byte), so ``download`` is the time spent reading the body. httpx
+    transports report the full exchange, leaving ``download`` near zero.
+    """
+
+    attempt: int
+    started_at: float
+    credential: Optional[str] = None
+    status_code: Optional[int] = None
+    duration: float = 0.0
+    elapsed: float = 0.0
+    response_bytes: int = 0
+    error: Optional[BaseException] = None
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def finish(self, response: Any = None, error: Optional[BaseException] = None) -> None:
+        """Record the transport response (or the error raised instead)."""
+        self.duration = time.perf_counter() - self._started
+        self.error = error
+        if response is not None:
+            self.status_code = response.status_code
+            self.elapsed = response.elapsed
+            self.response_bytes = len(response.content)
+
+    @property
+    def download(self) -> float:
+        return max(0.0, self.duration - self.elapsed)
+
+
+@dataclass
+class SearchEvent:
+    """
+    Timings and outcome of one ``raw_search`` call, in seconds.
+
+    Phases: ``build_params``, ``cache_lookup``, each HTTP attempt in
+    ``attempts`` (retries, hedges and credential failovers included) and
+    ``parse`` (JSON decoding and validation, done in one pydantic-core pass).
+    """
+
+    query: str
+    search_type: Optional[str]
+    start_index: int
+    num_results: int
+    started_at: float = field(default_factory=time.time)
+    build_params: float = 0.0
+    cache_lookup: float = 0.0
+    cache_hit: Optional[bool] = None
+    coalesced: bool = False
+    attempts: List[AttemptEvent] = field(default_factory=list)
+    parse: float = 0.0
+    response_bytes: int = 0
+    duration: float = 0.0
+    error: Optional[BaseException] = None
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+    _lap: float = field(default_factory=time.perf_counter, repr=False)
+
+    def lap(self) -> float:
+        """Seconds since the previous lap (or the start of the search)."""
+        now = time.perf_counter()
+        elapsed, self._lap = now - self._lap, now
+        return elapsed
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.duration = time.perf_counter() - self._started
+        self.error = error
+
+    @property
+    def retries(self) -> int:
+        return max(0, len(self.attempts) - 1)
+
+    @property
+    def status_code(self) -> Optional[int]:
+        return self.attempts[-1].status_code if self.attempts else None
+
+    @property
+    def credential(self) -> Optional[str]:
+        return self.attempts[-1].credential if self.attempts else None
+
+    @property
+    def outcome(self) -> str:
+        """'cache_hit', 'coalesced', 'ok' or 'error'."""
+        if self.error is not None:
+            return "error"
+        if self.cache_hit:
+            return "cache_hit"
+        if self.coalesced:
+            return "coalesced"
+        return "ok"
+
+
+class Instrument:
+    """
+    Base class for instrumentation hooks.
+
+    Override the methods you need; they run on the thread (or event loop)
+    making the request, so keep them cheap. Exceptions they raise are
+    logged and otherwise ignored.
+    """
+
+    def on_attempt(self, event: SearchEvent, attempt: AttemptEvent) -> None:
+        """Called after every HTTP attempt, as it completes."""
+        pass
+
+    def on_search(self, event: SearchEvent) -> None:
+        """Called once per ``raw_search`` call, when it returns or raises."""
+        pass
+
+
+def _import_prometheus():
+    try:
+        import prometheus_client
+    except ImportError as e:
+        raise ImportError(
+            "prometheus-client is required for PrometheusInstrument; install it with 'pip install google-cse[prometheus]'"
+        ) from e
+    return prometheus_client
+
+
+def _import_opentelemetry():
+    try:
+        from opentelemetry import trace
+    except ImportError as e:
+        raise ImportError(
+            "opentelemetry-api is required for OpenTelemetryInstrument; install it with 'pip install google-cse[otel]'"
+        ) from e
+    return trace
+
+
+class PrometheusInstrument(Instrument):
+    """
+    Exports search metrics to Prometheus.
+
+    Metrics (prefixed with ``namespace``):
+        searches_total{search_type, outcome}
+        search_duration_seconds{search_type, outcome}
+        phase_duration_seconds{phase}
+        http_requests_total{status, credential}
+        response_bytes
+
+    Args:
+        registry: Registry to register the metrics in (the default one if None)
+        namespace: Metric name prefix
+    """
+
+    def __init__(self, registry: Any = None, namespace: str = "google_cse"):
+        prometheus = _import_prometheus()
+        kwargs: Dict[str, Any] = {"namespace": namespace}
+        if registry is not None:
+            kwargs["registry"] = registry
+
+        self.searches = prometheus.Counter(
+            "searches_total", "raw_search calls", ["search_type", "outcome"], **kwargs
+        )
+        self.search_duration = prometheus.Histogram(
+            "search_duration_seconds", "raw_search wall time", ["search_type", "outcome"], **kwargs
+        )
+        self.phase_duration = prometheus.Histogram(
+            "phase_duration_seconds", "Time spent per raw_search phase", ["phase"], **kwargs
+        )
+        self.http_requests = prometheus.Counter(
+            "http_requests_total", "HTTP attempts made", ["status", "credential"], **kwargs
+        )
+        self.response_bytes = prometheus.Histogram(
+            "response_bytes", "Response body size",
+            buckets=(1024, 4096, 16384, 32768, 65536, 131072, 262144, 524288), **kwargs
+        )
+
+    def on_attempt(self, event: SearchEvent, attempt: AttemptEvent) -> None:
+        status = str(attempt.status_code) if attempt.status_code is not None else "error"
+        self.http_requests.labels(status, attempt.credential or "").inc()
+        self.phase_duration.labels("http_ttfb").observe(attempt.elapsed)
+        self.phase_duration.labels("http_download").observe(attempt.download)
+        if attempt.response_bytes:
+            self.response_bytes.observe(attempt.response_bytes)
+
+    def on_search(self, event: SearchEvent) -> None:
+        search_type = event.search_type or "web"
+        outcome = event.outcome
+        self.searches.labels(search_type, outcome).inc()
+        self.search_duration.labels(search_type, outcome).observe(event.duration)
+        self.phase_duration.labels("build_params").observe(event.build_params)
+        if event.cache_hit is not None:
+            self.phase_duration.labels("cache_lookup").observe(event.cache_lookup)
+        if event.attempts and event.error is None:
+            self.phase_duration.labels("parse").observe(event.parse)
+
+
+class OpenTelemetryInstrument(Instrument):
+    """
+    Records each search as an OpenTelemetry span with a child span per
+    HTTP attempt.
+
+    Args:
+        tracer: Tracer to use (one named ``google_cse`` from the global
+            provider if None)
+        record_query: Add the query text as the ``cse.query`` attribute
+    """
+
+    def __init__(self, tracer: Any = None, record_query: bool = False):
+        self._trace = _import_opentelemetry()
+        self.tracer = tracer or self._trace.get_tracer("google_cse")
+        self.record_query = record_query
+
+    def on_search(self, event: SearchEvent) -> None:
+        trace = self._trace
+        start = int(event.started_at * 1e9)
+        span = self.tracer.start_span("google_cse.search", start_time=start)
+        attributes = {
+            "cse.search_type": event.search_type or "web",
+            "cse.start_index": event.start_index,
+            "cse.num_results": event.num_results,
+            "cse.outcome": event.outcome,
+            "cse.retries": event.retries,
+            "cse.response_bytes": event.response_bytes,
+            "cse.build_params_seconds": event.build_params,
+            "cse.parse_seconds": event.parse,
+        }
+        if event.cache_hit is not None:
+            attributes["cse.cache_hit"] = event.cache_hit
+        if event.credential is not None:
+            attributes["cse.credential"] = event.credential
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        if self.record_query:
+            attributes["cse.query"] = event.query
+        span.set_attributes(attributes)
+
+        context = trace.set_span_in_context(span)
+        for attempt in event.attempts:
+            child = self.tracer.start_span(
+                "google_cse.http_attempt", context=context, start_time=int(attempt.started_at * 1e9)
+            )
+            child.set_attribute("cse.attempt", attempt.attempt)
+            child.set_attribute("cse.ttfb_seconds", attempt.elapsed)
+            if attempt.credential is not None:
+                child.set_attribute("cse.credential", attempt.credential)
+            if attempt.status_code is not None:
+                child.set_attribute("http.response.status_code", attempt.status_code)
+            if attempt.error is not None:
+                child.record_exception(attempt.error)
+                child.set_status(trace.Status(trace.StatusCode.ERROR))
+            child.end(end_time=int((attempt.started_at + attempt.duration) * 1e9))
+
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+        span.end(end_time=int((event.started_at + event.duration) * 1e9))
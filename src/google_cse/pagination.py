@@ -0,0 +1,55 @@
+from typing import List, Optional, Tuple
+
+from .results import GoogleSearchResponse
+
+
+# The JSON API never returns results past position 100, in pages of at most 10.
+MAX_RESULTS = 100
+PAGE_SIZE = 10
+
+
+def total_results(response: GoogleSearchResponse) -> Optional[int]:
+    """Return ``searchInformation.totalResults`` as an int, if reported."""
+    info = response.search_information
+    if info is None or info.total_results is None:
+        return None
+
+    try:
+        return int(info.total_results)
+    except ValueError:
+        return None
+
+
+def has_next_page(response: GoogleSearchResponse) -> bool:
+    """Whether the API advertised a ``queries.nextPage`` after this response."""
+    return bool(response.queries and response.queries.next_page)
+
+
+def plan_pages(
+    max_results: int,
+    start_index: int = 1,
+    total: Optional[int] = None
+) -> List[Tuple[int, int]]:
+    """
+    Split a result window into the (start_index, num_results) requests needed.
+
+    Args:
+        max_results: Number of results wanted, starting at ``start_index``
+        start_index: Index of the first result to fetch
+        total: Known total result count; pages past it are not planned
+
+    Returns:
+        List of (start_index, num_results) tuples, in order
+    """
+    last = min(start_index + max_results - 1, MAX_RESULTS)
+    if total is not None:
+        last = min(last, total)
+
+    pages = []
+    start = start_index
+    while start <= last:
+        num = min(PAGE_SIZE, last - start + 1)
+        pages.append((start, num))
+        start += num
+
+    return pages
@@ -1,10 +1,75 @@
-from typing import Optional, Literal
-from pydantic import BaseModel, Field, field_validator
+import hashlib
+from dataclasses import dataclass, field
+from typing import Optional, Literal, Tuple, Any
+from urllib.parse import urlencode
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+# Model field name -> API query parameter. ``start`` and ``num_results`` are
+# per-request and handled by the client.
+API_FIELDS = {
+    "c2coff": "c2coff",
+    "country": "cr",
+    "date_restrict": "dateRestrict",
+    "exact_terms": "exactTerms",
+    "exclude_terms": "excludeTerms",
+    "file_type": "fileType",
+    "filter": "filter",
+    "geolocation": "gl",
+    "high_range": "highRange",
+    "language": "hl",
+    "hq": "hq",
+    "link_site": "linkSite",
+    "low_range": "lowRange",
+    "language_restrict": "lr",
+    "or_terms": "orTerms",
+    "rights": "rights",
+    "safe": "safe",
+    "site_search": "siteSearch",
+    "site_search_filter": "siteSearchFilter",
+    "sort": "sort",
+    # Image-specific parameters
+    "img_color_type": "imgColorType",
+    "img_dominant_color": "imgDominantColor",
+    "img_size": "imgSize",
+    "img_type": "imgType",
+}
+
+# Values the API assumes when a parameter is left out.
+API_DEFAULTS = {
+    "c2coff": "0",
+    "filter": "1",
+    "safe": "off",
+}
+
+
+@dataclass(frozen=True)
+class CompiledParameters:
+    """
+    Frozen, hashable API form of a ``SearchParameters`` object.
+
+    Holds the (api_name, value) pairs that differ from the API defaults, in
+    a fixed order, plus their URL-encoded form and a stable digest that can
+    be used as (part of) a cache key.
+    """
+
+    items: Tuple[Tuple[str, Any], ...] = ()
+    encoded: str = field(default="", compare=False)
+    digest: str = field(default="", compare=False)
+
+    @staticmethod
+    def from_items(items: Tuple[Tuple[str, Any], ...]) -> "CompiledParameters":
+        encoded = urlencode(items)
+        digest = hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+        return CompiledParameters(items, encoded, digest)
 
 
 class SearchParameters(BaseModel):
     """Base parameters for Google Custom Search API."""
 
+    # Built on first use, like the response models.
+    model_config = ConfigDict(defer_build=True)
+
     c2coff: Literal["0", "1"] = Field(
         default="0",
         description="Enables/disables Simplified and Traditional Chinese Search"
@@ -101,6 +166,42 @@ class SearchParameters(BaseModel):
             raise ValueError("num_results must be between 1 and 10")
         return v
 
+    _compiled: Optional[CompiledParameters] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != "_compiled":
+            super().__setattr__("_compiled", None)
+
+    def __eq__(self, other: Any) -> bool:
+        # Compare fields only; whether either side is compiled does not matter.
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def model_copy(self, *args, **kwargs):
+        copied = super().model_copy(*args, **kwargs)
+        copied._compiled = None
+        return copied
+
+    def compile(self) -> CompiledParameters:
+        """
+        Return the API parameters of this object, computed once.
+
+        Values equal to the API defaults are dropped. The result is cached
+        on the object and recomputed after any field is assigned.
+        """
+        compiled = self._compiled
+        if compiled is None:
+            items = []
+            for field_name, api_name in API_FIELDS.items():
+                value = getattr(self, field_name, None)
+                if value is not None and API_DEFAULTS.get(api_name) != value:
+                    items.append((api_name, value))
+            compiled = CompiledParameters.from_items(tuple(items))
+            self._compiled = compiled
+        return compiled
+
 
 class WebSearchParameters(SearchParameters):
     """Parameters specific to web search."""
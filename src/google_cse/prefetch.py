@@ -0,0 +1,370 @@
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Iterable, Iterator, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from pydantic import BaseModel, Field
+
+from .batch import run_batch
+from .results import ImageSearchResult
+from .singleflight import SingleFlight
+
+
+class AssetTooLarge(Exception):
+    """An asset is bigger than the configured size cap."""
+
+
+class PrefetchConfig(BaseModel):
+    """Settings for ``ImagePrefetcher``."""
+
+    max_workers: int = Field(
+        default=16,
+        ge=1,
+        description="Number of results processed at once"
+    )
+    per_host: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum concurrent downloads from one host"
+    )
+    thumbnails: bool = Field(
+        default=True,
+        description="Download thumbnail_link"
+    )
+    originals: bool = Field(
+        default=True,
+        description="Download the full-size image at link"
+    )
+    max_bytes: Optional[int] = Field(
+        default=10 * 1024 * 1024,
+        ge=1,
+        description="Skip assets larger than this; originals are checked against image_byte_size before downloading and every download is cut off once it exceeds the cap"
+    )
+    connect_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds to wait for the connection to be established"
+    )
+    read_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds to wait between bytes received from the server"
+    )
+    user_agent: str = Field(
+        default="google-cse-prefetch",
+        description="User-Agent header sent with every download"
+    )
+
+
+class AssetStore:
+    """
+    Content-addressed on-disk store of downloaded files.
+
+    Files are named by the SHA-256 of their content, so identical images
+    fetched from different URLs are stored once. A URL index (``urls.jsonl``)
+    maps every downloaded URL to its file and survives restarts, so a URL
+    is never fetched twice.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._lock = threading.Lock()
+        self._urls: Dict[str, str] = {}
+
+        os.makedirs(root, exist_ok=True)
+        self._index_path = os.path.join(root, "urls.jsonl")
+        if os.path.exists(self._index_path):
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line
+                    self._urls[entry["url"]] = entry["path"]
+        self._index = open(self._index_path, "a", encoding="utf-8")
+
+    def lookup(self, url: str) -> Optional[str]:
+        """Absolute path of the file stored for ``url``, if any."""
+        relative = self._urls.get(url)
+        if relative is None:
+            return None
+        path = os.path.join(self.root, relative)
+        return path if os.path.exists(path) else None
+
+    def put(self, url: str, content: bytes, content_type: Optional[str] = None) -> str:
+        """Store ``content`` downloaded from ``url`` and return its path."""
+        return self.put_stream(url, [content], content_type)
+
+    def put_stream(self, url: str, chunks: Iterable[bytes], content_type: Optional[str] = None) -> str:
+        """
+        Store content downloaded from ``url`` as it arrives and return its path.
+
+        Chunks are written to a temporary file in the store and hashed on
+        the way, so memory stays flat whatever the file size. If ``chunks``
+        raises, the partial file is removed and the error propagates.
+        """
+        hasher = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    hasher.update(chunk)
+                    f.write(chunk)
+
+            digest = hasher.hexdigest()
+            relative = os.path.join(digest[:2], digest + _extension(url, content_type))
+            path = os.path.join(self.root, relative)
+            if os.path.exists(path):
+                os.remove(tmp)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+        with self._lock:
+            self._urls[url] = relative
+            self._index.write(json.dumps({"url": url, "path": relative}) + "\n")
+            self._index.flush()
+        return path
+
+    def __contains__(self, url: str) -> bool:
+        return self.lookup(url) is not None
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def close(self) -> None:
+        self._index.close()
+
+
+def _extension(url: str, content_type: Optional[str]) -> str:
+    if content_type:
+        guessed = mimetypes.guess_extension(content_type.split(";", 1)[0].strip())
+        if guessed:
+            return guessed
+    suffix = os.path.splitext(urlsplit(url).path)[1].lower()
+    return suffix if 1 < len(suffix) <= 5 else ""
+
+
+class PrefetchStats:
+    """Thread-safe download counters of an ``ImagePrefetcher``."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self.downloaded = 0
+        self.bytes = 0
+        self.cached = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def record(self, outcome: str, size: int = 0) -> None:
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            self.bytes += size
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    @property
+    def files_per_second(self) -> float:
+        return self.downloaded / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "downloaded": self.downloaded,
+            "cached": self.cached,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "bytes": self.bytes,
+            "files_per_second": self.files_per_second,
+            "bytes_per_second": self.bytes_per_second,
+        }
+
+
+@dataclass
+class PrefetchedImage:
+    """An image result with the local paths of its downloaded assets."""
+
+    result: ImageSearchResult
+    thumbnail_path: Optional[str] = None
+    image_path: Optional[str] = None
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class ImagePrefetcher:
+    """
+    Downloads the thumbnails and originals of image results concurrently.
+
+    Downloads share one pooled session, at most ``per_host`` run against
+    the same host at once, and a URL is fetched only once: concurrent
+    requests for it share one download and later ones are served from the
+    ``AssetStore``. Failures are reported per result, never raised.
+
+    Example:
+        with ImagePrefetcher(AssetStore("images")) as prefetcher:
+            for image in prefetcher.prefetch(client.image_search("puppies")):
+                print(image.image_path, image.errors)
+            print(prefetcher.stats.to_dict())
+    """
+
+    def __init__(self, store: AssetStore, config: Optional[PrefetchConfig] = None):
+        """
+        Args:
+            store: Where downloaded files go
+            config: Concurrency, size and timeout settings
+        """
+        self._log = logging.getLogger(self.__class__.__name__)
+        self.store = store
+        self.config = config or PrefetchConfig()
+        self.stats = PrefetchStats()
+
+        adapter = HTTPAdapter(pool_connections=self.config.max_workers, pool_maxsize=self.config.per_host)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["User-Agent"] = self.config.user_agent
+        self._timeout = (self.config.connect_timeout, self.config.read_timeout)
+
+        self._hosts_lock = threading.Lock()
+        self._hosts: Dict[str, threading.Semaphore] = {}
+        self._flights = SingleFlight()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "ImagePrefetcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def prefetch(
+        self,
+        results: Iterable[ImageSearchResult],
+        ordered: bool = False
+    ) -> Iterator[PrefetchedImage]:
+        """
+        Download the assets of a (possibly endless) stream of image results.
+
+        Results are consumed lazily with a bounded number in flight.
+
+        Args:
+            results: Image results, e.g. from ``image_search``
+            ordered: Yield in input order instead of completion order
+
+        Returns:
+            Iterator of PrefetchedImage objects
+        """
+        outcomes = run_batch(self.fetch, results, self.config.max_workers, ordered)
+        for _, result, prefetched, error in outcomes:
+            if error is not None:
+                prefetched = PrefetchedImage(result, errors={"result": str(error)})
+            yield prefetched
+
+    def fetch(self, result: ImageSearchResult) -> PrefetchedImage:
+        """Download the assets of one result."""
+        prefetched = PrefetchedImage(result)
+
+        cap = self.config.max_bytes
+        if self.config.thumbnails and result.thumbnail_link:
+            prefetched.thumbnail_path = self._asset(result.thumbnail_link, cap, "thumbnail", prefetched)
+
+        if self.config.originals and result.link:
+            if cap is not None and result.image_byte_size is not None and result.image_byte_size > cap:
+                self.stats.record("skipped")
+                prefetched.errors["image"] = f"image_byte_size {result.image_byte_size} exceeds max_bytes {cap}"
+            else:
+                prefetched.image_path = self._asset(result.link, cap, "image", prefetched)
+
+        return prefetched
+
+    def _asset(self, url: str, max_bytes: Optional[int], kind: str, prefetched: PrefetchedImage) -> Optional[str]:
+        path = self.store.lookup(url)
+        if path is not None:
+            self.stats.record("cached")
+            return path
+
+        # Only the caller that runs the download gets its size; callers
+        # that shared it count as cached, like later ones served from the store.
+        downloaded: List[int] = []
+
+        def download() -> str:
+            path, size = self._download(url, max_bytes)
+            if size is not None:
+                downloaded.append(size)
+            return path
+
+        try:
+            path = self._flights.do(url, download)
+        except AssetTooLarge as e:
+            self.stats.record("skipped")
+            prefetched.errors[kind] = str(e)
+        except (requests.exceptions.RequestException, OSError) as e:
+            self.stats.record("failed")
+            prefetched.errors[kind] = str(e)
+            self._log.debug(f"Failed to fetch {url}: {e}")
+            return None
+
+        if downloaded:
+            self.stats.record("downloaded", downloaded[0])
+        else:
+            self.stats.record("cached")
+        return path
+
+    def _host_slot(self, url: str) -> threading.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        with self._hosts_lock:
+            slot = self._hosts.get(host)
+            if slot is None:
+                slot = self._hosts[host] = threading.Semaphore(self.config.per_host)
+            return slot
+
+    def _download(self, url: str, max_bytes: Optional[int]) -> Tuple[str, Optional[int]]:
+        """Fetch ``url`` into the store; returns its path and the bytes read (None if already stored)."""
+        path = self.store.lookup(url)
+        if path is not None:
+            return path, None
+
+        with self._host_slot(url):
+            with self.session.get(url, stream=True, timeout=self._timeout) as response:
+                response.raise_for_status()
+
+                declared = response.headers.get("Content-Length")
+                if max_bytes is not None and declared and declared.isdigit() and int(declared) > max_bytes:
+                    raise AssetTooLarge(f"{url} is {declared} bytes, over max_bytes {max_bytes}")
+
+                size = 0
+
+                def chunks() -> Iterator[bytes]:
+                    nonlocal size
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        size += len(chunk)
+                        if max_bytes is not None and size > max_bytes:
+                            raise AssetTooLarge(f"{url} is over max_bytes {max_bytes}")
+                        yield chunk
+
+                path = self.store.put_stream(url, chunks(), response.headers.get("Content-Type"))
+
+        return path, size
@@ -0,0 +1,146 @@
+import hashlib
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Tuple, Any, Union
+
+import pydantic_core
+
+from .results import GoogleSearchResponse, LazySearchResponse, Result
+
+# Top-level response members kept by every projection; pagination reads them.
+RESPONSE_FIELDS = ("kind", "queries", "searchInformation", "spelling")
+
+
+def _api_name(name: str) -> str:
+    """API (camelCase) key of a ``Result`` field given by field name or alias."""
+    info = Result.model_fields.get(name)
+    if info is not None:
+        return info.alias or name
+    for info in Result.model_fields.values():
+        if info.alias == name:
+            return name
+    raise ValueError(f"unknown result field {name!r}")
+
+
+@dataclass(frozen=True)
+class Projection:
+    """
+    Subset of each result item to keep: plain fields plus pagemap paths.
+
+    Pagemap paths are ``"<type>"`` for every entry of a pagemap type or
+    ``"<type>/<key>"`` for one key of its entries, e.g.
+    ``"metatags/og:image"`` or ``"cse_thumbnail/src"``. Projected items
+    keep the pagemap's shape with everything else removed.
+
+    With ``partial_response`` the projection is also sent as the API's
+    ``fields`` parameter, so Google leaves the other fields (and pagemap
+    types) out of the response body. Keys inside a pagemap type are always
+    selected client-side.
+
+    Example:
+        projection = Projection(["link", "title"], pagemap=["metatags/og:image", "cse_thumbnail/src"])
+        response = client.raw_search("python", projection=projection)
+        print(projection.values(response.items[0]))
+    """
+
+    fields: Tuple[str, ...] = ("title", "link", "snippet")
+    pagemap: Tuple[str, ...] = ()
+    partial_response: bool = True
+    _keys: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _paths: Dict[str, Optional[Tuple[str, ...]]] = field(init=False, repr=False, compare=False)
+    api_fields: str = field(init=False, repr=False, compare=False)
+    digest: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        fields = tuple(self.fields)
+        pagemap = tuple(self.pagemap)
+        keys = tuple(dict.fromkeys(_api_name(name) for name in fields))
+
+        paths: Dict[str, Optional[dict]] = {}
+        for path in pagemap:
+            kind, _, key = path.partition("/")
+            if not kind or "/" in key:
+                raise ValueError(f"pagemap path must be '<type>' or '<type>/<key>', got {path!r}")
+            if not key:
+                paths[kind] = None
+            elif kind not in paths or paths[kind] is not None:
+                paths.setdefault(kind, {})[key] = None
+
+        # Pagemap paths narrow a "pagemap" field down to those paths.
+        if paths:
+            keys = tuple(key for key in keys if key != "pagemap")
+
+        selected = list(keys)
+        if paths:
+            selected.append(f"pagemap({','.join(paths)})")
+        api_fields = ",".join(RESPONSE_FIELDS) + f",items({','.join(selected)})"
+
+        frozen_paths = {kind: tuple(keys) if keys is not None else None for kind, keys in paths.items()}
+        signature = api_fields + "|" + ";".join(sorted(pagemap))
+        set_ = object.__setattr__
+        set_(self, "fields", fields)
+        set_(self, "pagemap", pagemap)
+        set_(self, "_keys", keys)
+        set_(self, "_paths", frozen_paths)
+        set_(self, "api_fields", api_fields)
+        set_(self, "digest", hashlib.sha256(signature.encode("utf-8")).hexdigest()[:16])
+
+    @property
+    def includes_pagemap(self) -> bool:
+        """Whether projected items keep (part of) their pagemap."""
+        return bool(self._paths) or "pagemap" in self._keys
+
+    def project_item(self, item: dict) -> dict:
+        """Reduce one raw (camelCase) API item to the projected keys."""
+        projected = {key: item[key] for key in self._keys if key in item}
+        if self._paths:
+            pagemap = item.get("pagemap")
+            if pagemap:
+                kept = {}
+                for kind, keys in self._paths.items():
+                    entries = pagemap.get(kind)
+                    if not entries:
+                        continue
+                    if keys is None:
+                        kept[kind] = entries
+                        continue
+                    entries = [{k: entry[k] for k in keys if k in entry} for entry in entries]
+                    entries = [entry for entry in entries if entry]
+                    if entries:
+                        kept[kind] = entries
+                if kept:
+                    projected["pagemap"] = kept
+        return projected
+
+    def apply(self, raw: dict) -> dict:
+        """Project the items of a decoded response, in place."""
+        items = raw.get("items")
+        if items:
+            raw["items"] = [self.project_item(item) for item in items]
+        return raw
+
+    def parse(self, content: Union[bytes, str], lazy: bool = False) -> Union[GoogleSearchResponse, LazySearchResponse]:
+        """Decode a response body, project it and build the response."""
+        raw = self.apply(pydantic_core.from_json(content))
+        if lazy:
+            return LazySearchResponse(raw)
+        return GoogleSearchResponse.model_validate(raw)
+
+    def values(self, item: Union[Result, dict, Any]) -> Dict[str, Any]:
+        """
+        Map each pagemap path to its value in one result.
+
+        ``"<type>/<key>"`` paths give the key's value in the first entry
+        that has it; ``"<type>"`` paths give the list of entries. Missing
+        paths map to None.
+        """
+        pagemap = item.get("pagemap") if isinstance(item, dict) else getattr(item, "pagemap", None)
+        pagemap = pagemap or {}
+        values = {}
+        for path in self.pagemap:
+            kind, _, key = path.partition("/")
+            entries = pagemap.get(kind) or []
+            if not key:
+                values[path] = entries or None
+                continue
+            values[path] = next((entry[key] for entry in entries if key in entry), None)
+        return values
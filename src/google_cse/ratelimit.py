@@ -0,0 +1,243 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone, time as dtime
+from typing import Optional, Dict, List, Tuple, Callable
+
+try:
+    from zoneinfo import ZoneInfo
+    _QUOTA_TZ = ZoneInfo("America/Los_Angeles")
+except Exception:  # tzdata missing; fall back to Pacific Standard Time
+    _QUOTA_TZ = timezone(timedelta(hours=-8))
+
+
+def next_quota_reset(now: Optional[float] = None) -> float:
+    """
+    Return the timestamp at which the API's daily quota next resets.
+
+    Google resets Custom Search quotas at midnight Pacific Time.
+    """
+    now = time.time() if now is None else now
+    local = datetime.fromtimestamp(now, _QUOTA_TZ)
+    midnight = datetime.combine(local.date() + timedelta(days=1), dtime(0), tzinfo=_QUOTA_TZ)
+    return midnight.timestamp()
+
+
+# Limiter state: name -> (value, timestamp). For token buckets the value is
+# the token count at the timestamp; for the daily budget it is the number of
+# requests used and the timestamp is when that count resets.
+State = Dict[str, Tuple[float, float]]
+
+
+class _MemoryState:
+    """Limiter state shared by the threads of one process."""
+
+    blocking_io = False
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: State = {}
+
+    def transact(self, update: Callable[[State], float]) -> float:
+        with self._lock:
+            return update(self._values)
+
+    def close(self) -> None:
+        pass
+
+
+class _SQLiteState:
+    """Limiter state in a SQLite file, shared by every process that opens it."""
+
+    blocking_io = True
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit ("
+            "name TEXT PRIMARY KEY, value REAL NOT NULL, stamp REAL NOT NULL)"
+        )
+
+    def transact(self, update: Callable[[State], float]) -> float:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                values = {
+                    name: (value, stamp)
+                    for name, value, stamp in self._conn.execute("SELECT name, value, stamp FROM rate_limit")
+                }
+                result = update(values)
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO rate_limit (name, value, stamp) VALUES (?, ?, ?)",
+                    [(name, value, stamp) for name, (value, stamp) in values.items()],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return result
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RateLimiter:
+    """
+    Client-side token-bucket limiter for the Custom Search API quotas.
+
+    Any combination of per-second, per-minute and per-day budgets can be set;
+    a request is only let through when every budget has room, so bursts are
+    smoothed out before Google answers with 429s.
+
+    The limiter is thread-safe. Pass ``state_path`` to keep its state in a
+    SQLite file so that several processes share one budget.
+
+    Example:
+        limiter = RateLimiter(qps=5, daily=10000)
+        client = GoogleCSE(api_key, cx, rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        qps: Optional[float] = None,
+        qpm: Optional[float] = None,
+        daily: Optional[int] = None,
+        blocking: bool = True,
+        timeout: Optional[float] = None,
+        state_path: Optional[str] = None
+    ):
+        """
+        Args:
+            qps: Maximum requests per second (also the allowed burst)
+            qpm: Maximum requests per minute
+            daily: Maximum requests per quota day (resets at midnight Pacific)
+            blocking: Wait for a token by default instead of failing fast
+            timeout: Longest time to wait in blocking mode, or None for no limit
+            state_path: SQLite file used to share state across processes
+        """
+        for name, value in (("qps", qps), ("qpm", qpm), ("daily", daily)):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive")
+
+        # (name, refill rate per second, capacity)
+        self._buckets: List[Tuple[str, float, float]] = []
+        if qps is not None:
+            self._buckets.append(("qps", float(qps), max(1.0, float(qps))))
+        if qpm is not None:
+            self._buckets.append(("qpm", qpm / 60.0, max(1.0, float(qpm))))
+
+        self.qps = qps
+        self.qpm = qpm
+        self.daily = daily
+        self.blocking = blocking
+        self.timeout = timeout
+        self._state = _SQLiteState(state_path) if state_path else _MemoryState()
+
+    def try_acquire(self) -> float:
+        """
+        Take one token if every budget allows it.
+
+        Returns:
+            0.0 if the request may proceed, otherwise the number of seconds
+            until it could
+        """
+        return self._state.transact(lambda values: self._update(values, time.time()))
+
+    def acquire(self, blocking: Optional[bool] = None, timeout: Optional[float] = None) -> bool:
+        """
+        Take one token, waiting for it in blocking mode.
+
+        Args:
+            blocking: Override the limiter's default mode
+            timeout: Override the limiter's default wait limit
+
+        Returns:
+            True if a token was taken, False if it was not available in time
+        """
+        return self.take(blocking, timeout) <= 0
+
+    async def acquire_async(self, blocking: Optional[bool] = None, timeout: Optional[float] = None) -> bool:
+        """
+        Like ``acquire``, but waits with ``asyncio.sleep``. With a shared
+        state file, the state is read and updated in a worker thread.
+        """
+        return await self.take_async(blocking, timeout) <= 0
+
+    def take(self, blocking: Optional[bool] = None, timeout: Optional[float] = None) -> float:
+        """
+        Like ``acquire``, but report how long a refused request had left to wait.
+
+        Returns:
+            0.0 if a token was taken, otherwise the number of seconds until
+            one would have been available
+        """
+        deadline = self._deadline(timeout)
+        blocking = self.blocking if blocking is None else blocking
+
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return 0.0
+            if not blocking or not self._can_wait(wait, deadline):
+                return wait
+            time.sleep(wait)
+
+    async def take_async(self, blocking: Optional[bool] = None, timeout: Optional[float] = None) -> float:
+        """Like ``take``, but waits with ``asyncio.sleep``."""
+        import asyncio
+
+        deadline = self._deadline(timeout)
+        blocking = self.blocking if blocking is None else blocking
+
+        while True:
+            if self._state.blocking_io:
+                wait = await asyncio.to_thread(self.try_acquire)
+            else:
+                wait = self.try_acquire()
+            if wait <= 0:
+                return 0.0
+            if not blocking or not self._can_wait(wait, deadline):
+                return wait
+            await asyncio.sleep(wait)
+
+    def close(self) -> None:
+        self._state.close()
+
+    def _deadline(self, timeout: Optional[float]) -> Optional[float]:
+        timeout = self.timeout if timeout is None else timeout
+        return time.monotonic() + timeout if timeout is not None else None
+
+    @staticmethod
+    def _can_wait(wait: float, deadline: Optional[float]) -> bool:
+        return deadline is None or time.monotonic() + wait <= deadline
+
+    def _update(self, values: State, now: float) -> float:
+        waits = []
+
+        for name, rate, capacity in self._buckets:
+            tokens, stamp = values.get(name, (capacity, now))
+            tokens = min(capacity, tokens + max(0.0, now - stamp) * rate)
+            values[name] = (tokens, now)
+            if tokens < 1.0:
+                waits.append((1.0 - tokens) / rate)
+
+        if self.daily is not None:
+            used, reset_at = values.get("daily", (0.0, next_quota_reset(now)))
+            if now >= reset_at:
+                used, reset_at = 0.0, next_quota_reset(now)
+            values["daily"] = (used, reset_at)
+            if used >= self.daily:
+                waits.append(reset_at - now)
+
+        if waits:
+            return max(waits)
+
+        for name, _, _ in self._buckets:
+            tokens, stamp = values[name]
+            values[name] = (tokens - 1.0, stamp)
+        if self.daily is not None:
+            used, reset_at = values["daily"]
+            values["daily"] = (used + 1.0, reset_at)
+        return 0.0
@@ -1,8 +1,15 @@
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional, Union, Any, Callable
+import pydantic_core
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class PromotionBodyLine(BaseModel):
+class _Model(BaseModel):
+    # Validators are built on first use rather than at import, so programs
+    # only pay for the models they actually validate.
+    model_config = ConfigDict(defer_build=True)
+
+
+class PromotionBodyLine(_Model):
     title: Optional[str] = Field(default=None)
     html_title: Optional[str] = Field(default=None, alias="htmlTitle")
     url: Optional[str] = Field(default=None)
@@ -16,7 +23,7 @@ class PromotionBodyLine(BaseModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
 
-class PromotionImage(BaseModel):
+class PromotionImage(_Model):
     source: Optional[str] = Field(default=None)
     width: Optional[int] = Field(default=None)
     height: Optional[int] = Field(default=None)
@@ -29,7 +36,7 @@ class PromotionImage(BaseModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
 
-class Promotion(BaseModel):
+class Promotion(_Model):
     title: Optional[str] = Field(default=None)
     html_title: Optional[str] = Field(default=None, alias="htmlTitle")
     link: Optional[str] = Field(default=None)
@@ -45,7 +52,7 @@ class Promotion(BaseModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
 
-class ImageInfo(BaseModel):
+class ImageInfo(_Model):
     context_link: Optional[str] = Field(default=None, alias="contextLink")
     height: Optional[int] = Field(default=None)
     width: Optional[int] = Field(default=None)
@@ -62,7 +69,7 @@ class ImageInfo(BaseModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
 
-class LabelInfo(BaseModel):
+class LabelInfo(_Model):
     name: Optional[str] = Field(default=None)
     display_name: Optional[str] = Field(default=None, alias="displayName")
     label_with_op: Optional[str] = Field(default=None, alias="label_with_op")
@@ -75,7 +82,7 @@ class LabelInfo(BaseModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
 
-class Result(BaseModel):
+class Result(_Model):
     kind: Optional[str] = Field(default=None)
     title: Optional[str] = Field(default=None)
     html_title: Optional[str] = Field(default=None, alias="htmlTitle")
@@ -100,7 +107,7 @@ class Result(BaseModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
 
-class QueryItem(BaseModel):
+class QueryItem(_Model):
     title: Optional[str] = Field(default=None)
     total_results: Optional[str] = Field(default=None, alias="totalResults")
     search_terms: Optional[str] = Field(default=None, alias="searchTerms")
@@ -146,7 +153,7 @@ class QueryItem(BaseModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
 
-class QuerySet(BaseModel):
+class QuerySet(_Model):
     previous_page: Optional[List[QueryItem]] = Field(default=None, alias="previousPage")
     request: Optional[List[QueryItem]] = Field(default=None)
     next_page: Optional[List[QueryItem]] = Field(default=None, alias="nextPage")
@@ -159,7 +166,7 @@ class QuerySet(BaseModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
 
-class UrlInfo(BaseModel):
+class UrlInfo(_Model):
     type: Optional[str] = Field(default=None)
     template: Optional[str] = Field(default=None)
 
@@ -171,7 +178,7 @@ class UrlInfo(BaseModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
 
-class SearchInformation(BaseModel):
+class SearchInformation(_Model):
     search_time: Optional[float] = Field(default=None, alias="searchTime")
     formatted_search_time: Optional[str] = Field(default=None, alias="formattedSearchTime")
     total_results: Optional[str] = Field(default=None, alias="totalResults")
@@ -185,7 +192,7 @@ class SearchInformation(BaseModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
 
-class SpellingInfo(BaseModel):
+class SpellingInfo(_Model):
     corrected_query: Optional[str] = Field(default=None, alias="correctedQuery")
     html_corrected_query: Optional[str] = Field(default=None, alias="htmlCorrectedQuery")
 
@@ -197,7 +204,7 @@ class SpellingInfo(BaseModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
 
-class GoogleSearchResponse(BaseModel):
+class GoogleSearchResponse(_Model):
     kind: Optional[str] = Field(default=None)
     url: Optional[UrlInfo] = Field(default=None)
     queries: Optional[QuerySet] = Field(default=None)
@@ -211,10 +218,104 @@ class GoogleSearchResponse(BaseModel):
     def from_dict(data: dict) -> "GoogleSearchResponse":
         return GoogleSearchResponse.model_validate(data)
 
+    @staticmethod
+    def from_json(data: Union[bytes, str]) -> "GoogleSearchResponse":
+        """Parse and validate a raw JSON body in a single pydantic-core pass."""
+        return GoogleSearchResponse.model_validate_json(data)
+
     def to_dict(self) -> dict:
         return self.model_dump(by_alias=True, exclude_none=True)
 
-class WebSearchResult(BaseModel):
+    def to_json(self) -> bytes:
+        return self.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
+
+
+class LazySearchResponse:
+    """
+    Read-only view of a search response that validates fields on first access.
+
+    The body is decoded with pydantic-core's JSON parser, and each top-level
+    field is only turned into its model when it is read, so callers that
+    touch a few fields skip validating the rest. The attributes match
+    ``GoogleSearchResponse``; use ``to_model`` for a full model.
+    """
+
+    __slots__ = ("_raw", "_fields")
+
+    def __init__(self, raw: dict):
+        self._raw = raw
+        self._fields = {}
+
+    @staticmethod
+    def from_json(data: Union[bytes, str]) -> "LazySearchResponse":
+        return LazySearchResponse(pydantic_core.from_json(data))
+
+    @property
+    def raw(self) -> dict:
+        """The decoded response body, with camelCase keys; treat it as read-only."""
+        return self._raw
+
+    def _field(self, name: str, alias: str, build: Callable[[Any], Any]) -> Any:
+        try:
+            return self._fields[name]
+        except KeyError:
+            value = self._raw.get(alias)
+            if value is not None:
+                value = build(value)
+            self._fields[name] = value
+            return value
+
+    @property
+    def kind(self) -> Optional[str]:
+        return self._raw.get("kind")
+
+    @property
+    def url(self) -> Optional[UrlInfo]:
+        return self._field("url", "url", UrlInfo.model_validate)
+
+    @property
+    def queries(self) -> Optional[QuerySet]:
+        return self._field("queries", "queries", QuerySet.model_validate)
+
+    @property
+    def promotions(self) -> Optional[List[Promotion]]:
+        return self._field("promotions", "promotions", lambda v: [Promotion.model_validate(p) for p in v])
+
+    @property
+    def context(self) -> Optional[dict]:
+        return self._raw.get("context")
+
+    @property
+    def search_information(self) -> Optional[SearchInformation]:
+        return self._field("search_information", "searchInformation", SearchInformation.model_validate)
+
+    @property
+    def spelling(self) -> Optional[SpellingInfo]:
+        return self._field("spelling", "spelling", SpellingInfo.model_validate)
+
+    @property
+    def items(self) -> Optional[List[Result]]:
+        return self._field("items", "items", lambda v: [Result.model_validate(i) for i in v])
+
+    def web_results(self, include_pagemap: bool = False) -> List["WebSearchResult"]:
+        """Build web results straight from the raw items, skipping ``Result``."""
+        return [WebSearchResult.from_item(item, include_pagemap) for item in self._raw.get("items") or []]
+
+    def image_results(self) -> List["ImageSearchResult"]:
+        """Build image results straight from the raw items, skipping ``Result``."""
+        return [ImageSearchResult.from_item(item) for item in self._raw.get("items") or []]
+
+    def to_model(self) -> GoogleSearchResponse:
+        return GoogleSearchResponse.model_validate(self._raw)
+
+    def to_dict(self) -> dict:
+        return self.to_model().to_dict()
+
+    def to_json(self) -> bytes:
+        return pydantic_core.to_json(self._raw)
+
+
+class WebSearchResult(_Model):
     title: Optional[str] = Field(default=None)
     html_title: Optional[str] = Field(default=None)
     link: Optional[str] = Field(default=None)
@@ -222,9 +323,10 @@ class WebSearchResult(BaseModel):
     snippet: Optional[str] = Field(default=None)
     html_snippet: Optional[str] = Field(default=None)
     formatted_url: Optional[str] = Field(default=None)
+    pagemap: Optional[dict] = Field(default=None)
 
     @staticmethod
-    def from_result(data: "Result") -> "WebSearchResult":
+    def from_result(data: "Result", include_pagemap: bool = False) -> "WebSearchResult":
         return WebSearchResult(
             title=data.title,
             html_title=data.html_title,
@@ -233,13 +335,28 @@ class WebSearchResult(BaseModel):
             snippet=data.snippet,
             html_snippet=data.html_snippet,
             formatted_url=data.formatted_url,
+            pagemap=data.pagemap if include_pagemap else None,
+        )
+
+    @staticmethod
+    def from_item(item: dict, include_pagemap: bool = False) -> "WebSearchResult":
+        """Build from a raw API result item (camelCase keys)."""
+        return WebSearchResult(
+            title=item.get("title"),
+            html_title=item.get("htmlTitle"),
+            link=item.get("link"),
+            display_link=item.get("displayLink"),
+            snippet=item.get("snippet"),
+            html_snippet=item.get("htmlSnippet"),
+            formatted_url=item.get("formattedUrl"),
+            pagemap=item.get("pagemap") if include_pagemap else None,
         )
 
     def to_dict(self) -> dict:
         return self.model_dump(exclude_none=True)
 
 
-class ImageSearchResult(BaseModel):
+class ImageSearchResult(_Model):
     title: Optional[str] = Field(default=None)
     html_title: Optional[str] = Field(default=None)
     link: Optional[str] = Field(default=None)
@@ -271,5 +388,24 @@ class ImageSearchResult(BaseModel):
             thumbnail_width=image_data.thumbnail_width if image_data else None,
         )
 
+    @staticmethod
+    def from_item(item: dict) -> "ImageSearchResult":
+        """Build from a raw API result item (camelCase keys)."""
+        image_data = item.get("image") or {}
+        return ImageSearchResult(
+            title=item.get("title"),
+            html_title=item.get("htmlTitle"),
+            link=item.get("link"),
+            display_link=item.get("displayLink"),
+            snippet=item.get("snippet"),
+            context_link=image_data.get("contextLink"),
+            image_height=image_data.get("height"),
+            image_width=image_data.get("width"),
+            image_byte_size=image_data.get("byteSize"),
+            thumbnail_link=image_data.get("thumbnailLink"),
+            thumbnail_height=image_data.get("thumbnailHeight"),
+            thumbnail_width=image_data.get("thumbnailWidth"),
+        )
+
     def to_dict(self) -> dict:
-        return self.model_dump(exclude_none=True)
\ No newline at end of file
+        return self.model_dump(exclude_none=True)
@@ -0,0 +1,283 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from email.utils import parsedate_to_datetime
+from typing import Optional, List, Callable, Awaitable, TypeVar
+
+import requests
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class RetryPolicy(BaseModel):
+    """When and how failed requests are retried."""
+
+    max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Total attempts per request, including the first one"
+    )
+    retry_statuses: List[int] = Field(
+        default=[429, 500, 502, 503, 504],
+        description="HTTP status codes that are retried"
+    )
+    retry_connection_errors: bool = Field(
+        default=True,
+        description="Retry connection resets and timeouts"
+    )
+    backoff_base: float = Field(
+        default=0.5,
+        ge=0,
+        description="Backoff ceiling for the first retry, doubled on each attempt"
+    )
+    backoff_max: float = Field(
+        default=30.0,
+        ge=0,
+        description="Upper bound for a single backoff delay"
+    )
+    respect_retry_after: bool = Field(
+        default=True,
+        description="Wait for the server's Retry-After header when present, and give up when it asks for more than backoff_max"
+    )
+    deadline: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Seconds after which no further attempt is started"
+    )
+    hedge: bool = Field(
+        default=False,
+        description="Send a second identical request if the first one is slow"
+    )
+    hedge_after: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Seconds before hedging; defaults to the observed latency quantile"
+    )
+    hedge_quantile: float = Field(
+        default=0.95,
+        gt=0,
+        lt=1,
+        description="Latency quantile used as the hedging threshold"
+    )
+    hedge_min_samples: int = Field(
+        default=20,
+        ge=1,
+        description="Requests to observe before an adaptive hedging threshold is used"
+    )
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Whether a request that failed with ``error`` should be tried again."""
+        if isinstance(error, requests.exceptions.HTTPError):
+            response = error.response
+            return response is not None and response.status_code in self.retry_statuses
+
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return self.retry_connection_errors
+
+        return False
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before retry number ``attempt``."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def delay(self, attempt: int, error: BaseException) -> Optional[float]:
+        """
+        Seconds to wait before retry number ``attempt``, or None if the
+        server's ``Retry-After`` is longer than ``backoff_max``.
+        """
+        if self.respect_retry_after:
+            retry_after = parse_retry_after(error)
+            if retry_after is not None:
+                # Retrying sooner than the server asks only earns another 429.
+                return retry_after if retry_after <= self.backoff_max else None
+        return self.backoff(attempt)
+
+
+def parse_retry_after(error: BaseException) -> Optional[float]:
+    """Read the ``Retry-After`` header of a failed response, in seconds."""
+    response = getattr(error, "response", None)
+    if response is None or response.headers is None:
+        return None
+
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class LatencyTracker:
+    """Sliding window of request latencies used to pick a hedging threshold."""
+
+    def __init__(self, window: int = 200):
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float, min_samples: int = 1) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class Retrier:
+    """
+    Runs request attempts under a RetryPolicy.
+
+    One Retrier is owned by each client; it keeps the latency history used
+    for adaptive hedging and, for sync clients, the threads that run hedged
+    requests. Note that a hedged request is a real API call and uses quota.
+    """
+
+    def __init__(self, policy: RetryPolicy):
+        self._log = logging.getLogger(self.__class__.__name__)
+        self.policy = policy
+        self.latencies = LatencyTracker()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def call(self, attempt: Callable[[], T]) -> T:
+        """Run ``attempt`` until it succeeds or the policy gives up."""
+        started = time.monotonic()
+        number = 1
+        while True:
+            try:
+                return self._hedged(attempt) if self.policy.hedge else self._timed(attempt)
+            except Exception as e:
+                delay = self._next_delay(number, e, started)
+                if delay is None:
+                    raise
+                self._log.warning(
+                    f"Request failed ({e}); retrying in {delay:.2f}s "
+                    f"(attempt {number + 1}/{self.policy.max_attempts})"
+                )
+                time.sleep(delay)
+                number += 1
+
+    async def call_async(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        """Async counterpart of ``call``."""
+        import asyncio
+
+        started = time.monotonic()
+        number = 1
+        while True:
+            try:
+                if self.policy.hedge:
+                    return await self._hedged_async(attempt)
+                return await self._timed_async(attempt)
+            except Exception as e:
+                delay = self._next_delay(number, e, started)
+                if delay is None:
+                    raise
+                self._log.warning(
+                    f"Request failed ({e}); retrying in {delay:.2f}s "
+                    f"(attempt {number + 1}/{self.policy.max_attempts})"
+                )
+                await asyncio.sleep(delay)
+                number += 1
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def _next_delay(self, number: int, error: Exception, started: float) -> Optional[float]:
+        """Delay before the next attempt, or None if the error should be raised."""
+        if number >= self.policy.max_attempts or not self.policy.is_retryable(error):
+            return None
+
+        delay = self.policy.delay(number, error)
+        if delay is None:
+            return None
+        if self.policy.deadline is not None:
+            if time.monotonic() - started + delay > self.policy.deadline:
+                return None
+        return delay
+
+    def _hedge_threshold(self) -> Optional[float]:
+        if self.policy.hedge_after is not None:
+            return self.policy.hedge_after
+        return self.latencies.quantile(self.policy.hedge_quantile, self.policy.hedge_min_samples)
+
+    def _timed(self, attempt: Callable[[], T]) -> T:
+        started = time.monotonic()
+        result = attempt()
+        self.latencies.record(time.monotonic() - started)
+        return result
+
+    async def _timed_async(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        result = await attempt()
+        self.latencies.record(time.monotonic() - started)
+        return result
+
+    def _hedged(self, attempt: Callable[[], T]) -> T:
+        threshold = self._hedge_threshold()
+        if threshold is None:
+            return self._timed(attempt)
+
+        with self._executor_lock:
+            if self._executor is None:
+                # Sized well above typical caller concurrency so that queueing
+                # in the pool does not eat into the hedging threshold.
+                self._executor = ThreadPoolExecutor(max_workers=64, thread_name_prefix="google-cse-hedge")
+        executor = self._executor
+
+        primary = executor.submit(self._timed, attempt)
+        done, _ = wait([primary], timeout=threshold)
+        if done:
+            return primary.result()
+
+        # The slower request cannot be interrupted; its result is discarded.
+        pending = {primary, executor.submit(self._timed, attempt)}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = error or future.exception()
+        raise error
+
+    async def _hedged_async(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        import asyncio
+
+        threshold = self._hedge_threshold()
+        if threshold is None:
+            return await self._timed_async(attempt)
+
+        primary = asyncio.ensure_future(self._timed_async(attempt))
+        done, _ = await asyncio.wait({primary}, timeout=threshold)
+        if done:
+            return primary.result()
+
+        pending = {primary, asyncio.ensure_future(self._timed_async(attempt))}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
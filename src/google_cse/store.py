@@ -0,0 +1,255 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Optional, Dict, List, Tuple, Iterator
+
+import pydantic_core
+
+from .results import GoogleSearchResponse, Result
+
+
+MAGIC = b"GCSESTR1"
+
+# Each record is: key length, payload length, key bytes, zlib-compressed JSON.
+_HEADER = struct.Struct("<HI")
+
+
+class ResultStore:
+    """
+    Append-only on-disk archive of search responses.
+
+    Responses are written as zlib-compressed JSON records to a data file and
+    indexed by query key in a small sidecar file (``<path>.idx``). Reads go
+    through a read-only memory map, so looking up one query or iterating
+    millions of stored results never loads the whole archive into memory.
+
+    Example:
+        with ResultStore("searches.cse") as store:
+            store.append(client.raw_search("cats"))
+            for result in store.iter_results():
+                print(result.link)
+    """
+
+    def __init__(self, path: str, compression_level: int = 6):
+        """
+        Args:
+            path: Data file to open or create
+            compression_level: zlib compression level (0-9) for new records
+        """
+        if not (0 <= compression_level <= 9):
+            raise ValueError("compression_level must be between 0 and 9")
+
+        self.path = path
+        self.index_path = path + ".idx"
+        self.compression_level = compression_level
+
+        self._lock = threading.Lock()
+        self._index: Dict[str, List[Tuple[int, int]]] = {}
+        self._count = 0
+        self._mmap: Optional[mmap.mmap] = None
+        self._mapped_size = 0
+
+        self._data = open(path, "a+b")
+        self._data.seek(0, os.SEEK_END)
+        if self._data.tell() == 0:
+            self._data.write(MAGIC)
+            self._data.flush()
+        else:
+            self._data.seek(0)
+            if self._data.read(len(MAGIC)) != MAGIC:
+                self._data.close()
+                raise ValueError(f"{path} is not a google-cse result store")
+
+        self._index_file = open(self.index_path, "a+", encoding="utf-8")
+        self._load_index()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def keys(self) -> List[str]:
+        """Return every stored query key."""
+        return list(self._index)
+
+    def append(self, response: GoogleSearchResponse, key: Optional[str] = None) -> None:
+        """
+        Append a response to the archive.
+
+        Args:
+            response: Response to store
+            key: Lookup key; defaults to the query's ``searchTerms``
+        """
+        if key is None:
+            key = self._default_key(response)
+
+        key_bytes = key.encode("utf-8")
+        if len(key_bytes) > 0xFFFF:
+            raise ValueError("key must be at most 65535 bytes when encoded")
+
+        payload = zlib.compress(response.to_json(), self.compression_level)
+        record = _HEADER.pack(len(key_bytes), len(payload)) + key_bytes + payload
+
+        with self._lock:
+            self._data.seek(0, os.SEEK_END)
+            offset = self._data.tell()
+            self._data.write(record)
+            self._data.flush()
+            self._write_index_entry(key, offset, len(record))
+
+    def get(self, key: str) -> List[GoogleSearchResponse]:
+        """Return every response stored under ``key``, oldest first."""
+        locations = self._index.get(key, [])
+        if not locations:
+            return []
+
+        buffer = self._buffer()
+        return [self._parse(self._read(buffer, offset)[1]) for offset, _ in locations]
+
+    def latest(self, key: str) -> Optional[GoogleSearchResponse]:
+        """Return the most recent response stored under ``key``."""
+        locations = self._index.get(key)
+        if not locations:
+            return None
+
+        return self._parse(self._read(self._buffer(), locations[-1][0])[1])
+
+    def iter_records(self) -> Iterator[Tuple[str, GoogleSearchResponse]]:
+        """Iterate over ``(key, response)`` pairs in insertion order."""
+        for key, payload in self._scan(self._buffer(), len(MAGIC)):
+            yield key, self._parse(payload)
+
+    def iter_responses(self) -> Iterator[GoogleSearchResponse]:
+        """Iterate over stored responses in insertion order."""
+        for _, response in self.iter_records():
+            yield response
+
+    def iter_results(self) -> Iterator[Result]:
+        """
+        Iterate over every stored result item.
+
+        Only the ``items`` of each record are validated, which is much
+        cheaper than building full responses.
+        """
+        for _, payload in self._scan(self._buffer(), len(MAGIC)):
+            document = pydantic_core.from_json(zlib.decompress(payload))
+            for item in document.get("items") or []:
+                yield Result.model_validate(item)
+
+    def close(self) -> None:
+        with self._lock:
+            self._mmap = None
+            self._data.close()
+            self._index_file.close()
+
+    @staticmethod
+    def _default_key(response: GoogleSearchResponse) -> str:
+        queries = response.queries
+        if queries and queries.request and queries.request[0].search_terms is not None:
+            return queries.request[0].search_terms
+        raise ValueError("response has no searchTerms; pass an explicit key")
+
+    @staticmethod
+    def _parse(payload: bytes) -> GoogleSearchResponse:
+        return GoogleSearchResponse.from_json(zlib.decompress(payload))
+
+    @staticmethod
+    def _read(buffer, offset: int) -> Tuple[str, bytes, int]:
+        """Decode the record at ``offset``; returns key, payload and next offset."""
+        key_length, payload_length = _HEADER.unpack_from(buffer, offset)
+        key_start = offset + _HEADER.size
+        payload_start = key_start + key_length
+        end = payload_start + payload_length
+        if end > len(buffer):
+            raise EOFError(f"truncated record at offset {offset}")
+
+        key = buffer[key_start:payload_start].decode("utf-8")
+        return key, buffer[payload_start:end], end
+
+    def _scan(self, buffer, offset: int) -> Iterator[Tuple[str, bytes]]:
+        if buffer is None:
+            return
+
+        size = len(buffer)
+        while offset + _HEADER.size <= size:
+            try:
+                key, payload, offset = self._read(buffer, offset)
+            except EOFError:
+                # A partially written trailing record; ignore it.
+                return
+            yield key, payload
+
+    def _buffer(self) -> Optional[mmap.mmap]:
+        """Return a read-only map of the data file, remapping after growth."""
+        size = os.path.getsize(self.path)
+        if size <= len(MAGIC):
+            return None
+
+        if self._mmap is None or size != self._mapped_size:
+            # Readers may still hold the previous map, so let it be collected
+            # rather than closing it under them.
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_size = size
+        return self._mmap
+
+    def _write_index_entry(self, key: str, offset: int, length: int) -> None:
+        self._index_file.write(json.dumps([offset, length, key]) + "\n")
+        self._index_file.flush()
+        self._index.setdefault(key, []).append((offset, length))
+        self._count += 1
+
+    def _load_index(self) -> None:
+        indexed_end = len(MAGIC)
+        self._index_file.seek(0)
+        while True:
+            position = self._index_file.tell()
+            line = self._index_file.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            try:
+                offset, length, key = json.loads(line)
+            except ValueError:
+                # A torn last line from a crash mid-append: drop it and let
+                # the scan below re-index the records it described.
+                self._index_file.truncate(position)
+                break
+            if not line.endswith("\n"):
+                self._index_file.write("\n")  # keep the next entry on its own line
+            self._index.setdefault(key, []).append((offset, length))
+            self._count += 1
+            indexed_end = max(indexed_end, offset + length)
+
+        # Recover records written after the last index entry (e.g. a crash
+        # between the data and index writes).
+        buffer = self._buffer()
+        if buffer is None or indexed_end >= len(buffer):
+            return
+
+        offset = indexed_end
+        size = len(buffer)
+        while offset + _HEADER.size <= size:
+            try:
+                key, _, end = self._read(buffer, offset)
+            except EOFError:
+                break
+            self._write_index_entry(key, offset, end - offset)
+            offset = end
+
+        if offset < size:
+            # Drop a partially written trailing record so new appends stay aligned.
+            del buffer
+            self._mmap = None
+            self._data.truncate(offset)
@@ -0,0 +1,382 @@
+"""
+Offline stand-in for the Custom Search endpoint.
+
+``FakeSearchServer`` is a localhost HTTP server that answers like the real
+API, so throughput, retries, rate limiting and credential failover can be
+exercised without spending quota:
+
+    with FakeSearchServer(latency=lognormal_latency(0.2), rate_limit_rate=0.05, seed=1) as server:
+        client = GoogleCSE("any-key", "any-cx", base_url=server.url)
+        client.web_search("python")
+"""
+
+import json
+import logging
+import math
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, Any, Callable, Tuple
+from urllib.parse import urlsplit, parse_qsl
+
+from .transport import load_recording, recording_key
+
+LatencyDistribution = Callable[[random.Random], float]
+
+# Recorded headers that describe the original connection and encoding; the
+# server sends its own.
+_TRANSPORT_HEADERS = frozenset({
+    "connection", "content-encoding", "content-length", "content-type", "date", "keep-alive", "server",
+    "transfer-encoding",
+})
+
+
+def constant_latency(seconds: float) -> LatencyDistribution:
+    """Every response takes ``seconds``."""
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> LatencyDistribution:
+    """Latency drawn uniformly between ``low`` and ``high`` seconds."""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> LatencyDistribution:
+    """Long-tailed latency with the given median, like real API traffic."""
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+def _error_body(code: int, message: str, reason: str, status: str) -> bytes:
+    return json.dumps({
+        "error": {
+            "code": code,
+            "message": message,
+            "errors": [{"message": message, "domain": "global", "reason": reason}],
+            "status": status,
+        }
+    }).encode("utf-8")
+
+
+def _query_item(params: Dict[str, str], start: int, count: int, total: int) -> dict:
+    item = {
+        "title": f"Google Custom Search - {params.get('q', '')}",
+        "totalResults": str(total),
+        "searchTerms": params.get("q", ""),
+        "count": count,
+        "startIndex": start,
+        "inputEncoding": "utf8",
+        "outputEncoding": "utf8",
+        "safe": params.get("safe", "off"),
+        "cx": params.get("cx", ""),
+    }
+    if params.get("searchType"):
+        item["searchType"] = params["searchType"]
+    return item
+
+
+def synthetic_response(params: Dict[str, str], total_results: int = 1000) -> dict:
+    """
+    Build a response for a request the way the API shapes it.
+
+    Items are derived from the query and rank only, so the same request
+    always gets the same body.
+
+    Args:
+        params: Query parameters of the request (string values)
+        total_results: Total result count the fake engine reports
+    """
+    query = params.get("q", "")
+    start = int(params.get("start", 1))
+    num = int(params.get("num", 10))
+    image = params.get("searchType") == "image"
+
+    # The API never serves past result 100.
+    available = min(total_results, 100)
+    count = max(0, min(num, available - start + 1))
+
+    items = []
+    for rank in range(start, start + count):
+        slug = f"{query.replace(' ', '-')}-{rank}"
+        item = {
+            "kind": "customsearch#result",
+            "title": f"{query} result {rank}",
+            "htmlTitle": f"<b>{query}</b> result {rank}",
+            "link": f"https://example.com/{slug}",
+            "displayLink": "example.com",
+            "snippet": f"Snippet for result {rank} about {query}.",
+            "htmlSnippet": f"Snippet for result {rank} about <b>{query}</b>.",
+            "formattedUrl": f"https://example.com/{slug}",
+        }
+        if image:
+            item["link"] = f"https://images.example.com/{slug}.jpg"
+            item["mime"] = "image/jpeg"
+            item["image"] = {
+                "contextLink": f"https://example.com/{slug}",
+                "height": 768,
+                "width": 1024,
+                "byteSize": 100000 + rank,
+                "thumbnailLink": f"https://thumbs.example.com/{slug}.jpg",
+                "thumbnailHeight": 96,
+                "thumbnailWidth": 128,
+            }
+        else:
+            item["pagemap"] = {"cse_thumbnail": [{"src": f"https://thumbs.example.com/{slug}.jpg"}]}
+        items.append(item)
+
+    queries = {"request": [_query_item(params, start, num, total_results)]}
+    if start + count <= available and count == num:
+        queries["nextPage"] = [_query_item(params, start + num, num, total_results)]
+
+    response = {
+        "kind": "customsearch#search",
+        "queries": queries,
+        "searchInformation": {
+            "searchTime": 0.1,
+            "formattedSearchTime": "0.10",
+            "totalResults": str(total_results),
+            "formattedTotalResults": f"{total_results:,}",
+        },
+    }
+    if items:
+        response["items"] = items
+    return response
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        params = dict(parse_qsl(urlsplit(self.path).query))
+        status, headers, body = self.server.fake.respond(params)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def _parse_fields(spec: str, pos: int = 0) -> Tuple[dict, int]:
+    """Parse a partial-response ``fields`` list into a {name: subtree or None} tree."""
+    tree: dict = {}
+    while pos < len(spec):
+        end = pos
+        while end < len(spec) and spec[end] not in ",()":
+            end += 1
+        path = spec[pos:end].strip().split("/")
+        node = tree
+        for name in path[:-1]:
+            child = node.setdefault(name, {})
+            node = child if child is not None else {}
+        pos = end
+        if pos < len(spec) and spec[pos] == "(":
+            node[path[-1]], pos = _parse_fields(spec, pos + 1)
+            pos += 1  # ")"
+        else:
+            node[path[-1]] = None
+        if pos < len(spec) and spec[pos] == ")":
+            return tree, pos
+        pos += 1  # ","
+    return tree, pos
+
+
+def select_fields(data: Any, fields: str) -> Any:
+    """
+    Apply the API's ``fields`` partial-response selector to a response.
+
+    Supports the ``a,b/c,d(e,f)`` syntax the Custom Search API accepts.
+    """
+    def select(value: Any, tree: Optional[dict]) -> Any:
+        if tree is None:
+            return value
+        if isinstance(value, list):
+            return [select(entry, tree) for entry in value]
+        if isinstance(value, dict):
+            return {name: select(value[name], sub) for name, sub in tree.items() if name in value}
+        return value
+
+    return select(data, _parse_fields(fields)[0])
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Load tests open many connections at once; the default backlog of 5
+    # makes the kernel drop SYNs and stalls clients for a full second.
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address) -> None:
+        # Clients closing pooled keep-alive connections are not errors.
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+
+class FakeSearchServer:
+    """
+    Localhost HTTP server that mimics the Custom Search JSON API.
+
+    Responses are either synthetic (see ``synthetic_response``) or replayed
+    from a recording made with ``RecordingTransport``. Synthetic responses
+    honor the ``fields`` partial-response parameter. Latency, server
+    errors, 429s and per-key daily quotas can be injected.
+
+    Outcomes are seeded per request: the n-th request for given parameters
+    always gets the same latency and status for the same seed, however
+    concurrent requests interleave.
+
+    Args:
+        latency: Distribution responses are delayed by (no delay by default)
+        error_rate: Fraction of requests answered with a 503
+        rate_limit_rate: Fraction of requests answered with a 429
+        retry_after: Retry-After header sent with injected 429s
+        daily_limit: Requests each API key may make before it gets
+            dailyLimitExceeded errors
+        total_results: Total result count of synthetic responses
+        fixtures: Path of a recording whose responses are replayed for
+            matching requests; other requests get synthetic responses
+        seed: Seed for latency and error injection
+        host: Interface to bind
+        port: Port to bind (0 picks a free one)
+    """
+
+    def __init__(
+        self,
+        latency: Optional[LatencyDistribution] = None,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: Optional[float] = None,
+        daily_limit: Optional[int] = None,
+        total_results: int = 1000,
+        fixtures: Optional[str] = None,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        if not (0.0 <= error_rate + rate_limit_rate <= 1.0):
+            raise ValueError("error_rate and rate_limit_rate must add up to between 0 and 1")
+
+        self._log = logging.getLogger(self.__class__.__name__)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.daily_limit = daily_limit
+        self.total_results = total_results
+        self.seed = seed
+        self.fixtures = load_recording(fixtures) if fixtures else {}
+
+        self._lock = threading.Lock()
+        self._seen: Counter = Counter()
+        self._key_usage: Counter = Counter()
+        self.status_counts: Counter = Counter()
+
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.fake = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Endpoint to pass to the client as ``base_url``."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/customsearch/v1"
+
+    @property
+    def request_count(self) -> int:
+        return sum(self.status_counts.values())
+
+    def start(self) -> "FakeSearchServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-cse", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeSearchServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def reset(self) -> None:
+        """Forget request history, per-key usage and status counts."""
+        with self._lock:
+            self._seen.clear()
+            self._key_usage.clear()
+            self.status_counts.clear()
+
+    def respond(self, params: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """Decide the (status, headers, body) for one request and apply its latency."""
+        key = recording_key(params)
+        with self._lock:
+            self._seen[key] += 1
+            occurrence = self._seen[key]
+            api_key = params.get("key", "")
+            self._key_usage[api_key] += 1
+            over_quota = self.daily_limit is not None and self._key_usage[api_key] > self.daily_limit
+
+        rng = random.Random(f"{self.seed}:{key}:{occurrence}")
+        if self.latency is not None:
+            time.sleep(max(0.0, self.latency(rng)))
+
+        recorded = self.fixtures.get(key)
+        fixture = recorded[min(occurrence, len(recorded)) - 1] if recorded else None
+
+        status, headers, body = self._outcome(params, rng, over_quota, fixture)
+        with self._lock:
+            self.status_counts[status] += 1
+        return status, headers, body
+
+    def _outcome(
+        self,
+        params: Dict[str, str],
+        rng: random.Random,
+        over_quota: bool,
+        fixture: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        if over_quota:
+            message = "Quota exceeded for quota metric 'Queries' and limit 'Queries per day'"
+            return 429, {}, _error_body(429, message, "dailyLimitExceeded", "RESOURCE_EXHAUSTED")
+
+        draw = rng.random()
+        if draw < self.rate_limit_rate:
+            headers = {"Retry-After": f"{self.retry_after:g}"} if self.retry_after is not None else {}
+            message = "Quota exceeded for quota metric 'Queries' and limit 'Queries per minute'"
+            return 429, headers, _error_body(429, message, "rateLimitExceeded", "RESOURCE_EXHAUSTED")
+        if draw < self.rate_limit_rate + self.error_rate:
+            return 503, {}, _error_body(503, "The service is currently unavailable.", "backendError", "UNAVAILABLE")
+
+        if fixture is not None:
+            # Recorded headers such as Retry-After are replayed too.
+            headers = {
+                name: value for name, value in (fixture.get("headers") or {}).items()
+                if name.lower() not in _TRANSPORT_HEADERS
+            }
+            return fixture["status"], headers, fixture["body"].encode("utf-8")
+
+        if not params.get("q"):
+            message = "Request contains an invalid argument."
+            return 400, {}, _error_body(400, message, "badRequest", "INVALID_ARGUMENT")
+        if int(params.get("start", 1)) + int(params.get("num", 10)) - 1 > 100:
+            message = "Request contains an invalid argument."
+            return 400, {}, _error_body(400, message, "invalid", "INVALID_ARGUMENT")
+
+        response = synthetic_response(params, self.total_results)
+        if params.get("fields"):
+            response = select_fields(response, params["fields"])
+        return 200, {}, json.dumps(response).encode("utf-8")
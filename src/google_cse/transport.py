@@ -0,0 +1,376 @@
+import json
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Mapping, List
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from pydantic import BaseModel, Field
+
+from .cache import make_cache_key
+
+
+class TransportConfig(BaseModel):
+    """Connection settings for the HTTP transport owned by the client."""
+
+    pool_connections: int = Field(
+        default=10,
+        ge=1,
+        description="Number of per-host connection pools to keep"
+    )
+    pool_maxsize: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum number of connections kept alive per host"
+    )
+    pool_block: bool = Field(
+        default=False,
+        description="Block instead of opening extra connections when the pool is exhausted"
+    )
+    connect_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds to wait for the TCP/TLS connection to be established"
+    )
+    read_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds to wait between bytes received from the server"
+    )
+    keep_alive: bool = Field(
+        default=True,
+        description="Reuse connections across requests"
+    )
+    http2: bool = Field(
+        default=False,
+        description="Use HTTP/2 (requires the optional 'httpx[http2]' dependency)"
+    )
+
+
+@dataclass
+class TransportResponse:
+    """Transport-agnostic view of an HTTP response."""
+
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+    url: str
+    elapsed: float = 0.0
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        """Raise ``requests.exceptions.HTTPError`` for 4xx/5xx responses."""
+        if self.status_code >= 400:
+            kind = "Client" if self.status_code < 500 else "Server"
+            # The query string carries the API key, so keep it out of the message.
+            url = self.url.split("?", 1)[0]
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} {kind} Error for url: {url}",
+                response=self,
+            )
+
+
+class Transport:
+    """
+    Base class for synchronous HTTP transports.
+
+    A transport owns its connection pool and is reused for every request the
+    client makes. Subclasses implement ``get`` and, if they hold resources,
+    ``close``.
+    """
+
+    def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """Pooled keep-alive transport built on a ``requests.Session``."""
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self._log = logging.getLogger(self.__class__.__name__)
+        self.config = config or TransportConfig()
+
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not self.config.keep_alive:
+            self.session.headers["Connection"] = "close"
+
+        self._timeout = (self.config.connect_timeout, self.config.read_timeout)
+
+    def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        response = self.session.get(url, params=params, timeout=self._timeout)
+        return TransportResponse(
+            status_code=response.status_code,
+            headers=response.headers,
+            content=response.content,
+            url=response.url,
+            elapsed=response.elapsed.total_seconds(),
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError(
+            "httpx is required for this transport; install it with 'pip install google-cse[async]' or 'google-cse[http2]'"
+        ) from e
+    return httpx
+
+
+def _httpx_client_kwargs(httpx, config: TransportConfig) -> Dict[str, Any]:
+    """Translate a TransportConfig into httpx client arguments."""
+    limits = httpx.Limits(
+        max_connections=config.pool_connections * config.pool_maxsize,
+        max_keepalive_connections=config.pool_maxsize if config.keep_alive else 0,
+    )
+    timeout = httpx.Timeout(config.read_timeout, connect=config.connect_timeout)
+    return {"http2": config.http2, "limits": limits, "timeout": timeout}
+
+
+@contextmanager
+def _translate_httpx_errors(httpx):
+    """Re-raise httpx network errors as the matching ``requests`` exceptions."""
+    try:
+        yield
+    except httpx.ConnectTimeout as e:
+        raise requests.exceptions.ConnectTimeout(str(e)) from e
+    except httpx.TimeoutException as e:
+        raise requests.exceptions.ReadTimeout(str(e)) from e
+    except httpx.HTTPError as e:
+        raise requests.exceptions.ConnectionError(str(e)) from e
+
+
+def _from_httpx_response(response) -> TransportResponse:
+    return TransportResponse(
+        status_code=response.status_code,
+        headers=response.headers,
+        content=response.content,
+        url=str(response.url),
+        elapsed=response.elapsed.total_seconds(),
+    )
+
+
+class HttpxTransport(Transport):
+    """
+    Pooled transport built on ``httpx.Client``, with optional HTTP/2.
+
+    Network errors are re-raised as the matching ``requests`` exceptions so
+    callers can handle every transport the same way.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self._log = logging.getLogger(self.__class__.__name__)
+        self._httpx = _import_httpx()
+        self.config = config or TransportConfig()
+        self.client = self._httpx.Client(**_httpx_client_kwargs(self._httpx, self.config))
+
+    def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        with _translate_httpx_errors(self._httpx):
+            response = self.client.get(url, params=params)
+        return _from_httpx_response(response)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class AsyncTransport:
+    """Base class for asyncio HTTP transports."""
+
+    async def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "AsyncTransport":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+class HttpxAsyncTransport(AsyncTransport):
+    """Pooled asyncio transport built on ``httpx.AsyncClient``."""
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self._log = logging.getLogger(self.__class__.__name__)
+        self._httpx = _import_httpx()
+        self.config = config or TransportConfig()
+        self.client = self._httpx.AsyncClient(**_httpx_client_kwargs(self._httpx, self.config))
+
+    async def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        with _translate_httpx_errors(self._httpx):
+            response = await self.client.get(url, params=params)
+        return _from_httpx_response(response)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+def recording_key(params: Mapping[str, Any]) -> str:
+    """
+    Key that matches a request against recorded responses.
+
+    Values are compared as strings, so parameters parsed from a query
+    string match the ones the client built, and the API key is ignored.
+    """
+    return make_cache_key({name: str(value) for name, value in params.items()})
+
+
+def load_recording(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Read a recording into lists of entries per ``recording_key``, in recorded order."""
+    entries: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                entries[entry["key"]].append(entry)
+    return dict(entries)
+
+
+class _RecordingFile:
+    """Appends request/response pairs to a JSON Lines recording."""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, params: Mapping[str, Any], response: TransportResponse) -> None:
+        entry = {
+            "key": recording_key(params),
+            # Never write the API key to disk.
+            "params": {name: value for name, value in params.items() if name != "key"},
+            "status": response.status_code,
+            "headers": dict(response.headers),
+            "body": response.content.decode("utf-8", errors="replace"),
+        }
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class RecordingTransport(Transport):
+    """
+    Transport that passes requests through and appends every exchange to a
+    JSON Lines file that ``ReplayTransport`` or ``FakeSearchServer`` can
+    serve back later.
+    """
+
+    def __init__(self, transport: Transport, path: str):
+        self.transport = transport
+        self.path = path
+        self._recording = _RecordingFile(path)
+
+    def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        response = self.transport.get(url, params=params)
+        self._recording.write(params, response)
+        return response
+
+    def close(self) -> None:
+        self._recording.close()
+        self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Transport that answers from a recording instead of the network.
+
+    Requests are matched by ``recording_key``. When the same request was
+    recorded several times (a 429 and then its retry, say) the responses
+    are replayed in order and the last one repeats. Unmatched requests
+    raise ``requests.exceptions.RequestException``.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries = load_recording(path)
+        self._lock = threading.Lock()
+        self._replayed: Dict[str, int] = defaultdict(int)
+
+    def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        key = recording_key(params)
+        recorded = self._entries.get(key)
+        if not recorded:
+            raise requests.exceptions.RequestException(f"no recorded response for query {params.get('q')!r}")
+
+        with self._lock:
+            index = min(self._replayed[key], len(recorded) - 1)
+            self._replayed[key] += 1
+
+        entry = recorded[index]
+        return TransportResponse(
+            status_code=entry["status"],
+            headers=CaseInsensitiveDict(entry["headers"]),
+            content=entry["body"].encode("utf-8"),
+            url=url,
+        )
+
+
+class AsyncRecordingTransport(AsyncTransport):
+    """Asyncio counterpart of ``RecordingTransport``."""
+
+    def __init__(self, transport: AsyncTransport, path: str):
+        self.transport = transport
+        self.path = path
+        self._recording = _RecordingFile(path)
+
+    async def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        response = await self.transport.get(url, params=params)
+        self._recording.write(params, response)
+        return response
+
+    async def aclose(self) -> None:
+        self._recording.close()
+        await self.transport.aclose()
+
+
+class AsyncReplayTransport(AsyncTransport):
+    """Asyncio counterpart of ``ReplayTransport``."""
+
+    def __init__(self, path: str):
+        self._replay = ReplayTransport(path)
+
+    async def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        return self._replay.get(url, params)
+
+
+def create_transport(config: Optional[TransportConfig] = None) -> Transport:
+    """Create the default transport for a configuration."""
+    config = config or TransportConfig()
+    if config.http2:
+        return HttpxTransport(config)
+    return RequestsTransport(config)
+
+
+def create_async_transport(config: Optional[TransportConfig] = None) -> AsyncTransport:
+    """Create the default asyncio transport for a configuration."""
+    return HttpxAsyncTransport(config)
@@ -0,0 +1,406 @@
+import heapq
+import logging
+import math
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Tuple, Iterator, Callable, Deque
+
+from pydantic import BaseModel, Field
+
+from .batch import run_batch
+from .client import GoogleCSE
+from .dedup import canonical_url
+from .pagination import MAX_RESULTS
+from .parameters import SearchParameters, WebSearchParameters
+
+DAY = 86400.0
+
+
+class WatchPolicy(BaseModel):
+    """How often watched queries are refreshed."""
+
+    min_interval: float = Field(
+        default=3600.0,
+        gt=0,
+        description="Shortest time between two refreshes of a query, in seconds"
+    )
+    max_interval: float = Field(
+        default=7 * DAY,
+        gt=0,
+        description="Longest time between two refreshes of a query, in seconds"
+    )
+    initial_interval: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Interval of a newly added query; defaults to min_interval"
+    )
+    speedup: float = Field(
+        default=0.5,
+        gt=0,
+        le=1,
+        description="Factor applied to the interval after a refresh that found changes"
+    )
+    backoff: float = Field(
+        default=1.5,
+        ge=1,
+        description="Factor applied to the interval after a refresh that found none"
+    )
+    jitter: float = Field(
+        default=0.1,
+        ge=0,
+        lt=1,
+        description="Random fraction added to or removed from every interval, so queries added together drift apart"
+    )
+    max_results: int = Field(
+        default=10,
+        ge=1,
+        le=MAX_RESULTS,
+        description="Number of top results tracked per query"
+    )
+    history_size: int = Field(
+        default=20,
+        ge=1,
+        description="Number of diffs kept per query"
+    )
+    emit_initial: bool = Field(
+        default=False,
+        description="Emit the first refresh of a query, with every result as added"
+    )
+
+    def next_interval(self, interval: float, changed: bool) -> float:
+        """Interval after a refresh, before jitter."""
+        interval *= self.speedup if changed else self.backoff
+        return min(self.max_interval, max(self.min_interval, interval))
+
+
+@dataclass
+class ResultDiff:
+    """
+    Change in a query's results between two refreshes.
+
+    Ranks are 1-based positions in the tracked top ``max_results``. Links
+    are compared by ``canonical_url``, so tracking parameters or a switch
+    to https do not count as a change.
+    """
+
+    query: str
+    checked_at: float
+    added: List[Tuple[str, int]] = field(default_factory=list)
+    dropped: List[Tuple[str, int]] = field(default_factory=list)
+    moved: List[Tuple[str, int, int]] = field(default_factory=list)
+    initial: bool = False
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.dropped or self.moved)
+
+
+@dataclass
+class WatchedQuery:
+    """A query on the watchlist and its refresh state."""
+
+    query: str
+    parameters: Optional[SearchParameters]
+    fresh: bool
+    interval: float
+    next_due: float
+    key: str
+    ranking: Dict[str, Tuple[str, int]] = field(default_factory=dict)
+    seen: "OrderedDict[str, None]" = field(default_factory=OrderedDict)
+    history: Deque[ResultDiff] = field(default_factory=deque)
+    last_checked: Optional[float] = None
+    checks: int = 0
+    changes: int = 0
+    failures: int = 0
+
+    @property
+    def change_rate(self) -> float:
+        """Fraction of refreshes (after the first) that found changes."""
+        return self.changes / (self.checks - 1) if self.checks > 1 else 0.0
+
+
+def diff_rankings(
+    query: str,
+    old: Dict[str, Tuple[str, int]],
+    new: Dict[str, Tuple[str, int]],
+    checked_at: float
+) -> ResultDiff:
+    """Diff two ``{canonical_url: (link, rank)}`` rankings."""
+    diff = ResultDiff(query, checked_at)
+    for key, (link, rank) in new.items():
+        previous = old.get(key)
+        if previous is None:
+            diff.added.append((link, rank))
+        elif previous[1] != rank:
+            diff.moved.append((link, previous[1], rank))
+    for key, (link, rank) in old.items():
+        if key not in new:
+            diff.dropped.append((link, rank))
+    diff.added.sort(key=lambda entry: entry[1])
+    diff.dropped.sort(key=lambda entry: entry[1])
+    diff.moved.sort(key=lambda entry: entry[2])
+    return diff
+
+
+class Watchlist:
+    """
+    Re-runs a set of web searches on adaptive intervals and reports what
+    changed.
+
+    Every query has its own refresh interval: it is multiplied by
+    ``policy.speedup`` when a refresh finds changes and by ``policy.backoff``
+    when it does not, within ``[min_interval, max_interval]``. Queries
+    whose results never move end up being checked rarely, so quota goes to
+    the ones that do.
+
+    A refresh compares the top ``max_results`` links with the previous
+    ones and produces a ``ResultDiff`` of added, dropped and moved links;
+    only diffs with changes are emitted and the last ``history_size`` are
+    kept per query.
+
+    Queries added with ``fresh=True`` track new documents instead of
+    rankings: they are searched with ``sort=date`` and a ``date_restrict``
+    covering the time since the previous refresh, so the API returns only
+    recent pages and a diff lists links not reported before.
+
+    Example:
+        watchlist = Watchlist(client)
+        watchlist.add("python release")
+        watchlist.add("python security advisory", fresh=True)
+        for diff in watchlist.run():
+            print(diff.query, diff.added, diff.dropped, diff.moved)
+    """
+
+    def __init__(
+        self,
+        client: GoogleCSE,
+        policy: Optional[WatchPolicy] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            client: Client used for the searches; its cache should be off or
+                expire well within ``min_interval``
+            policy: Refresh interval and history settings
+            clock: Time source, in seconds
+        """
+        self._log = logging.getLogger(self.__class__.__name__)
+        self.client = client
+        self.policy = policy or WatchPolicy()
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._queries: Dict[str, WatchedQuery] = {}
+        self._schedule: List[Tuple[float, int, str]] = []
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._queries
+
+    def __iter__(self) -> Iterator[WatchedQuery]:
+        return iter(list(self._queries.values()))
+
+    @staticmethod
+    def make_key(query: str, parameters: Optional[SearchParameters] = None, fresh: bool = False) -> str:
+        """Identifier of a watched query."""
+        key = query
+        if parameters is not None:
+            key += "|" + parameters.compile().digest
+        return key + "|fresh" if fresh else key
+
+    def add(
+        self,
+        query: str,
+        parameters: Optional[WebSearchParameters] = None,
+        fresh: bool = False
+    ) -> WatchedQuery:
+        """
+        Start watching a query; it is first refreshed on the next run.
+
+        Args:
+            query: Search query
+            parameters: Web search parameters for every refresh
+            fresh: Track newly published results instead of rank changes
+
+        Returns:
+            The WatchedQuery (the existing one if already watched)
+        """
+        key = self.make_key(query, parameters, fresh)
+        with self._lock:
+            watched = self._queries.get(key)
+            if watched is None:
+                watched = WatchedQuery(
+                    query=query,
+                    parameters=parameters,
+                    fresh=fresh,
+                    interval=self.policy.initial_interval or self.policy.min_interval,
+                    next_due=self._clock(),
+                    key=key,
+                    history=deque(maxlen=self.policy.history_size),
+                )
+                self._queries[key] = watched
+                self._push(watched)
+            return watched
+
+    def remove(self, key: str) -> None:
+        """Stop watching the query with ``key`` (see ``make_key``)."""
+        with self._lock:
+            self._queries.pop(key, None)
+
+    def _push(self, watched: WatchedQuery) -> None:
+        self._sequence += 1
+        heapq.heappush(self._schedule, (watched.next_due, self._sequence, watched.key))
+
+    def _pop_due(self, now: float) -> List[WatchedQuery]:
+        due = []
+        with self._lock:
+            while self._schedule and self._schedule[0][0] <= now:
+                next_due, _, key = heapq.heappop(self._schedule)
+                watched = self._queries.get(key)
+                # Entries of removed queries are dropped lazily.
+                if watched is not None and watched.next_due == next_due:
+                    due.append(watched)
+        return due
+
+    def next_due(self) -> Optional[float]:
+        """Time at which the next query is due, or None if none is watched."""
+        with self._lock:
+            while self._schedule:
+                next_due, _, key = self._schedule[0]
+                watched = self._queries.get(key)
+                if watched is not None and watched.next_due == next_due:
+                    return next_due
+                heapq.heappop(self._schedule)
+        return None
+
+    def _request_parameters(self, watched: WatchedQuery, now: float) -> Optional[SearchParameters]:
+        if not watched.fresh:
+            return watched.parameters
+
+        parameters = (watched.parameters or WebSearchParameters()).model_copy()
+        parameters.sort = "date"
+        if parameters.date_restrict is None:
+            since = now - watched.last_checked if watched.last_checked is not None else watched.interval
+            parameters.date_restrict = f"d{max(1, math.ceil(since / DAY))}"
+        return parameters
+
+    def refresh(self, watched: WatchedQuery) -> ResultDiff:
+        """Search one watched query now and diff it with the previous refresh."""
+        now = self._clock()
+        parameters = self._request_parameters(watched, now)
+
+        ranking: Dict[str, Tuple[str, int]] = {}
+        rank = 0
+        for result in self.client.search_all(watched.query, self.policy.max_results, parameters=parameters):
+            rank += 1
+            if result.link:
+                ranking.setdefault(canonical_url(result.link), (result.link, rank))
+
+        initial = watched.checks == 0
+        if watched.fresh:
+            diff = ResultDiff(watched.query, now)
+            for key, (link, rank) in ranking.items():
+                if key not in watched.seen:
+                    diff.added.append((link, rank))
+                watched.seen[key] = None
+                watched.seen.move_to_end(key)
+            # Bound the seen set to a few refreshes' worth of links.
+            while len(watched.seen) > self.policy.max_results * self.policy.history_size:
+                watched.seen.popitem(last=False)
+        else:
+            diff = diff_rankings(watched.query, watched.ranking, ranking, now)
+        diff.initial = initial
+
+        watched.ranking = ranking
+        watched.last_checked = now
+        watched.checks += 1
+        if not initial and diff.changed:
+            watched.changes += 1
+            watched.history.append(diff)
+        return diff
+
+    def _reschedule(self, watched: WatchedQuery, changed: Optional[bool]) -> None:
+        if changed is not None:
+            watched.interval = self.policy.next_interval(watched.interval, changed)
+        jitter = 1 + random.uniform(-self.policy.jitter, self.policy.jitter)
+        with self._lock:
+            if watched.key not in self._queries:
+                return
+            watched.next_due = self._clock() + watched.interval * jitter
+            self._push(watched)
+
+    def _requeue(self, watched: WatchedQuery) -> None:
+        """Put a popped query back on the schedule at its current due time."""
+        with self._lock:
+            if watched.key in self._queries:
+                self._push(watched)
+
+    def _refresh_due(self, watched: WatchedQuery, claimed: set) -> Optional[ResultDiff]:
+        with self._lock:
+            if watched.key in claimed:
+                return None  # requeued by a run_pending that was closed early
+            claimed.add(watched.key)
+
+        try:
+            diff = self.refresh(watched)
+        except Exception as e:
+            watched.failures += 1
+            self._log.warning(f"Refreshing {watched.query!r} failed: {e}")
+            self._reschedule(watched, None)
+            raise
+        self._reschedule(watched, None if diff.initial else diff.changed)
+        return diff
+
+    def run_pending(self, max_workers: int = 8) -> Iterator[ResultDiff]:
+        """
+        Refresh every query that is due and yield the diffs with changes.
+
+        Each query is rescheduled as soon as its refresh finishes, whether
+        or not its diff is consumed; queries not yet refreshed when the
+        iterator is closed stay due. Failed refreshes are logged and retried
+        after the query's current interval, which is left unchanged.
+
+        Args:
+            max_workers: Number of queries refreshed at once
+        """
+        due = self._pop_due(self._clock())
+        claimed: set = set()
+        outcomes = run_batch(lambda watched: self._refresh_due(watched, claimed), due, max_workers)
+        try:
+            for _, watched, diff, error in outcomes:
+                if error is None and diff.changed and (not diff.initial or self.policy.emit_initial):
+                    yield diff
+        finally:
+            outcomes.close()
+            with self._lock:
+                unclaimed = [watched for watched in due if watched.key not in claimed]
+                claimed.update(watched.key for watched in unclaimed)
+            for watched in unclaimed:
+                self._requeue(watched)
+
+    def run(
+        self,
+        stop: Optional[threading.Event] = None,
+        max_workers: int = 8
+    ) -> Iterator[ResultDiff]:
+        """
+        Refresh queries as they come due until ``stop`` is set, yielding the
+        diffs with changes.
+
+        Args:
+            stop: Event that ends the loop; runs forever if None
+            max_workers: Number of queries refreshed at once
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            yield from self.run_pending(max_workers)
+            next_due = self.next_due()
+            wait = self.policy.min_interval if next_due is None else next_due - self._clock()
+            if wait > 0:
+                stop.wait(wait)
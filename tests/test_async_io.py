@@ -0,0 +1,53 @@
+import asyncio
+import threading
+
+import pytest
+
+from google_cse import AsyncGoogleCSE, RateLimiter, SQLiteCache
+from google_cse.testing import FakeSearchServer
+
+pytest.importorskip("httpx")
+
+
+class ThreadRecordingCache(SQLiteCache):
+    """SQLiteCache that records which threads touch it."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key, response):
+        self.threads.add(threading.get_ident())
+        super().set(key, response)
+
+
+class ThreadRecordingLimiter(RateLimiter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.threads = set()
+
+    def try_acquire(self):
+        self.threads.add(threading.get_ident())
+        return super().try_acquire()
+
+
+def test_sqlite_backends_stay_off_the_event_loop(tmp_path):
+    cache = ThreadRecordingCache(str(tmp_path / "cache.db"))
+    limiter = ThreadRecordingLimiter(qps=100, state_path=str(tmp_path / "limits.db"))
+
+    async def search():
+        loop_thread = threading.get_ident()
+        with FakeSearchServer() as server:
+            async with AsyncGoogleCSE(api_key="k", search_engine_id="cx", base_url=server.url,
+                                      cache=cache, rate_limiter=limiter) as client:
+                await client.raw_search("python")
+                await client.raw_search("python")  # cache hit
+        return loop_thread
+
+    loop_thread = asyncio.run(search())
+    assert cache.threads and loop_thread not in cache.threads
+    assert limiter.threads and loop_thread not in limiter.threads
@@ -0,0 +1,48 @@
+import itertools
+import threading
+
+from google_cse.batch import run_batch
+
+
+def test_ordered_outcomes_with_errors_captured():
+    def square(n):
+        if n == 3:
+            raise ValueError("three")
+        return n * n
+
+    outcomes = list(run_batch(square, range(6), max_workers=3, ordered=True))
+    assert [index for index, _, _, _ in outcomes] == list(range(6))
+    assert [result for _, _, result, error in outcomes if error is None] == [0, 1, 4, 16, 25]
+    assert isinstance(outcomes[3][3], ValueError)
+
+
+def test_input_is_consumed_lazily():
+    pulled = []
+
+    def items():
+        for n in itertools.count():
+            pulled.append(n)
+            yield n
+
+    outcomes = run_batch(lambda n: n, items(), max_workers=2, max_pending=4)
+    for _ in range(3):
+        next(outcomes)
+    outcomes.close()
+    assert len(pulled) <= 3 + 4
+
+
+def test_at_most_max_workers_calls_run_at_once():
+    lock = threading.Lock()
+    running = peak = 0
+
+    def work(_):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        threading.Event().wait(0.005)
+        with lock:
+            running -= 1
+
+    list(run_batch(work, range(20), max_workers=3))
+    assert peak <= 3
@@ -0,0 +1,52 @@
+import time
+
+from google_cse import GoogleCSE, GoogleSearchResponse, MemoryCache, SQLiteCache
+from google_cse.transport import Transport, TransportResponse
+
+
+class CountingTransport(Transport):
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, params):
+        self.calls += 1
+        return TransportResponse(200, {}, b'{"items": [{"link": "https://a.example/"}]}', url)
+
+
+def response(link):
+    return GoogleSearchResponse.model_validate({"items": [{"link": link}]})
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_size=2)
+    cache.set("a", response("https://a.example/"))
+    cache.set("b", response("https://b.example/"))
+    cache.get("a")
+    cache.set("c", response("https://c.example/"))
+
+    assert cache.get("b") is None
+    assert cache.get("a").items[0].link == "https://a.example/"
+
+
+def test_memory_cache_expires_entries():
+    cache = MemoryCache(ttl=0.01)
+    cache.set("a", response("https://a.example/"))
+    time.sleep(0.02)
+    assert cache.get("a") is None
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    SQLiteCache(path).set("a", response("https://a.example/"))
+    assert SQLiteCache(path).get("a").items[0].link == "https://a.example/"
+
+
+def test_client_serves_repeated_searches_from_cache():
+    transport = CountingTransport()
+    client = GoogleCSE(api_key="k", search_engine_id="cx", transport=transport, cache=MemoryCache())
+    first = client.raw_search("python")
+    second = client.raw_search("python")
+
+    assert transport.calls == 1
+    assert second.items[0].link == first.items[0].link
+    assert client.cache_stats.hits == 1
@@ -0,0 +1,25 @@
+import json
+
+from google_cse.cli import main
+
+
+def run(tmp_path, parameters):
+    queries = tmp_path / "queries.txt"
+    queries.write_text("cats\ndogs\n{\"query\": \"birds\", \"parameters\": {\"language\": \"en\"}}\n")
+    shared = tmp_path / "parameters.json"
+    shared.write_text(json.dumps(parameters))
+    output = tmp_path / "results.ndjson"
+    code = main([
+        str(queries), "-o", str(output), "--fake-server", "--parameters", str(shared),
+        "--processes", "1", "--threads", "2", "--num-results", "2", "-q",
+    ])
+    assert code == 0
+    return [json.loads(line) for line in output.read_text().splitlines()]
+
+
+def test_resume_skips_done_queries_only_with_the_same_shared_parameters(tmp_path):
+    assert len(run(tmp_path, {"country": "countryUS"})) == 6
+    # Same shared parameters: everything is already checkpointed.
+    assert len(run(tmp_path, {"country": "countryUS"})) == 6
+    # Different shared parameters: every query runs again.
+    assert len(run(tmp_path, {"country": "countryDE"})) == 12
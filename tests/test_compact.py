@@ -0,0 +1,90 @@
+import json
+
+from google_cse import (
+    CompactImageResult, CompactWebResult, GoogleCSE, GoogleSearchResponse, ImageResultBatch,
+    ImageSearchResult, LazySearchResponse, ResultBatch, WebSearchResult,
+)
+from google_cse.transport import Transport, TransportResponse
+
+WEB_ITEM = {
+    "title": "Python",
+    "htmlTitle": "<b>Python</b>",
+    "link": "https://python.org/",
+    "displayLink": "python.org",
+    "snippet": "The official home",
+    "htmlSnippet": "The <b>official</b> home",
+    "formattedUrl": "https://python.org/",
+    "pagemap": {"metatags": [{"og:title": "Python"}]},
+}
+IMAGE_ITEM = {
+    "title": "Logo",
+    "link": "https://python.org/logo.png",
+    "image": {
+        "contextLink": "https://python.org/",
+        "height": 64,
+        "width": 128,
+        "byteSize": 2048,
+        "thumbnailLink": "https://thumb.example/1",
+        "thumbnailHeight": 32,
+        "thumbnailWidth": 64,
+    },
+}
+
+
+def body(*items):
+    return json.dumps({"items": list(items)}).encode()
+
+
+class StaticTransport(Transport):
+    def get(self, url, params):
+        return TransportResponse(200, {}, body(WEB_ITEM, dict(WEB_ITEM, link=f"https://python.org/{params['q']}")), url)
+
+
+def test_from_item_matches_the_models():
+    assert CompactWebResult.from_item(WEB_ITEM).to_model() == WebSearchResult.from_item(WEB_ITEM)
+    assert CompactImageResult.from_item(IMAGE_ITEM).to_model() == ImageSearchResult.from_item(IMAGE_ITEM)
+    assert CompactImageResult.from_item(IMAGE_ITEM).image_byte_size == 2048
+
+
+def test_columnar_round_trip():
+    batch = ResultBatch.from_json(body(WEB_ITEM, {"link": "https://docs.python.org/"}))
+
+    assert len(batch) == 2
+    assert batch.column("link") == ["https://python.org/", "https://docs.python.org/"]
+    assert batch.to_models() == [WebSearchResult.from_item(WEB_ITEM), WebSearchResult(link="https://docs.python.org/")]
+
+    images = ImageResultBatch.from_json(body(IMAGE_ITEM))
+    assert images.to_models() == [ImageSearchResult.from_item(IMAGE_ITEM)]
+
+
+def test_extend_and_indexing():
+    batch = ResultBatch.from_json(body(WEB_ITEM))
+    batch.extend(ResultBatch([CompactWebResult(link="https://a.example/"), CompactWebResult(link="https://b.example/")]))
+
+    assert len(batch) == 3
+    assert batch[0] == CompactWebResult.from_item(WEB_ITEM)
+    assert batch[2].link == "https://b.example/"
+    assert batch[-1] == batch[2]
+    assert [row.link for row in batch] == batch.column("link")
+
+
+def test_from_response_reads_eager_and_lazy_responses():
+    data = body(WEB_ITEM, IMAGE_ITEM)
+    expected = list(ResultBatch.from_json(data))
+
+    assert list(ResultBatch.from_response(LazySearchResponse.from_json(data))) == expected
+    assert list(ResultBatch.from_response(GoogleSearchResponse.from_json(data))) == expected
+    assert list(ImageResultBatch.from_response(GoogleSearchResponse.from_json(data)))[1] == \
+        CompactImageResult.from_item(IMAGE_ITEM)
+
+
+def test_search_many_returns_compact_batches():
+    for lazy in (False, True):
+        client = GoogleCSE(api_key="k", search_engine_id="cx", transport=StaticTransport(), lazy_parsing=lazy)
+        outcomes = list(client.search_many(["a", "b"], ordered=True, compact=True))
+
+        assert all(isinstance(outcome.results, ResultBatch) for outcome in outcomes)
+        assert [outcome.results.column("link") for outcome in outcomes] == [
+            ["https://python.org/", "https://python.org/a"],
+            ["https://python.org/", "https://python.org/b"],
+        ]
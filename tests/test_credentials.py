@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from google_cse import Credential, CredentialPool, GoogleCSE, QuotaExhausted, RateLimiter, RateLimitExceeded
+from google_cse.transport import Transport, TransportResponse
+
+QUOTA_ERROR = json.dumps({
+    "error": {"code": 429, "message": "Quota exceeded", "errors": [{"reason": "rateLimitExceeded"}]}
+}).encode()
+
+
+class QuotaTransport(Transport):
+    def __init__(self):
+        self.keys = []
+
+    def get(self, url, params):
+        self.keys.append(params["key"])
+        return TransportResponse(429, {}, QUOTA_ERROR, url)
+
+
+def pool():
+    return CredentialPool([
+        Credential(api_key="key-1", search_engine_id="cx"),
+        Credential(api_key="key-2", search_engine_id="cx"),
+    ])
+
+
+def test_last_credential_out_of_quota_raises_quota_exhausted():
+    transport = QuotaTransport()
+    client = GoogleCSE(credentials=pool(), transport=transport)
+
+    with pytest.raises(QuotaExhausted) as raised:
+        client.raw_search("python")
+    assert sorted(transport.keys) == ["key-1", "key-2"]
+    assert 0 < raised.value.retry_after <= 60
+
+
+class OkTransport(Transport):
+    def get(self, url, params):
+        return TransportResponse(200, {}, b'{"items": []}', url)
+
+
+def test_refused_requests_do_not_use_credential_quota():
+    credentials = pool()
+    limiter = RateLimiter(qps=1, blocking=False)
+    client = GoogleCSE(credentials=credentials, transport=OkTransport(), rate_limiter=limiter)
+
+    client.raw_search("python")
+    with pytest.raises(RateLimitExceeded):
+        client.raw_search("golang")
+    assert sum(entry["used_today"] for entry in credentials.usage()) == 1
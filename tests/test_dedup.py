@@ -0,0 +1,41 @@
+from google_cse import BloomFilter, DedupIndex, canonical_url
+
+
+def test_canonical_url_ignores_trivial_differences():
+    assert canonical_url("https://www.Example.com/page/?utm_source=x&b=2&a=1#top") == \
+        canonical_url("http://example.com:80/page?a=1&b=2")
+    assert canonical_url("https://example.com/a") != canonical_url("https://example.com/b")
+
+
+def test_canonical_url_keeps_meaningful_parameters():
+    # Sites use ?ref= for branches, tags and referral codes, not only tracking.
+    assert canonical_url("https://github.com/org/repo/tree?ref=main") != \
+        canonical_url("https://github.com/org/repo/tree?ref=v1.0")
+    assert canonical_url("https://example.com/?ref_src=twsrc") == canonical_url("https://example.com/")
+
+
+def test_index_drops_repeated_links():
+    index = DedupIndex()
+    items = [
+        {"link": "https://example.com/a"},
+        {"link": "https://www.example.com/a/"},
+        {"link": "https://example.com/b"},
+    ]
+    assert [item["link"] for item in index.filter(items)] == ["https://example.com/a", "https://example.com/b"]
+    assert (index.unique, index.duplicates) == (2, 1)
+
+
+def test_near_duplicate_snippets():
+    index = DedupIndex(near_duplicates=True)
+    snippet = "Python is a programming language that lets you work quickly and integrate systems effectively."
+    assert index.add({"link": "https://a.example/", "snippet": snippet})
+    assert not index.add({"link": "https://b.example/", "snippet": snippet + "!"})
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    keys = [f"https://example.com/{i}" for i in range(1000)]
+    assert bloom.add(keys[0])
+    for key in keys:
+        bloom.add(key)
+    assert not any(bloom.add(key) for key in keys)
@@ -0,0 +1,118 @@
+import io
+import json
+
+import pytest
+
+from google_cse import GoogleSearchResponse, LazySearchResponse, NDJSONWriter, ParquetWriter, WebSearchResult
+from google_cse.batch import BatchResult
+from google_cse.export import response_rows
+
+
+def page(start, count, total="1200"):
+    return {
+        "queries": {"request": [{"searchTerms": "python", "startIndex": start}]},
+        "searchInformation": {"totalResults": total},
+        "items": [{"title": f"Result {start + i}", "link": f"https://example.com/{start + i}"} for i in range(count)],
+    }
+
+
+class CountingFile(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def rows(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def test_response_rows_for_eager_and_lazy_responses():
+    eager = list(response_rows(GoogleSearchResponse.model_validate(page(11, 2))))
+    lazy = list(response_rows(LazySearchResponse(page(11, 2))))
+
+    assert eager == lazy
+    assert [(row["query"], row["rank"], row["total_results"]) for row in eager] == [("python", 11, 1200), ("python", 12, 1200)]
+
+
+def test_unparsable_total_results_are_left_empty():
+    row, = response_rows(GoogleSearchResponse.model_validate(page(1, 1, total="about 10")))
+    assert row["total_results"] is None
+
+
+def test_ndjson_writes_in_bounded_chunks():
+    target = CountingFile()
+    writer = NDJSONWriter(target, buffer_bytes=1000)
+    for start in range(1, 41, 10):
+        writer.write(GoogleSearchResponse.model_validate(page(start, 10)))
+        assert writer._buffered < 1000
+
+    # Lines reach the file before close, several at a time.
+    assert 2 < target.writes < 20
+    writer.close()
+
+    written = rows(target.getvalue())
+    assert writer.rows_written == len(written) == 40
+    assert [row["rank"] for row in written] == list(range(1, 41))
+    assert "pagemap" not in written[0]
+    assert not target.closed
+
+
+def test_failed_batch_entries_are_skipped():
+    target = io.StringIO()
+    with NDJSONWriter(target) as writer:
+        writer.write_all([
+            BatchResult(0, "python", response=GoogleSearchResponse.model_validate(page(1, 2))),
+            BatchResult(1, "golang", error=RuntimeError("boom")),
+        ])
+
+    assert writer.errors_skipped == 1
+    assert writer.rows_written == 2
+
+
+def test_tee_passes_items_through():
+    target = io.StringIO()
+    pages = [GoogleSearchResponse.model_validate(page(start, 10)) for start in (1, 11)]
+    with NDJSONWriter(target) as writer:
+        assert list(writer.tee(iter(pages))) == pages
+    assert len(rows(target.getvalue())) == 20
+
+
+def test_single_results_take_the_callers_rank():
+    response = GoogleSearchResponse.model_validate(page(1, 3))
+    target = io.StringIO()
+    with NDJSONWriter(target) as writer:
+        writer.write_all(iter(response.items), query="python")
+        writer.write_all([WebSearchResult(title="Web", link="https://example.com/web")], query="web", first_rank=7)
+
+    written = rows(target.getvalue())
+    assert [(row["query"], row["rank"], row["link"]) for row in written] == [
+        ("python", 1, "https://example.com/1"),
+        ("python", 2, "https://example.com/2"),
+        ("python", 3, "https://example.com/3"),
+        ("web", 7, "https://example.com/web"),
+    ]
+    assert written[0]["search_type"] == "web" and written[0]["total_results"] is None
+
+
+def test_parquet_flushes_row_groups(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    path = str(tmp_path / "results.parquet")
+    with ParquetWriter(path, row_group_size=4, include_pagemap=True) as writer:
+        writer.write(GoogleSearchResponse.model_validate(page(1, 10)))
+        # Two full row groups are written; only the last two rows are held.
+        assert writer._pending == 2
+        writer.write(BatchResult(1, "golang", error=RuntimeError("boom")))
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.metadata.num_rows == 10
+    table = parquet.read()
+    assert table.column("rank").to_pylist() == list(range(1, 11))
+    assert table.column("total_results").to_pylist() == [1200] * 10
+    assert writer.errors_skipped == 1
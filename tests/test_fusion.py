@@ -0,0 +1,95 @@
+import json
+import random
+import threading
+
+from google_cse import FusionConfig, FusionRanking, FusionSource, GoogleCSE, RankFusion, WebSearchParameters
+from google_cse.results import WebSearchResult
+from google_cse.transport import Transport, TransportResponse
+
+
+class RankingTransport(Transport):
+    """Serves fixed rankings, one per query, in pages."""
+
+    def __init__(self, rankings):
+        self.rankings = rankings
+        self.starts = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params):
+        links = self.rankings[params["q"]]
+        start, num = int(params.get("start", 1)), int(params["num"])
+        with self._lock:
+            self.starts.append((params["q"], start))
+        page = links[start - 1:start - 1 + num]
+        request = {"startIndex": start, "count": len(page), "totalResults": str(len(links))}
+        queries = {"request": [request]}
+        if start - 1 + num < len(links):
+            queries["nextPage"] = [dict(request, startIndex=start + num)]
+        body = {
+            "queries": queries,
+            "searchInformation": {"totalResults": str(len(links))},
+            "items": [{"link": link, "title": link} for link in page],
+        }
+        return TransportResponse(200, {}, json.dumps(body).encode(), url)
+
+
+def result(link):
+    return WebSearchResult(title=link, link=link)
+
+
+def test_promoted_result_keeps_ranks_from_earlier_sources():
+    ranking = FusionRanking([1.0, 1.0], FusionConfig(top_k=1))
+    ranking.add(0, 1, result("https://a.example/"))
+    ranking.add(0, 2, result("https://b.example/"))
+    # b enters the top-1 on its second source.
+    ranking.add(1, 1, result("https://b.example/"))
+
+    [top] = ranking.top()
+    assert top.result.link == "https://b.example/"
+    assert top.ranks == {0: 2, 1: 1}
+
+
+def brute_force(rankings, queries, config):
+    full = FusionRanking([1.0] * len(queries), config.model_copy(update={"top_k": 10 ** 6}))
+    for source, query in enumerate(queries):
+        for rank, link in enumerate(rankings[query], 1):
+            full.add(source, rank, result(link))
+    return full.top()[:config.top_k]
+
+
+def test_merge_matches_full_fusion_and_stops_early():
+    rng = random.Random(1)
+    pool = [f"https://site.example/{i}" for i in range(300)]
+    rankings = {
+        query: sorted(pool, key=lambda link: int(link.rsplit("/", 1)[1]) + rng.gauss(0, 40))[:100]
+        for query in "abcd"
+    }
+    transport = RankingTransport(rankings)
+    client = GoogleCSE(api_key="k", search_engine_id="cx", transport=transport)
+    config = FusionConfig(top_k=10, method="linear", exact_order=True)
+
+    outcome = RankFusion(client, config).merge(list("abcd"))
+    expected = brute_force(rankings, list("abcd"), config)
+
+    assert outcome.settled
+    assert [fused.result.link for fused in outcome.results] == [fused.result.link for fused in expected]
+
+    membership = RankFusion(client, FusionConfig(top_k=10, method="linear", lookahead=0))
+    transport.starts.clear()
+    outcome = membership.merge(list("abcd"))
+    assert {fused.result.link for fused in outcome.results} == {fused.result.link for fused in expected}
+    assert len(transport.starts) == outcome.pages_fetched < 40
+
+
+def test_merge_pages_from_parameters_start():
+    rankings = {"q": [f"https://site.example/{i}" for i in range(1, 101)]}
+    transport = RankingTransport(rankings)
+    client = GoogleCSE(api_key="k", search_engine_id="cx", transport=transport)
+
+    source = FusionSource("q", parameters=WebSearchParameters(start=71))
+    outcome = RankFusion(client, FusionConfig(top_k=3, max_results=90)).merge([source])
+
+    # Results 71-73 of a single source settle the top-3 on the first page.
+    assert transport.starts[0] == ("q", 71)
+    assert all(71 <= start <= 90 for _, start in transport.starts)
+    assert [fused.ranks for fused in outcome.results] == [{0: 71}, {0: 72}, {0: 73}]
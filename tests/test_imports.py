@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+import google_cse
+
+
+def loaded_after(statement):
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True,
+                            env={"PYTHONPATH": ":".join(sys.path)}).stdout
+    return set(output.split())
+
+
+def test_every_export_resolves():
+    assert sorted(google_cse.__all__) == sorted(google_cse._EXPORTS)
+    for name in google_cse.__all__:
+        assert getattr(google_cse, name) is not None
+
+
+def test_package_import_loads_no_dependencies():
+    loaded = loaded_after("import google_cse")
+    assert not {"requests", "pydantic", "asyncio"} & loaded
+
+
+def test_sync_client_does_not_load_asyncio():
+    assert "asyncio" not in loaded_after("from google_cse import GoogleCSE")
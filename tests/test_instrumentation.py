@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from google_cse import Credential, GoogleCSE, Instrument, MemoryCache, PrometheusInstrument, RetryPolicy
+from google_cse.transport import Transport, TransportResponse
+
+BODY = json.dumps({"items": [{"link": "https://a.example/"}]}).encode()
+
+
+class FlakyTransport(Transport):
+    """Answers with the given statuses in turn, then 200."""
+
+    def __init__(self, statuses=()):
+        self.statuses = list(statuses)
+
+    def get(self, url, params):
+        if self.statuses:
+            return TransportResponse(self.statuses.pop(0), {}, b"{}", url, elapsed=0.01)
+        return TransportResponse(200, {}, BODY, url, elapsed=0.01)
+
+
+class Recorder(Instrument):
+    def __init__(self):
+        self.searches = []
+        self.attempts = []
+
+    def on_attempt(self, event, attempt):
+        self.attempts.append(attempt)
+
+    def on_search(self, event):
+        self.searches.append(event)
+
+
+def client(transport, *instruments, **kwargs):
+    return GoogleCSE(
+        credentials=[Credential(api_key="secret-api-key-123456", search_engine_id="cx")],
+        transport=transport,
+        retry_policy=RetryPolicy(backoff_base=0.001, backoff_max=0.01),
+        instruments=list(instruments),
+        **kwargs
+    )
+
+
+def test_search_event_records_attempts_and_timings():
+    recorder = Recorder()
+    client(FlakyTransport([503]), recorder).raw_search("python", start_index=11, num_results=5)
+
+    event, = recorder.searches
+    assert (event.query, event.search_type, event.start_index, event.num_results) == ("python", None, 11, 5)
+    assert event.outcome == "ok" and event.error is None
+    assert event.retries == 1
+    assert [attempt.status_code for attempt in event.attempts] == [503, 200]
+    assert recorder.attempts == event.attempts
+    assert event.status_code == 200
+    assert event.response_bytes == len(BODY)
+    assert event.attempts[-1].response_bytes == len(BODY)
+    assert event.attempts[-1].elapsed == 0.01
+    assert event.duration >= event.build_params + event.parse > 0
+    assert event.cache_hit is None
+
+
+def test_cache_hits_are_reported_without_attempts():
+    recorder = Recorder()
+    searcher = client(FlakyTransport(), recorder, cache=MemoryCache())
+    searcher.raw_search("python")
+    searcher.raw_search("python")
+
+    miss, hit = recorder.searches
+    assert (miss.cache_hit, miss.outcome, len(miss.attempts)) == (False, "ok", 1)
+    assert (hit.cache_hit, hit.outcome, hit.attempts) == (True, "cache_hit", [])
+
+
+def test_errors_are_reported():
+    recorder = Recorder()
+    with pytest.raises(Exception):
+        client(FlakyTransport([400]), recorder).raw_search("python")
+
+    event, = recorder.searches
+    assert event.outcome == "error" and event.status_code == 400
+
+
+def test_credential_label_does_not_leak_the_key():
+    recorder = Recorder()
+    client(FlakyTransport(), recorder).raw_search("python")
+
+    label = recorder.searches[0].credential
+    assert label.startswith("key-")
+    assert not any(part in label for part in ("123456", "secret", "3456"))
+    assert Credential(api_key="k", search_engine_id="cx", name="backup").label == "backup"
+
+
+def test_prometheus_exporter():
+    prometheus = pytest.importorskip("prometheus_client")
+    registry = prometheus.CollectorRegistry()
+    searcher = client(FlakyTransport([503]), PrometheusInstrument(registry=registry), cache=MemoryCache())
+    searcher.raw_search("python")
+    searcher.raw_search("python")
+
+    label = searcher.credentials.credentials[0].label
+    sample = registry.get_sample_value
+    assert sample("google_cse_searches_total", {"search_type": "web", "outcome": "ok"}) == 1
+    assert sample("google_cse_searches_total", {"search_type": "web", "outcome": "cache_hit"}) == 1
+    assert sample("google_cse_http_requests_total", {"status": "503", "credential": label}) == 1
+    assert sample("google_cse_http_requests_total", {"status": "200", "credential": label}) == 1
+    assert sample("google_cse_response_bytes_count", {}) == 2
+    assert sample("google_cse_phase_duration_seconds_count", {"phase": "cache_lookup"}) == 2
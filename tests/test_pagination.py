@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from google_cse import AsyncGoogleCSE, GoogleCSE, WebSearchParameters
+from google_cse.pagination import plan_pages
+from google_cse.testing import FakeSearchServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeSearchServer() as server:
+        yield server
+
+
+def starts(pages):
+    return [page.queries.request[0].start_index for page in pages]
+
+
+def test_plan_pages_from_start_index():
+    assert plan_pages(25, start_index=51) == [(51, 10), (61, 10), (71, 5)]
+    assert plan_pages(100, start_index=95) == [(95, 6)]
+
+
+def test_iter_pages_starts_at_parameters_start(server):
+    client = GoogleCSE(api_key="k", search_engine_id="cx", base_url=server.url)
+    pages = list(client.iter_pages("python", 30, parameters=WebSearchParameters(start=51)))
+    assert starts(pages) == [51, 61, 71]
+
+    links = [item.link for page in pages for item in page.items]
+    assert len(links) == len(set(links)) == 30
+
+
+def test_iter_pages_stops_at_result_100(server):
+    client = GoogleCSE(api_key="k", search_engine_id="cx", base_url=server.url)
+    pages = list(client.iter_pages("python", 30, parameters=WebSearchParameters(start=91)))
+    assert starts(pages) == [91]
+
+
+def test_raw_search_validates_effective_start(server):
+    client = GoogleCSE(api_key="k", search_engine_id="cx", base_url=server.url)
+    with pytest.raises(ValueError):
+        client.raw_search("python", num_results=10, parameters=WebSearchParameters(start=95))
+    with pytest.raises(ValueError):
+        list(client.iter_pages("python", parameters=WebSearchParameters(start=101)))
+
+
+def test_async_iter_pages_starts_at_parameters_start(server):
+    pytest.importorskip("httpx")
+
+    async def collect():
+        async with AsyncGoogleCSE(api_key="k", search_engine_id="cx", base_url=server.url) as client:
+            return [page async for page in client.iter_pages("python", 25, parameters=WebSearchParameters(start=51))]
+
+    assert starts(asyncio.run(collect())) == [51, 61, 71]
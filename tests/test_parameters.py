@@ -0,0 +1,75 @@
+import pytest
+
+from google_cse import CompiledParameters, GoogleCSE, ImageSearchParameters, WebSearchParameters
+from google_cse.parameters import API_DEFAULTS, API_FIELDS
+
+
+def legacy_build_params(query, num_results, search_type, parameters, start_index=1):
+    """The request parameters as built before parameters were compiled."""
+    params = {"key": "k", "cx": "cx", "q": query, "num": num_results}
+    if start_index != 1:
+        params["start"] = start_index
+    if search_type:
+        params["searchType"] = search_type
+    if parameters:
+        for field_name, api_name in API_FIELDS.items():
+            value = getattr(parameters, field_name, None)
+            if value is not None:
+                params[api_name] = value
+    return params
+
+
+CASES = [
+    (None, None, 1),
+    (WebSearchParameters(), None, 1),
+    (WebSearchParameters(safe="active", date_restrict="m3", site_search="python.org", site_search_filter="i"), None, 11),
+    (WebSearchParameters(filter="0", c2coff="1", language="en", exact_terms="asyncio"), None, 21),
+    (ImageSearchParameters(img_size="large", img_type="photo", img_color_type="color", rights="cc_publicdomain"), "image", 1),
+]
+
+
+def test_compiled_parameters_hash_and_compare_by_items():
+    first = WebSearchParameters(safe="active", language="en").compile()
+    second = WebSearchParameters(language="en", safe="active").compile()
+    other = WebSearchParameters(safe="active", language="de").compile()
+
+    assert first == second and hash(first) == hash(second)
+    assert first.digest == second.digest and first.encoded == "hl=en&safe=active"
+    assert first != other and first.digest != other.digest
+    assert {first: "cached"}[second] == "cached"
+    assert CompiledParameters.from_items(first.items) == first
+
+
+def test_defaults_compile_to_nothing():
+    assert WebSearchParameters(safe="off", filter="1", c2coff="0").compile() == CompiledParameters.from_items(())
+
+
+def test_compile_is_memoized_and_invalidated():
+    parameters = WebSearchParameters(language="en")
+    compiled = parameters.compile()
+    assert parameters.compile() is compiled
+
+    parameters.language = "de"
+    assert parameters.compile().items == (("hl", "de"),)
+
+    copied = parameters.model_copy(update={"language": "fr"})
+    assert copied.compile().items == (("hl", "fr"),)
+    assert parameters.compile().items == (("hl", "de"),)
+
+
+def test_equality_ignores_the_memo():
+    parameters = WebSearchParameters(language="en")
+    parameters.compile()
+    assert parameters == WebSearchParameters(language="en")
+    assert parameters != ImageSearchParameters(language="en")
+
+
+@pytest.mark.parametrize("parameters, search_type, start_index", CASES)
+def test_build_params_matches_the_old_builder(parameters, search_type, start_index):
+    client = GoogleCSE(api_key="k", search_engine_id="cx")
+    params = client._build_params("python", 10, search_type, parameters, start_index)
+
+    # Only values equal to the API defaults are left out now.
+    legacy = legacy_build_params("python", 10, search_type, parameters, start_index)
+    expected = {name: value for name, value in legacy.items() if API_DEFAULTS.get(name) != value}
+    assert params == expected
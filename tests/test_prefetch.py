@@ -0,0 +1,153 @@
+import os
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from google_cse import AssetStore, ImagePrefetcher, ImageSearchResult, PrefetchConfig
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 200
+
+
+class ImageServer:
+    """Local server with image routes that exercise the prefetcher."""
+
+    def __init__(self):
+        self.hits = Counter()
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.hits[self.path] += 1
+                route = self.path.split("/")[1]
+                if route == "slow":
+                    with server._lock:
+                        server.active += 1
+                        server.max_active = max(server.max_active, server.active)
+                    time.sleep(0.05)
+                    with server._lock:
+                        server.active -= 1
+                if route in ("img", "slow", "copy"):
+                    self.send_response(200)
+                    self.send_header("Content-Type", "image/png")
+                    self.send_header("Content-Length", str(len(PNG)))
+                    self.end_headers()
+                    self.wfile.write(PNG)
+                elif route == "declared":
+                    # Announces a large body that is never needed.
+                    self.send_response(200)
+                    self.send_header("Content-Length", "5000")
+                    self.end_headers()
+                elif route == "streamed":
+                    # No Content-Length: the body runs until the connection closes.
+                    self.send_response(200)
+                    self.end_headers()
+                    self.wfile.write(b"x" * 5000)
+                else:
+                    self.send_error(404)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    with ImageServer() as server:
+        yield server
+
+
+def image(url, **kwargs):
+    return ImageSearchResult(link=url, **kwargs)
+
+
+def prefetcher(root, **config):
+    config = PrefetchConfig(**{"thumbnails": False, "max_bytes": 1000, **config})
+    return ImagePrefetcher(AssetStore(str(root)), config)
+
+
+def part_files(root):
+    return [name for _, _, names in os.walk(root) for name in names if name.endswith(".part")]
+
+
+def test_downloads_are_stored_by_content(server, tmp_path):
+    with prefetcher(tmp_path) as fetcher:
+        first, second = fetcher.prefetch([image(f"{server.url}/img/1"), image(f"{server.url}/copy/1")], ordered=True)
+
+    assert first.ok and second.ok
+    assert first.image_path == second.image_path
+    assert first.image_path.endswith(".png")
+    with open(first.image_path, "rb") as f:
+        assert f.read() == PNG
+    assert fetcher.stats.downloaded == 2 and fetcher.stats.bytes == 2 * len(PNG)
+
+
+def test_repeat_urls_are_fetched_once(server, tmp_path):
+    url = f"{server.url}/img/1"
+    with prefetcher(tmp_path) as fetcher:
+        outcomes = list(fetcher.prefetch([image(url)] * 5))
+    assert all(outcome.image_path == outcomes[0].image_path for outcome in outcomes)
+    assert server.hits["/img/1"] == 1
+    assert fetcher.stats.downloaded == 1 and fetcher.stats.cached == 4
+
+    # The URL index survives a restart.
+    with prefetcher(tmp_path) as fetcher:
+        outcome, = fetcher.prefetch([image(url)])
+    assert outcome.image_path == outcomes[0].image_path
+    assert server.hits["/img/1"] == 1
+    assert fetcher.stats.cached == 1
+
+
+def test_per_host_limit(server, tmp_path):
+    results = [image(f"{server.url}/slow/{n}") for n in range(8)]
+    with prefetcher(tmp_path, max_workers=8, per_host=2) as fetcher:
+        assert all(outcome.ok for outcome in fetcher.prefetch(results))
+    assert server.max_active == 2
+
+
+def test_declared_image_byte_size_is_skipped_without_a_request(server, tmp_path):
+    with prefetcher(tmp_path) as fetcher:
+        outcome, = fetcher.prefetch([image(f"{server.url}/img/1", image_byte_size=5000)])
+    assert "image" in outcome.errors and outcome.image_path is None
+    assert server.hits["/img/1"] == 0
+    assert fetcher.stats.skipped == 1
+
+
+def test_content_length_over_the_cap_is_skipped(server, tmp_path):
+    with prefetcher(tmp_path) as fetcher:
+        outcome, = fetcher.prefetch([image(f"{server.url}/declared/1")])
+    assert "5000 bytes" in outcome.errors["image"]
+    assert fetcher.stats.skipped == 1 and fetcher.stats.downloaded == 0
+
+
+def test_streamed_overflow_is_cut_off_and_cleaned_up(server, tmp_path):
+    with prefetcher(tmp_path) as fetcher:
+        outcome, = fetcher.prefetch([image(f"{server.url}/streamed/1")])
+    assert "over max_bytes" in outcome.errors["image"]
+    assert fetcher.stats.skipped == 1
+    assert part_files(tmp_path) == []
+    assert f"{server.url}/streamed/1" not in fetcher.store
+
+
+def test_failures_are_reported_per_result(server, tmp_path):
+    with prefetcher(tmp_path, thumbnails=True) as fetcher:
+        outcome, = fetcher.prefetch([image(f"{server.url}/img/1", thumbnail_link=f"{server.url}/missing")])
+    assert outcome.image_path is not None and outcome.thumbnail_path is None
+    assert "thumbnail" in outcome.errors
+    assert fetcher.stats.to_dict()["failed"] == 1
+    assert fetcher.stats.to_dict()["downloaded"] == 1
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from google_cse import GoogleCSE, GoogleSearchResponse, LazySearchResponse, Projection
+from google_cse.transport import Transport, TransportResponse
+
+ITEM = {
+    "title": "Python",
+    "link": "https://python.org/",
+    "snippet": "The official home",
+    "displayLink": "python.org",
+    "htmlSnippet": "The <b>official</b> home",
+    "pagemap": {
+        "metatags": [{"og:image": "https://python.org/logo.png", "og:title": "Python"}],
+        "cse_thumbnail": [{"src": "https://thumb.example/1", "width": "100"}],
+        "hcard": [{"fn": "PSF"}],
+    },
+}
+BODY = json.dumps({"kind": "customsearch#search", "items": [ITEM]}).encode()
+
+
+class RecordingTransport(Transport):
+    def __init__(self):
+        self.params = []
+
+    def get(self, url, params):
+        self.params.append(params)
+        return TransportResponse(200, {}, BODY, url)
+
+
+def test_fields_are_pruned():
+    projection = Projection(["link", "display_link"])
+    assert projection.project_item(ITEM) == {"link": "https://python.org/", "displayLink": "python.org"}
+    assert projection.api_fields.endswith(",items(link,displayLink)")
+
+
+def test_pagemap_paths_filter_entries():
+    projection = Projection(["link"], pagemap=["metatags/og:image", "cse_thumbnail"])
+    projected = projection.project_item(ITEM)
+
+    assert projected["pagemap"] == {
+        "metatags": [{"og:image": "https://python.org/logo.png"}],
+        "cse_thumbnail": [{"src": "https://thumb.example/1", "width": "100"}],
+    }
+    assert projection.values(projected) == {
+        "metatags/og:image": "https://python.org/logo.png",
+        "cse_thumbnail": [{"src": "https://thumb.example/1", "width": "100"}],
+    }
+    assert projection.api_fields.endswith(",items(link,pagemap(metatags,cse_thumbnail))")
+
+
+def test_invalid_paths_and_fields_are_rejected():
+    with pytest.raises(ValueError):
+        Projection(["link"], pagemap=["metatags/og/image"])
+    with pytest.raises(ValueError):
+        Projection(["no_such_field"])
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_raw_search_sends_and_applies_the_projection(lazy):
+    transport = RecordingTransport()
+    client = GoogleCSE(api_key="k", search_engine_id="cx", transport=transport, lazy_parsing=lazy)
+    projection = Projection(["link", "title"], pagemap=["metatags/og:image"])
+
+    response = client.raw_search("python", projection=projection)
+
+    assert transport.params[0]["fields"] == projection.api_fields
+    assert isinstance(response, LazySearchResponse if lazy else GoogleSearchResponse)
+    item = response.items[0]
+    assert item.link == "https://python.org/" and item.snippet is None
+    assert item.pagemap == {"metatags": [{"og:image": "https://python.org/logo.png"}]}
+
+
+def test_web_search_keeps_the_projected_pagemap():
+    client = GoogleCSE(api_key="k", search_engine_id="cx", transport=RecordingTransport())
+
+    by_path = client.web_search("python", projection=Projection(["link"], pagemap=["hcard"]))
+    by_field = client.web_search("python", projection=Projection(["link", "pagemap"]))
+    without = client.web_search("python", projection=Projection(["link"]))
+
+    assert by_path[0].pagemap == {"hcard": [{"fn": "PSF"}]}
+    assert by_field[0].pagemap == ITEM["pagemap"]
+    assert without[0].pagemap is None
+
+
+def test_partial_response_can_be_disabled():
+    transport = RecordingTransport()
+    client = GoogleCSE(api_key="k", search_engine_id="cx", transport=transport)
+    client.raw_search("python", projection=Projection(["link"], partial_response=False))
+    assert "fields" not in transport.params[0]
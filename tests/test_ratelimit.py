@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from google_cse import AsyncGoogleCSE, GoogleCSE, RateLimiter, RateLimitExceeded
+from google_cse.transport import Transport, TransportResponse
+
+
+class CountingTransport(Transport):
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, params):
+        self.calls += 1
+        return TransportResponse(200, {}, b'{"items": []}', url)
+
+
+def test_non_blocking_limiter_refuses_past_capacity():
+    limiter = RateLimiter(qpm=2, blocking=False)
+    assert limiter.acquire()
+    assert limiter.acquire()
+    assert not limiter.acquire()
+    assert limiter.try_acquire() > 0
+
+
+def test_state_file_shares_one_budget(tmp_path):
+    path = str(tmp_path / "limits.db")
+    first = RateLimiter(qpm=2, blocking=False, state_path=path)
+    second = RateLimiter(qpm=2, blocking=False, state_path=path)
+
+    assert first.acquire()
+    assert second.acquire()
+    assert not first.acquire()
+    assert not second.acquire()
+
+
+def test_client_raises_when_the_limiter_refuses():
+    transport = CountingTransport()
+    limiter = RateLimiter(qpm=1, blocking=False)
+    client = GoogleCSE(api_key="k", search_engine_id="cx", transport=transport, rate_limiter=limiter)
+    client.raw_search("python")
+    with pytest.raises(RateLimitExceeded) as refused:
+        client.raw_search("golang")
+    assert transport.calls == 1
+    assert 0 < refused.value.retry_after <= 60
+
+
+def test_async_client_reports_the_wait():
+    pytest.importorskip("httpx")
+
+    async def search():
+        limiter = RateLimiter(qps=1, blocking=False)
+        limiter.acquire()
+        async with AsyncGoogleCSE(api_key="k", search_engine_id="cx", rate_limiter=limiter) as client:
+            await client.raw_search("python")
+
+    with pytest.raises(RateLimitExceeded) as refused:
+        asyncio.run(search())
+    assert 0 < refused.value.retry_after <= 1
@@ -0,0 +1,74 @@
+import json
+
+from google_cse import GoogleCSE, GoogleSearchResponse, LazySearchResponse, WebSearchResult
+from google_cse.transport import Transport, TransportResponse
+
+BODY = json.dumps({
+    "kind": "customsearch#search",
+    "queries": {
+        "request": [{"totalResults": "1200", "searchTerms": "python", "count": 2, "startIndex": 1}],
+        "nextPage": [{"startIndex": 3}],
+    },
+    "searchInformation": {"searchTime": 0.21, "totalResults": "1200"},
+    "spelling": {"correctedQuery": "python"},
+    "items": [
+        {
+            "title": "Python",
+            "htmlTitle": "<b>Python</b>",
+            "link": "https://python.org/",
+            "displayLink": "python.org",
+            "snippet": "The official home",
+            "pagemap": {"metatags": [{"og:title": "Python"}]},
+        },
+        {"title": "Docs", "link": "https://docs.python.org/"},
+    ],
+}).encode()
+
+
+class StaticTransport(Transport):
+    def get(self, url, params):
+        return TransportResponse(200, {}, BODY, url)
+
+
+def test_lazy_fields_match_eager_parsing():
+    lazy = LazySearchResponse.from_json(BODY)
+    eager = GoogleSearchResponse.from_json(BODY)
+
+    assert lazy.kind == "customsearch#search"
+    assert lazy.search_information == eager.search_information
+    assert lazy.spelling.corrected_query == "python"
+    assert lazy.url is None and lazy.promotions is None
+
+
+def test_lazy_nested_queries_and_items():
+    lazy = LazySearchResponse.from_json(BODY)
+
+    assert lazy.queries.request[0].total_results == "1200"
+    assert lazy.queries.next_page[0].start_index == 3
+    assert [item.link for item in lazy.items] == ["https://python.org/", "https://docs.python.org/"]
+    assert lazy.items[0].html_title == "<b>Python</b>"
+    # Fields are validated once and then reused.
+    assert lazy.items is lazy.items
+
+
+def test_lazy_to_model_equals_eager_parsing():
+    assert LazySearchResponse.from_json(BODY).to_model() == GoogleSearchResponse.from_json(BODY)
+
+
+def test_lazy_web_results_match_eager_conversion():
+    lazy = LazySearchResponse.from_json(BODY)
+    eager = GoogleSearchResponse.from_json(BODY)
+
+    for include_pagemap in (False, True):
+        expected = [WebSearchResult.from_result(item, include_pagemap) for item in eager.items]
+        assert lazy.web_results(include_pagemap) == expected
+
+
+def test_client_returns_lazy_views():
+    client = GoogleCSE(api_key="k", search_engine_id="cx", transport=StaticTransport(), lazy_parsing=True)
+
+    response = client.raw_search("python")
+    assert isinstance(response, LazySearchResponse)
+    assert response.to_model() == GoogleSearchResponse.from_json(BODY)
+    assert [result.link for result in client.web_search("python")] == \
+        ["https://python.org/", "https://docs.python.org/"]
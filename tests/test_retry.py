@@ -0,0 +1,59 @@
+import requests
+import pytest
+
+from google_cse import GoogleCSE, RetryPolicy
+from google_cse.transport import Transport, TransportResponse
+
+
+class FlakyTransport(Transport):
+    """Answers with the given statuses in turn, then 200."""
+
+    def __init__(self, statuses, headers=None):
+        self.statuses = list(statuses)
+        self.headers = headers or {}
+        self.calls = 0
+
+    def get(self, url, params):
+        self.calls += 1
+        if self.statuses:
+            return TransportResponse(self.statuses.pop(0), self.headers, b"{}", url)
+        return TransportResponse(200, {}, b'{"items": [{"link": "https://a.example/"}]}', url)
+
+
+def client(transport, **policy):
+    policy = RetryPolicy(backoff_base=0.001, backoff_max=0.01, **policy)
+    return GoogleCSE(api_key="k", search_engine_id="cx", transport=transport, retry_policy=policy)
+
+
+def test_transient_errors_are_retried():
+    transport = FlakyTransport([503, 500])
+    response = client(transport, max_attempts=3).raw_search("python")
+    assert transport.calls == 3
+    assert response.items[0].link == "https://a.example/"
+
+
+def test_gives_up_after_max_attempts():
+    transport = FlakyTransport([503] * 5)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client(transport, max_attempts=2).raw_search("python")
+    assert transport.calls == 2
+
+
+def test_client_errors_are_not_retried():
+    transport = FlakyTransport([400])
+    with pytest.raises(requests.exceptions.HTTPError):
+        client(transport, max_attempts=3).raw_search("python")
+    assert transport.calls == 1
+
+
+def test_short_retry_after_is_honored():
+    transport = FlakyTransport([429], headers={"Retry-After": "0"})
+    client(transport, max_attempts=2).raw_search("python")
+    assert transport.calls == 2
+
+
+def test_retry_after_past_backoff_max_gives_up():
+    transport = FlakyTransport([429], headers={"Retry-After": "3600"})
+    with pytest.raises(requests.exceptions.HTTPError):
+        client(transport, max_attempts=3).raw_search("python")
+    assert transport.calls == 1
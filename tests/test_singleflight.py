@@ -0,0 +1,83 @@
+import asyncio
+import threading
+
+import pytest
+
+from google_cse import GoogleCSE
+from google_cse.singleflight import AsyncSingleFlight, SingleFlight
+from google_cse.transport import Transport, TransportResponse
+
+
+def test_concurrent_calls_share_one_execution():
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return "result"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flights.do("k", fn))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    while flights.shared < 4:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == ["result"] * 5
+
+
+def test_errors_reach_every_caller_and_are_not_cached():
+    flights = SingleFlight()
+    with pytest.raises(ValueError):
+        flights.do("k", lambda: (_ for _ in ()).throw(ValueError("boom")))
+    assert flights.do("k", lambda: "fresh") == "fresh"
+
+
+def test_async_calls_share_one_task():
+    flights = AsyncSingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def main():
+        return await asyncio.gather(*(flights.do("k", fn) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["result"] * 5
+    assert calls == [1]
+
+
+class GatedTransport(Transport):
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def get(self, url, params):
+        self.calls += 1
+        self.release.wait(5)
+        return TransportResponse(200, {}, b'{"items": [{"link": "https://a.example/"}]}', url)
+
+
+def test_client_coalesces_identical_searches():
+    transport = GatedTransport()
+    client = GoogleCSE(api_key="k", search_engine_id="cx", transport=transport, coalesce=True)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.raw_search("python"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    while client._flights.shared < 7:
+        threading.Event().wait(0.001)
+    transport.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert transport.calls == 1
+    assert [response.items[0].link for response in results] == ["https://a.example/"] * 8
@@ -0,0 +1,45 @@
+import os
+
+from google_cse import GoogleSearchResponse, ResultStore
+
+
+def response(query, links):
+    return GoogleSearchResponse.model_validate({
+        "queries": {"request": [{"searchTerms": query, "startIndex": 1}]},
+        "items": [{"link": link} for link in links],
+    })
+
+
+def test_reopen_after_torn_index_line(tmp_path):
+    path = str(tmp_path / "searches.cse")
+    with ResultStore(path) as store:
+        store.append(response("cats", ["https://a.example/1"]))
+        store.append(response("dogs", ["https://b.example/1", "https://b.example/2"]))
+
+    # Simulate a crash halfway through writing the last index entry.
+    with open(path + ".idx", "r+b") as f:
+        f.truncate(os.path.getsize(path + ".idx") - 5)
+
+    with ResultStore(path) as store:
+        assert len(store) == 2
+        assert [r.link for r in store.latest("dogs").items] == ["https://b.example/1", "https://b.example/2"]
+        store.append(response("birds", ["https://c.example/1"]))
+
+    with ResultStore(path) as store:
+        assert sorted(store.keys()) == ["birds", "cats", "dogs"]
+        assert len(store) == 3
+
+
+def test_reopen_when_index_misses_trailing_newline(tmp_path):
+    path = str(tmp_path / "searches.cse")
+    with ResultStore(path) as store:
+        store.append(response("cats", ["https://a.example/1"]))
+
+    with open(path + ".idx", "r+b") as f:
+        f.truncate(os.path.getsize(path + ".idx") - 1)
+
+    with ResultStore(path) as store:
+        store.append(response("dogs", ["https://b.example/1"]))
+
+    with ResultStore(path) as store:
+        assert sorted(store.keys()) == ["cats", "dogs"]
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+import requests
+
+from google_cse import GoogleCSE, RetryPolicy
+from google_cse.testing import FakeSearchServer
+from google_cse.transport import RecordingTransport, ReplayTransport, RequestsTransport
+
+
+def record(path, server, queries):
+    transport = RecordingTransport(RequestsTransport(), path)
+    with GoogleCSE(api_key="secret-key", search_engine_id="cx", base_url=server.url, transport=transport) as client:
+        responses = {}
+        for query in queries:
+            try:
+                responses[query] = client.raw_search(query)
+            except requests.exceptions.HTTPError as e:
+                responses[query] = e
+    transport.close()
+    return responses
+
+
+def test_recording_replays_the_same_responses(tmp_path):
+    path = str(tmp_path / "recording.jsonl")
+    with FakeSearchServer() as server:
+        recorded = record(path, server, ["python", "golang"])
+
+    with open(path, encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f]
+    assert len(entries) == 2
+    assert all("key" not in entry["params"] and "secret-key" not in json.dumps(entry) for entry in entries)
+
+    # Any API key matches; the recording does not depend on it.
+    client = GoogleCSE(api_key="other-key", search_engine_id="cx", transport=ReplayTransport(path))
+    for query, response in recorded.items():
+        assert client.raw_search(query) == response
+    with pytest.raises(requests.exceptions.RequestException):
+        client.raw_search("not recorded")
+
+
+def test_replayed_errors_keep_their_headers(tmp_path):
+    path = str(tmp_path / "recording.jsonl")
+    with FakeSearchServer(rate_limit_rate=1.0, retry_after=7) as server:
+        recorded = record(path, server, ["python"])
+    assert recorded["python"].response.status_code == 429
+
+    client = GoogleCSE(api_key="k", search_engine_id="cx", transport=ReplayTransport(path))
+    with pytest.raises(requests.exceptions.HTTPError) as replayed:
+        client.raw_search("python")
+    assert replayed.value.response.status_code == 429
+    assert replayed.value.response.headers["Retry-After"] == "7"
+
+
+def test_fake_server_fixtures_keep_recorded_headers(tmp_path):
+    path = str(tmp_path / "recording.jsonl")
+    with FakeSearchServer(rate_limit_rate=1.0, retry_after=7) as server:
+        record(path, server, ["python"])
+
+    with FakeSearchServer(fixtures=path) as server:
+        response = requests.get(server.url, params={"q": "python", "cx": "cx", "num": 10, "key": "k"})
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "7"
+        assert response.headers["Content-Length"] == str(len(response.content))
+
+        # A retry policy sees the replayed Retry-After (and gives up, as it
+        # exceeds backoff_max).
+        client = GoogleCSE(
+            api_key="k", search_engine_id="cx", base_url=server.url,
+            retry_policy=RetryPolicy(backoff_max=1.0, max_attempts=3)
+        )
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.raw_search("python")
+        assert server.status_counts[429] == 2
@@ -0,0 +1,49 @@
+import pytest
+import requests
+
+from google_cse import GoogleCSE, TransportConfig
+from google_cse.testing import FakeSearchServer, constant_latency
+from google_cse.transport import RequestsTransport, _httpx_client_kwargs
+
+CONFIG = TransportConfig(
+    pool_connections=3,
+    pool_maxsize=7,
+    pool_block=True,
+    connect_timeout=1.5,
+    read_timeout=4.0,
+    keep_alive=False,
+)
+
+
+def test_requests_transport_applies_the_config():
+    with RequestsTransport(CONFIG) as transport:
+        adapter = transport.session.get_adapter("https://www.googleapis.com/")
+        assert adapter is transport.session.get_adapter("http://localhost/")
+        assert (adapter._pool_connections, adapter._pool_maxsize, adapter._pool_block) == (3, 7, True)
+        assert adapter.poolmanager.connection_pool_kw == {"maxsize": 7, "block": True}
+        assert transport._timeout == (1.5, 4.0)
+        assert transport.session.headers["Connection"] == "close"
+
+
+def test_client_builds_its_transport_from_the_config():
+    with GoogleCSE(api_key="k", search_engine_id="cx", transport_config=CONFIG) as client:
+        assert isinstance(client.transport, RequestsTransport)
+        assert client.transport.config is CONFIG
+
+
+def test_read_timeout_is_enforced():
+    config = TransportConfig(read_timeout=0.05)
+    with FakeSearchServer(latency=constant_latency(0.5)) as server:
+        client = GoogleCSE(api_key="k", search_engine_id="cx", base_url=server.url, transport_config=config)
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            client.raw_search("python")
+
+
+def test_httpx_arguments_follow_the_config():
+    httpx = pytest.importorskip("httpx")
+    kwargs = _httpx_client_kwargs(httpx, CONFIG)
+
+    assert kwargs["limits"].max_connections == 21
+    assert kwargs["limits"].max_keepalive_connections == 0
+    assert (kwargs["timeout"].connect, kwargs["timeout"].read) == (1.5, 4.0)
+    assert kwargs["http2"] is False
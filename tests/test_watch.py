@@ -0,0 +1,48 @@
+from google_cse import Watchlist, WatchPolicy
+from google_cse.results import Result
+
+
+class StubClient:
+    """Returns a different top result on every search of a query."""
+
+    def __init__(self):
+        self.calls = {}
+
+    def search_all(self, query, max_results, parameters=None):
+        n = self.calls[query] = self.calls.get(query, 0) + 1
+        return [Result(link=f"https://example.com/{query}/{n}/{rank}") for rank in range(max_results)]
+
+
+def test_run_pending_closed_early_keeps_every_query_scheduled():
+    now = [1000.0]
+    policy = WatchPolicy(min_interval=60, jitter=0, max_results=3, emit_initial=True)
+    watchlist = Watchlist(StubClient(), policy, clock=lambda: now[0])
+    for query in "abcd":
+        watchlist.add(query)
+
+    for _ in watchlist.run_pending(max_workers=1):
+        break
+
+    # Every query is either still due or rescheduled after its refresh.
+    scheduled = {key for _, _, key in watchlist._schedule}
+    assert scheduled >= {"a", "b", "c", "d"}
+    assert watchlist.next_due() is not None
+
+    now[0] += 3600
+    diffs = list(watchlist.run_pending(max_workers=1))
+    assert {diff.query for diff in diffs} == {"a", "b", "c", "d"}
+    assert all(watched.checks >= 1 for watched in watchlist)
+
+
+def test_failed_refresh_is_rescheduled():
+    class FailingClient(StubClient):
+        def search_all(self, query, max_results, parameters=None):
+            raise RuntimeError("boom")
+
+    now = [0.0]
+    watchlist = Watchlist(FailingClient(), WatchPolicy(min_interval=60, jitter=0), clock=lambda: now[0])
+    watched = watchlist.add("q")
+
+    assert list(watchlist.run_pending()) == []
+    assert watched.failures == 1
+    assert watchlist.next_due() == 60.0